@@ -0,0 +1,39 @@
+-- 🚀 BOOTSTRAP DA SESSÃO EM UMA ÚNICA REQUISIÇÃO
+--
+-- Retorna, em um único JSON, o perfil do usuário, o perfil profissional (se houver), o papel e os vínculos
+-- do papel resolvido. Usada por utils.load.context.bootstrap_session() via services.backend.call_rpc();
+-- o equivalente local está em services.fake_backend._rpc_bootstrap_session().
+--
+-- Aplicar no editor SQL do Supabase. Sem esta função (ou com ABAETE_BOOTSTRAP_RPC=false), o app recorre
+-- às buscas em paralelo.
+
+create or replace function public.bootstrap_session(p_user_id uuid)
+returns jsonb
+language sql
+stable
+security invoker
+set search_path = public
+as $$
+    with
+    pp as (
+        select * from professional_profile where auth_user_id = p_user_id limit 1
+    ),
+    r as (
+        select case when exists (select 1 from pp where professional_status is true)
+                    then 'professional' else 'patient' end as role
+    )
+    select jsonb_build_object(
+        'user_profile',         (select to_jsonb(up) from user_profile up where up.auth_user_id = p_user_id limit 1),
+        'professional_profile', (select to_jsonb(pp) from pp),
+        'role',                 (select role from r),
+        'links',                coalesce((
+                                    select jsonb_agg(to_jsonb(l))
+                                    from links l, r
+                                    where (r.role = 'professional' and l.professional_id = p_user_id)
+                                       or (r.role = 'patient'      and l.patient_id      = p_user_id)
+                                ), '[]'::jsonb)
+    );
+$$;
+
+-- Security invoker: as políticas de RLS das tabelas continuam valendo para o usuário autenticado.
+grant execute on function public.bootstrap_session(uuid) to authenticated;
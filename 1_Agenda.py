@@ -21,6 +21,7 @@ from utils.load.context             import load_session_context
 from components.headers             import render_abaete_header
 from components.auth_interface      import auth_interface_entrypoint
 from components.dashboard_interface import dashboard_interface_entrypoint
+from services.prefetch              import prefetch_next_pages
 
 
 # 🛤️ DEFINIÇÃO DE FLUXO DA PÁGINA ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
@@ -54,4 +55,9 @@ def page_1():
         load_session_context(auth_machine)           # ⬅ Carrega o contexto da sessão.
         dashboard_interface_entrypoint(auth_machine) # ⬅ Desenha a área de trabalho do usuário.
 
-page_1()
\ No newline at end of file
+    # Com a dashboard desenhada, antecipa em segundo plano os dados de metas e avaliações.
+    prefetch_next_pages(auth_machine, "1_Agenda.py")
+
+# Agrupa as transições de estado da execução em, no máximo, um rerun ao final.
+with StateMachine.batch("1_Agenda.py"):
+    page_1()
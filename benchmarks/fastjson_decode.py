@@ -0,0 +1,64 @@
+
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import sys
+import json
+import timeit
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import fastjson
+
+
+# ⚙️ PARÂMETROS DO CENÁRIO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+INSTRUMENTS = 40        # ⬅ Escalas no catálogo.
+ITEMS = 120             # ⬅ Itens por escala (instrumentos longos).
+OPTIONS = 5             # ⬅ Alternativas por item (Likert).
+REPEAT = 20             # ⬅ Repetições da medição.
+
+
+# 🧪 CATÁLOGO REALISTA NO FORMATO ARMAZENADO ─────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def make_catalog() -> list[str]:
+    """
+    <docstrings> Gera o campo `items` de cada escala como string JSON, no pior caso (lista aninhada também em string).
+    """
+    catalog = []
+    for s in range(INSTRUMENTS):
+        items = [
+            {
+                "id": i + 1,
+                "question": f"Item {i + 1} da escala {s}: com que frequência você se sentiu assim nas últimas duas semanas?",
+                "options": [{"label": f"Alternativa {o}", "value": o} for o in range(OPTIONS)],
+            }
+            for i in range(ITEMS)
+        ]
+        catalog.append(json.dumps({"items": json.dumps(items, ensure_ascii=False)}, ensure_ascii=False))
+    return catalog
+
+
+def parse_with(loads, raw: str) -> list:
+    """
+    <docstrings> Mesmo fluxo de parse_scale_items (até dois parsings), com o decodificador informado.
+    """
+    itens = loads(raw).get("items", [])
+    if isinstance(itens, str):
+        itens = loads(itens)
+    return itens
+
+
+# 🚀 EXECUÇÃO ────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    catalog = make_catalog()
+    size = sum(len(raw.encode("utf-8")) for raw in catalog)
+
+    stdlib = min(timeit.repeat(lambda: [parse_with(json.loads, raw) for raw in catalog], number=1, repeat=REPEAT))
+    fast = min(timeit.repeat(lambda: [parse_with(fastjson.loads, raw) for raw in catalog], number=1, repeat=REPEAT))
+
+    print(f"catálogo: {INSTRUMENTS} escalas × {ITEMS} itens ({size / 1024:.0f} KiB)")
+    print(f"json:     {stdlib * 1000:7.2f} ms")
+    print(f"{fastjson.BACKEND + ':':9} {fast * 1000:7.2f} ms  ({stdlib / fast:.1f}x)")
@@ -0,0 +1,81 @@
+
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import sys
+import uuid
+import tracemalloc
+
+from pathlib import Path
+from datetime import date, timedelta
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.models import Link, Goal, GoalProgress
+
+
+# ⚙️ PARÂMETROS DO CENÁRIO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+SESSIONS = 1000          # ⬅ Sessões simultâneas.
+GOALS_PER_SESSION = 6    # ⬅ Metas por paciente.
+DAYS_OF_PROGRESS = 90    # ⬅ Registros de progresso por meta.
+
+
+# 🧪 GERAÇÃO DE RESPOSTAS NO FORMATO DO POSTGREST ──────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def make_session_rows() -> dict[str, list[dict]]:
+    """
+    <docstrings> Gera as linhas que uma sessão de paciente mantém no session_state (vínculo, metas e progresso).
+    """
+    link_id = str(uuid.uuid4())
+    links = [{
+        "id": link_id, "professional_id": str(uuid.uuid4()), "patient_id": str(uuid.uuid4()),
+        "professional_name": "Dra. Ana", "patient_name": "Paciente", "status": "accepted",
+        "created_at": "2026-01-01T10:00:00+00:00",
+    }]
+    goals, progress = [], []
+    for g in range(GOALS_PER_SESSION):
+        goal_id = str(uuid.uuid4())
+        goals.append({
+            "id": goal_id, "link_id": link_id, "goal": f"Meta {g}", "timeframe": "Curto",
+            "effort_type": "Saúde & Bem-estar", "priority_level": 3, "created_at": "2026-01-01T10:00:00+00:00",
+        })
+        for d in range(DAYS_OF_PROGRESS):
+            progress.append({
+                "id": str(uuid.uuid4()), "goal_id": goal_id, "link_id": link_id,
+                "date": str(date(2026, 1, 1) + timedelta(days=d)), "completed": d % 2 == 0,
+                "duration_minutes": 30, "created_at": "2026-01-01T10:00:00+00:00",
+            })
+    return {"links": links, "goals": goals, "goal_progress": progress}
+
+
+def measure(decode: bool) -> int:
+    """
+    <docstrings> Mede a memória alocada (bytes) para manter SESSIONS sessões, como dicts ou como modelos.
+    """
+    tracemalloc.start()
+    sessions = []
+    for _ in range(SESSIONS):
+        rows = make_session_rows()
+        if decode:
+            rows = {
+                "links": Link.decode(rows["links"]),
+                "goals": Goal.decode(rows["goals"]),
+                "goal_progress": GoalProgress.decode(rows["goal_progress"]),
+            }
+        sessions.append(rows)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+# 🚀 EXECUÇÃO ────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    as_dicts = measure(decode=False)
+    as_models = measure(decode=True)
+    rows = SESSIONS * (1 + GOALS_PER_SESSION * (1 + DAYS_OF_PROGRESS))
+
+    print(f"{SESSIONS} sessões, {rows} registros")
+    print(f"dicts:   {as_dicts / 2**20:8.1f} MiB  ({as_dicts / SESSIONS / 1024:6.1f} KiB/sessão)")
+    print(f"modelos: {as_models / 2**20:8.1f} MiB  ({as_models / SESSIONS / 1024:6.1f} KiB/sessão)")
+    print(f"redução: {1 - as_models / as_dicts:8.1%}")
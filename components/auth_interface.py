@@ -40,7 +40,7 @@ def auth_interface_entrypoint(auth_machine: StateMachine) -> None:
     
     # Se a máquina de redirecionamento estiver ligada...
     if redirect_machine.current:
-        redirect_machine.to(RedirectStates.REDIRECTED.value, True) # ⬅ Desativa flag e força rerun().
+        redirect_machine.to(RedirectStates.REDIRECTED.value, True, defer=True) # ⬅ Desativa flag; o rerun fica para o final do lote.
     
 
     # 🔐 INTERFACE DE AUTENTICAÇÃO ────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
@@ -6,7 +6,8 @@ import pandas as pd
 import plotly.express as px
 
 from datetime import date
-from frameworks.sm import StateMachine
+from frameworks.sm import StateMachine, selector
+from services.models import to_dicts
 
 
 # 👨‍💻 LOGGER DO MÓDULO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
@@ -14,6 +15,35 @@ from frameworks.sm import StateMachine
 logger = logging.getLogger(__name__)
 
 
+# 🧮 SELETORES ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+@selector("goal_progress__{goal_id}")
+def _completed_progress(progress: list | None, goal_id: str) -> pd.DataFrame:
+    """
+    <docstrings> DataFrame dos registros concluídos de uma meta (recalculado apenas quando o progresso muda).
+    """
+    if not progress:
+        return pd.DataFrame()
+
+    df = pd.DataFrame(to_dicts(progress))
+    return df[df["completed"] == True]
+
+
+@selector("goal_progress__{goal_id}")
+def _daily_progress(progress: list | None, goal_id: str) -> pd.DataFrame:
+    """
+    <docstrings> Registros concluídos de uma meta, um por dia, em ordem cronológica.
+    """
+    if not progress:
+        return pd.DataFrame()
+
+    df = pd.DataFrame(to_dicts(progress))
+    df = df[df["completed"] == True].copy()
+    df["date"] = pd.to_datetime(df["date"])
+    df = df.drop_duplicates(subset="date")
+    return df.sort_values("date")
+
+
 # 📈 GRÁFICO DE PROGRESSO ACUMULADO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
 def render_goal_progress_chart(goal_id: str, auth_machine: StateMachine) -> None:
@@ -26,7 +56,7 @@ def render_goal_progress_chart(goal_id: str, auth_machine: StateMachine) -> None
 
     Calls:
         auth_machine.get_variable(): Acessa registros de progresso por meta | instanciado por StateMachine.
-        pd.DataFrame(): Conversão tabular de dados | instanciado por pandas.
+        _daily_progress(): Registros concluídos por dia, memorizados | definida neste módulo.
         st.plotly_chart(): Exibe gráfico na interface | definida em streamlit.
 
     Returns:
@@ -36,12 +66,7 @@ def render_goal_progress_chart(goal_id: str, auth_machine: StateMachine) -> None
     if not progress:
         return
 
-    df = pd.DataFrame(progress)
-    df = df[df["completed"] == True]
-    df["date"] = pd.to_datetime(df["date"])
-    df = df.drop_duplicates(subset="date")
-    df = df.sort_values("date")
-    df["Contagem"] = 1
+    df = _daily_progress(auth_machine, goal_id=goal_id).assign(Contagem=1)
     df = df.groupby("date")["Contagem"].sum().cumsum().reset_index()
     df = df.rename(columns={"date": "Data", "Contagem": "Total acumulado"})
 
@@ -79,7 +104,7 @@ def estimate_completion_time(goal_id: str, auth_machine: StateMachine) -> None:
 
     Calls:
         auth_machine.get_variable(): Acessa progresso salvo | instanciado por StateMachine.
-        pd.DataFrame(): Manipulação de dados | instanciado por pandas.
+        _daily_progress(): Registros concluídos por dia, memorizados | definida neste módulo.
         st.write(): Apresentação de dados na interface | definida em streamlit.
 
     Returns:
@@ -90,11 +115,7 @@ def estimate_completion_time(goal_id: str, auth_machine: StateMachine) -> None:
         st.info("Nenhum progresso registrado ainda.")
         return
 
-    df = pd.DataFrame(progress)
-    df = df[df["completed"] == True]
-    df["date"] = pd.to_datetime(df["date"])
-    df = df.drop_duplicates(subset="date")
-    df = df.sort_values("date")
+    df = _daily_progress(auth_machine, goal_id=goal_id)
 
     total_esforcos = df.shape[0]
     data_inicio = df["date"].min()
@@ -130,7 +151,7 @@ def estimate_accumulated_effort(goal_id: str, effort_target: int, auth_machine:
 
     Calls:
         auth_machine.get_variable(): Acessa progresso salvo | instanciado por StateMachine.
-        pd.DataFrame(): Manipulação de dados | instanciado por pandas.
+        _completed_progress(): Registros concluídos, memorizados | definida neste módulo.
         st.markdown(), st.write(): Apresentação na interface | definidas em streamlit.
 
     Returns:
@@ -141,8 +162,7 @@ def estimate_accumulated_effort(goal_id: str, effort_target: int, auth_machine:
         st.info("Nenhum progresso registrado ainda.")
         return
 
-    df = pd.DataFrame(progress)
-    df = df[df["completed"] == True]
+    df = _completed_progress(auth_machine, goal_id=goal_id)
 
     total_minutes = df["duration_minutes"].sum()
     percentage = (total_minutes / effort_target) * 100 if effort_target else 0
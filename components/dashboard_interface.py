@@ -4,11 +4,11 @@
 import logging
 import streamlit as st
 
-from frameworks.sm                      import StateMachine
+from frameworks.sm                      import StateMachine, selector
 from utils.variables.session            import FeedbackStates, RedirectStates, LoadStates
 from utils.load.context                 import load_session_context
 from utils.gender                       import render_helloworld
-from services.links                     import save_links, fetch_patient_info_by_email, accept_link, reject_link
+from services.links                     import save_links, fetch_patient_info_by_email, accept_link, reject_link, link_exists
 from components.sidebar                 import render_sidebar
 
 
@@ -18,6 +18,25 @@ from components.sidebar                 import render_sidebar
 logger = logging.getLogger(__name__)
 
 
+# 🧮 SELETORES ────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Descrição de cada status do convite na UX.
+_LINK_STATUS_LABELS = {"accepted": "Ativo", "pending": "Pendente", "rejected": "Rejeitado"}
+
+
+@selector("links")
+def _links_table(links: list | None) -> list[dict]:
+    """
+    <docstrings> Monta a tabela de vínculos do profissional (aceitos, pendentes e rejeitados), em ordem alfabética.
+    """
+    order = list(_LINK_STATUS_LABELS)
+    grouped = sorted(
+        (l for l in links or [] if l.get("status") in _LINK_STATUS_LABELS),
+        key=lambda l: (l.get("patient_name", "—").lower(), order.index(l.get("status")))
+    )
+    return [{"Nome do Paciente": l.get("patient_name", "—"), "Status": _LINK_STATUS_LABELS[l.get("status")]} for l in grouped]
+
+
 # 🔌 ENTRYPOINT DA INTERFACE DO PAINEL PRINCIPAL ───────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
 def dashboard_interface_entrypoint(auth_machine: StateMachine) -> None:
@@ -45,7 +64,7 @@ def dashboard_interface_entrypoint(auth_machine: StateMachine) -> None:
     
     # Se a máquina de redirecionamento estiver ligada...
     if redirect_machine.current:
-        redirect_machine.to(RedirectStates.REDIRECTED.value, True) # ⬅ Desativa a flag e força rerun().
+        redirect_machine.to(RedirectStates.REDIRECTED.value, True, defer=True) # ⬅ Desativa a flag; o rerun fica para o final do lote.
 
 
     # 📶 ROTEAMENTO CONFORME PAPEL DO USUÁRIO ─────────────────────────────────────────────────────────────────────────────────────────
@@ -166,6 +185,7 @@ def _render_professional_link_interface(auth_machine: StateMachine) -> None:
     Calls:
         load_links_for_professional(): Busca vínculos do profissional | definida em services.links.py.
         save_links(): Cria novo vínculo com paciente | definida em services.links.py.
+        link_exists(): Verifica vínculo existente sem baixar a lista | definida em services.links.py.
         fetch_patient_info_by_email(): Busca dados do paciente pelo e-mail | definida em services.patients.py.
 
     Returns:
@@ -176,26 +196,8 @@ def _render_professional_link_interface(auth_machine: StateMachine) -> None:
     # Cria ou recupera a máquina de feedbacks (deafult: True).
     feedbacks_machine = StateMachine("feedback_state", FeedbackStates.CLEAR.value, enable_logging = True)
     
-    # Obtém vínculos do profissional e organiza por status do convite.
-    links = auth_machine.get_variable("links", default=[])
-    active = sorted([l for l in links if l.get("status") == "accepted"], key=lambda x: x.get("patient_name", "").lower())
-    pending = sorted([l for l in links if l.get("status") == "pending"], key=lambda x: x.get("patient_name", "").lower())
-    rejected = sorted([l for l in links if l.get("status") == "rejected"], key=lambda x: x.get("patient_name", "").lower())
-
-    # Reúne vínculos aceitos, rejeitados e pendentes, adicionando a descrição de status na UX.
-    active_pending = [
-        {"Nome do Paciente": l.get("patient_name", "—"), "Status": "Ativo"}
-        for l in active
-    ] + [
-        {"Nome do Paciente": l.get("patient_name", "—"), "Status": "Pendente"}
-        for l in pending
-    ] + [
-        {"Nome do Paciente": l.get("patient_name", "—"), "Status": "Rejeitado"}
-        for l in rejected
-    ]
-
-    # Ordena a lista combinada de forma alfabética.
-    sorted_links = sorted(active_pending, key=lambda x: x["Nome do Paciente"].lower())
+    # Obtém a tabela de vínculos do profissional, recalculada apenas quando os vínculos mudam.
+    sorted_links = _links_table(auth_machine)
 
     # Se houver lista ordenada...
     if sorted_links:
@@ -250,29 +252,24 @@ def _render_professional_link_interface(auth_machine: StateMachine) -> None:
                         "patient_name": patient_info["display_name"],         # ⬅ Nome do paciente.
                         "status": "pending"                                   # ⬅ Status do convite.
                     }                                                           
-                    professional_links = auth_machine.get_variable("links", default = []) 
-                    already_has = any(
-                        v["patient_id"] == patient_info["auth_user_id"]    
-                        for v in professional_links
-                    )                                                          
+                    already_has = link_exists(
+                        auth_machine.get_variable("user_id"),              # ⬅ UUID do profissional.
+                        patient_info["auth_user_id"]                       # ⬅ UUID do paciente.
+                    )
 
                     # Se já houver convite cadastrado...
                     if already_has:
                         feedback.warning("⚠️ Convite de vinculação pendente.")
-                    
-                    # Caso contrário...
+
+                    # Se a verificação falhar ou o convite não for salvo...
+                    elif already_has is None or not save_links(auth_machine, data):
+                        feedback.error("❌ Não foi possível enviar o convite de vinculação.")
+
+                    # Caso contrário, o convite foi enviado com sucesso...
                     else:
-                        sucesso = save_links(auth_machine, data)
-                    
-                    # Se o convite for enviado com sucesso...
-                    if sucesso:
                         load_session_context(auth_machine)              # ⬅ Carrega o contexto da sessão.                      
                         feedbacks_machine.to(FeedbackStates.SHOW.value) # ⬅ Transiciona o estado da máquina de feedbacks e força rerun().
 
-                    # Caso contrário...
-                    else:
-                        feedback.error("❌ Não foi possível enviar o convite de vinculação.")
-
 
 # 🔗 FUNÇÃO AUXILIAR PARA RENDERIZAR A INTERFACE DE VINCÚLOS DO PACIENTE ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
@@ -5,7 +5,7 @@ import logging
 import streamlit as st
 
 from datetime                        import date, datetime
-from frameworks.sm                   import StateMachine
+from frameworks.sm                   import StateMachine, selector
 from utils.variables.session         import FeedbackStates, RedirectStates
 from services.goals                  import load_goals_by_link_id, save_goal
 from services.goals_progress         import load_goal_progress, save_goal_progress
@@ -20,6 +20,26 @@ from components.charts.goals_charts  import render_goal_progress_chart, estimate
 logger = logging.getLogger(__name__)
 
 
+# 🧮 SELETORES ────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+@selector("goals")
+def _goals_by_timeframe(metas: list | None) -> dict[str, list]:
+    """
+    <docstrings> Agrupa as metas por prazo ("curto", "medio", "longo").
+    """
+    timeframe_map = {"curto": [], "medio": [], "longo": []}
+
+    # Para cada meta em metas...
+    for meta in metas or []:
+        tf = meta.get("timeframe", "").lower() # ⬅ Obtém o prazo da meta em minúsculas.
+
+        # Se o prazo obtido estiver no mapeamento de prazos...
+        if tf in timeframe_map:
+            timeframe_map[tf].append(meta) # ⬅ Adiciona a meta à lista correspondente.
+
+    return timeframe_map
+
+
 # 🔌 FUNÇÃO PARA RENDERIZAR A INTERFACE DE METAS ────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
 def render_goals_interface(auth_machine: StateMachine) -> None:
@@ -51,7 +71,7 @@ def render_goals_interface(auth_machine: StateMachine) -> None:
 
     # Se a máquina de redirecionamento estiver ligada...
     if redirect_machine.current: 
-        redirect_machine.to(RedirectStates.REDIRECTED.value, True) # ⬅ Desliga a máquina de redirecionamento e força rerun().
+        redirect_machine.to(RedirectStates.REDIRECTED.value, True, defer=True) # ⬅ Desliga a máquina de redirecionamento; o rerun fica para o final do lote.
 
 
     # 📶 ROTEIA CONFORME PAPEL DO USUÁRIO ───────────────────────────────────────────────────────────────────────────────────────────────────
@@ -238,22 +258,12 @@ def _render_patient_goals(auth_machine: StateMachine) -> None:
     # Carrega metas apenas se necessário
     if not auth_machine.get_variable("goals"):
         load_goals_by_link_id(link_id, auth_machine)
-    
-    metas = auth_machine.get_variable("goals", default=[])
 
     # Carrega todo o progresso de uma vez, a cada rerun().
     load_goal_progress(link_id=link_id, auth_machine=auth_machine)
 
-    # Organiza metas por timeframe.
-    timeframe_map = {"curto": [], "medio": [], "longo": []}
-    
-    # Para cada meta em metas...
-    for meta in metas:
-        tf = meta.get("timeframe", "").lower() # ⬅ Obtém o prazo da meta em minúsculas.
-        
-        # Se o prazo obtido estiver no mapeamento de prazos...
-        if tf in timeframe_map:
-            timeframe_map[tf].append(meta) # ⬅ Adiciona a meta à lista correspondente.
+    # Organiza metas por timeframe (recalculado apenas quando as metas mudam).
+    timeframe_map = _goals_by_timeframe(auth_machine)
 
     
     # RENDERIZAÇÃO DAS ABAS DINAMICAMENTE ───────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
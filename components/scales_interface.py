@@ -1,20 +1,20 @@
 
 # 📦 IMPORTAÇÕES NECESSÁRIAS ────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
-import json 
 import logging
 import streamlit as st
 import pandas    as pd
 
 from typing                             import List, Dict
 from datetime                           import date
+from collections                        import deque
 from frameworks.sm                      import StateMachine
 from utils.variables.session            import EvaluationStates, RedirectStates
 from utils.load.context                 import is_professional_user
 from services.links                     import load_links_for_professional
-from services.scales                    import update_scale_status, load_assigned_scales, save_scale_assignment
-from services.scales_progress           import load_scale_progress, save_scale_progress
-from services.available_scales          import load_available_scales
+from services.scales                    import update_scale_status, load_assigned_scales, save_scale_assignments
+from services.scales_progress           import load_scale_progress, save_scale_progress, iter_scale_progress_pages
+from services.available_scales          import load_available_scales, get_scale_items, parse_scale_items
 from components.sidebar                 import render_sidebar
 
 
@@ -22,6 +22,9 @@ from components.sidebar                 import render_sidebar
 
 logger = logging.getLogger(__name__)
 
+# Máximo de registros exibidos no histórico de respostas (os mais recentes).
+HISTORY_MAX_ROWS = 500
+
 
 # 🔌 FUNÇÃO PARA RENDERIZAR A INTERFACE DE AVALIAÇÕES (ENTRY POINT) ────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
@@ -53,7 +56,7 @@ def scales_interface_entrypoint(auth_machine: StateMachine) -> tuple[None, str |
     
     # Se a máquina de redirecionamento estiver ligada...
     if redirect_machine.current:
-        redirect_machine.to(RedirectStates.REDIRECTED.value, True) # ⬅ Desativa a flag e força rerun().
+        redirect_machine.to(RedirectStates.REDIRECTED.value, True, defer=True) # ⬅ Desativa a flag; o rerun fica para o final do lote.
     
     # ⚙️ MÁQUINA DE ESCALAS ───────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
     
@@ -88,9 +91,9 @@ def _render_professional_scales(auth_machine: StateMachine, scales_machine: Stat
         st.tabs(): Cria abas de navegação | instanciado por streamlit.
         load_links_for_professional(): Carrega vínculos ativos | definida em services.professional_patient_link.
         load_available_scales(): Carrega definições de escalas disponíveis | definida em services.available_scales.
-        save_scale_assignment(): Persiste atribuição de escala | definida em services.scales.
+        save_scale_assignments(): Persiste a atribuição da escala a um ou mais pacientes em lote | definida em services.scales.
         st.form(): Inicia formulário | instanciado por streamlit.
-        st.selectbox(), st.form_submit_button(): Controles de formulário | instanciados por streamlit.
+        st.multiselect(), st.selectbox(), st.form_submit_button(): Controles de formulário | instanciados por streamlit.
         st.success(), st.error(), st.info(): Feedback visual | instanciados por streamlit.
 
     Returns:
@@ -134,9 +137,9 @@ def _render_professional_scales(auth_machine: StateMachine, scales_machine: Stat
         scales_names = [e["scale_name"] for e in scales]
         scales_map = {e["scale_name"]: e["id"] for e in scales}
 
-        # Formulário de atribuição.
+        # Formulário de atribuição (um ou mais pacientes de uma vez).
         with st.form("form_atribuicao_escala"):
-            nome = st.selectbox("Paciente", names)
+            nomes = st.multiselect("Pacientes", names, default=names[:1])
             scale = st.selectbox("Escala", scales_names)
             feedback = st.empty()
             click = st.form_submit_button("Atribuir", use_container_width=True)
@@ -148,20 +151,32 @@ def _render_professional_scales(auth_machine: StateMachine, scales_machine: Stat
                 feedback.error("❌ Erro interno: escala selecionada não foi encontrada.")
                 return None, None
 
-            payload = {
-                "link_id": links_map[nome],
-                "available_scale_id": scales_map[scale],
-                "scale_name": scale,
-                "status": "active"
-            }
-            done = save_scale_assignment(payload)
-
-            if done == "created":
-                feedback.success("✅ Escala atribuída com sucesso!")
-            elif done == "duplicate_today":
-                feedback.warning("⚠️ Esta escala já foi atribuída ao paciente hoje.")
-            else:
-                feedback.error("❌ Não foi possível atribuir a escala.")
+            if not nomes:
+                feedback.warning("⚠️ Selecione ao menos um paciente.")
+                return None, None
+
+            # Uma atribuição por paciente, gravadas em lote.
+            payloads = [
+                {
+                    "link_id": links_map[nome],
+                    "available_scale_id": scales_map[scale],
+                    "scale_name": scale,
+                    "status": "active"
+                }
+                for nome in nomes
+            ]
+            done = save_scale_assignments(payloads)
+
+            # Resume o resultado por paciente.
+            names_by_link = {link_id: nome for nome, link_id in links_map.items()}
+            created, duplicated, failed = ([names_by_link[l] for l in done[k]] for k in ("created", "duplicate_today", "failed"))
+
+            if created:
+                feedback.success(f"✅ Escala atribuída com sucesso: {', '.join(created)}.")
+            if duplicated:
+                st.warning(f"⚠️ Escala já atribuída hoje: {', '.join(duplicated)}.")
+            if failed:
+                st.error(f"❌ Não foi possível atribuir a escala: {', '.join(failed)}.")
 
     with tabs[1]:
         # Recupera o ID do vínculo único.
@@ -312,7 +327,7 @@ def _render_pending_scales(
         scales_machine (StateMachine): Máquina de estado responsável por armazenar progresso, respostas e estados da interface.
 
     Calls:
-        parse_scale_items(): Converte definição bruta em itens | definida neste módulo.
+        get_scale_items(): Recupera os itens já convertidos do catálogo | definida em services.available_scales.
         check_if_scale_completed_today(): Verifica se escala já foi respondida hoje | definida neste módulo.
         _render_scale_item_full_with_checkboxes(): Renderiza formulário de resposta | definida neste módulo.
         finalize_scale_response(): Persiste respostas e atualiza progresso no backend | definida neste módulo.
@@ -349,8 +364,8 @@ def _render_pending_scales(
             st.warning(f"⚠️ Estrutura não encontrada para {scale.get('scale_name')}") # ⬅ Falha de integridade: escala atribuída sem definição.
             continue # ⬅ Pula para a próxima escala.
 
-        # Converte a estrutura bruta de itens (JSON ou dict) em lista uma lista de itens.
-        itens = parse_scale_items(structure.get("items"))
+        # Recupera os itens já convertidos pelo catálogo (ou converte a estrutura bruta, se ausente).
+        itens = get_scale_items(structure["id"]) or parse_scale_items(structure.get("items"))
         
         # Se não houver itens definidos...
         if not itens:
@@ -547,59 +562,6 @@ def handle_scale_submission(
     return True
 
 
-# 🗃️ FUNÇÃO AUXILIAR PARA CONVERTER ESTRUTURAS DE ITENS ─────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
-
-def parse_scale_items(raw_items: dict | str) -> list[dict]:
-    """
-    <docstrings> Converte diferentes formatos brutos de itens de escala (dict ou string JSON) em uma lista de dicionários.
-    
-    Essa função é utilizada para garantir que os itens da escala estejam em formato manipulável (`list[dict]`),
-    independentemente de como eles foram armazenados ou recebidos do banco (como string JSON ou dict aninhado).
-
-    Args:
-        raw_items (dict | str): Estrutura crua contendo os itens da escala, geralmente retornada do Supabase.
-
-    Returns:
-        list[dict]: Lista de dicionários representando os itens válidos da escala.
-                    Retorna lista vazia em caso de erro de parsing ou tipo inesperado.
-
-    Calls:
-        isinstance(): Verifica o tipo de uma variável | built-in.
-        json.loads(): Converte string JSON em objeto Python | importada do módulo json.
-        dict.get(): Acessa chave 'items' de um dicionário | instanciado por dict.
-        logger.exception(): Registra erro com traceback | instanciado por logger.
-    """
-
-    # Tenta executar a ação principal...
-    try:
-
-        # Se a entrada for uma string JSON...
-        if isinstance(raw_items, str):
-            raw_items = json.loads(raw_items) # ⬅ Tenta decodificar para Python.
-
-        # Se já for um dicionário...
-        if isinstance(raw_items, dict):
-            itens = raw_items.get("items", []) # ⬅ Tenta extrair a chave 'items'.
-        
-        # Caso contrário...
-        else:
-            itens = []  # ⬅ Cria uma lista vazia como fallback.
-
-        # Se ainda assim os itens forem string JSON...
-        if isinstance(itens, str):
-            itens = json.loads(itens) # ⬅ Faz novo parsing.
-
-        # Garante que a saída seja uma lista de dicionários.
-        return itens if isinstance(itens, list) else []
-
-    # Na exceção...
-    except Exception as e:
-
-        # Loga qualquer erro no parsing com stacktrace automático.
-        logger.exception(f"Erro ao parsear items da escala: {e}")
-        return []  # ⬅ Retorna uma lista vazia como fallback de execução.
-
-
 # 📞 FUNÇÃO AUXILIAR PARA REGISTAR RESPOSTAS DE ESCALAS  ─────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
 def finalize_scale_response(scale_id: str, link_id: str, scales_machine: StateMachine) -> None:
@@ -658,7 +620,7 @@ def check_if_scale_completed_today(scale_id: str, link_id: str, machine: StateMa
     Returns:
         bool: True se a escala foi respondida hoje; False caso contrário.
     """
-    progresso = machine.get_variable(f"scale_progress__{scale_id}", default=[])
+    progresso = machine.get_variable(f"scale_progress_cache__{scale_id}", default=[])
     hoje = str(date.today())
 
     for p in progresso:
@@ -679,38 +641,43 @@ def render_scale_progress_table(link_id: str, auth_machine: StateMachine) -> Non
     """
     <docstrings> Exibe uma tabela com o histórico de respostas do paciente para cada escala.
 
+    O histórico é lido em páginas (paginação por chave: data e id, com os envios ainda na fila de escrita),
+    sem depender do limite padrão de linhas do servidor. Enquanto as páginas chegam, exibe apenas a
+    contagem; só os HISTORY_MAX_ROWS registros mais recentes ficam em memória e são exibidos.
+
     Args:
         link_id (str): UUID do vínculo paciente-profissional.
         auth_machine (StateMachine): Máquina de estado com os dados carregados.
 
     Calls:
-        load_scale_progress(): Carrega dados da tabela `scale_progress` | definida em services.scales_progress.
+        iter_scale_progress_pages(): Lê o histórico em páginas | definida em services.scales_progress.
+        st.empty(): Placeholder do progresso e da tabela | definida em streamlit.
         st.dataframe(): Exibe tabela no frontend | definida em streamlit.
     """
 
-    # Força recarregamento dos dados (caso não estejam carregados ainda)
-    load_scale_progress(link_id=link_id, auth_machine=auth_machine)
-
-    raw_vars = auth_machine.list_variables_with_prefix("scale_progress__")
+    # Colunas exibidas primeiro, se existirem.
+    cols_prioritarias = ["scale_id", "date", "completed"]
 
-    # Coleta todas as chaves com progresso
-    progresso = []
-    for v in raw_vars.values():
-        if isinstance(v, list):
-            progresso.extend(v)
-    
-    if not progresso:
-        st.info("⚠️ Nenhum progresso registrado até o momento.")
+    st.subheader("📊 Histórico de Respostas")
+    placeholder = st.empty()
+    recentes = deque(maxlen=HISTORY_MAX_ROWS)   # ⬅ Mantém só os registros mais recentes.
+    total = 0
+
+    # Para cada página do histórico (ordenado por data, com desempate pelo id)...
+    for page in iter_scale_progress_pages(link_id):
+        recentes.extend(page)
+        total += len(page)
+        placeholder.caption(f"⏳ Carregando histórico... {total} registro(s)")
+
+    if not total:
+        placeholder.info("⚠️ Nenhum progresso registrado até o momento.")
         return
 
-    # Converte para dataframe
-    df = pd.DataFrame(progresso)
-
-    # Reordena colunas, se possível
-    cols_prioritarias = ["scale_id", "date", "completed"]
-    cols_ordenadas = cols_prioritarias + [c for c in df.columns if c not in cols_prioritarias]
-    df = df[cols_ordenadas]
+    # Monta a tabela com os registros retidos e reordena as colunas.
+    df = pd.DataFrame(list(recentes))
+    cols_ordenadas = [c for c in cols_prioritarias if c in df.columns] + [c for c in df.columns if c not in cols_prioritarias]
 
-    # Renderiza
-    st.subheader("📊 Histórico de Respostas")
-    st.dataframe(df, use_container_width=True)
\ No newline at end of file
+    with placeholder.container():
+        st.dataframe(df[cols_ordenadas], use_container_width=True)
+        if total > len(recentes):
+            st.caption(f"Exibindo os {len(recentes)} registros mais recentes de {total}.")
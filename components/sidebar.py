@@ -1,5 +1,6 @@
 import streamlit as st
 from services.auth import auth_sign_out
+from services.write_behind import session_dead_writes
 from frameworks.sm import StateMachine
 
 
@@ -12,17 +13,23 @@ def render_sidebar(auth_machine: StateMachine) -> None:
 
     Calls:
         auth_machine.get_variable(): Recupera dados do usuário | instanciado por StateMachine.
+        session_dead_writes(): Lista as escritas da sessão que não chegaram ao banco | definida em services.write_behind.py.
+        auth_sign_out(): Encerra sessão de autenticação e descarta as máquinas da sessão | definida em services.auth.py.
         auth_machine.reset(): Reinicia a máquina de estado e força rerun | instanciado por StateMachine.
-        auth_sign_out(): Encerra sessão de autenticação | definida em services.auth.py.
         st.sidebar.button(): Botão na barra lateral | definida no módulo streamlit.
 
     Returns:
         None.
     """
 
+    # Avisa sobre registros que não puderam ser sincronizados com o banco.
+    dead = session_dead_writes()
+    if dead:
+        st.sidebar.warning(f"⚠️ {len(dead)} registro(s) não puderam ser salvos no servidor. Registre-os novamente.")
+
     # Botão de logout
     if st.sidebar.button("Sair", key="logout", use_container_width=True):
-        sucesso = auth_sign_out(auth_machine)
+        sucesso = auth_sign_out()
         if sucesso:
             auth_machine.reset()
         else:
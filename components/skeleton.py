@@ -0,0 +1,47 @@
+
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import streamlit as st
+
+
+# 🦴 FUNÇÃO PARA DESENHAR UM ESQUELETO DE CARREGAMENTO ──────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def render_skeleton(rows: int = 3, caption: str = "⏳ Carregando seus dados...") -> None:
+    """
+    <docstrings> Desenha blocos cinzas animados no lugar do conteúdo enquanto os dados são carregados em segundo plano.
+
+    Args:
+        rows (int): Quantidade de blocos. Default = 3.
+        caption (str): Legenda exibida acima dos blocos.
+
+    Calls:
+        st.caption(): Exibe a legenda | definida em streamlit.
+        st.markdown(): Injeta os blocos em HTML/CSS | definida em streamlit.
+
+    Returns:
+        None.
+    """
+    st.caption(caption)
+
+    bars = "".join(
+        f"<div class='abaete-skeleton' style='width: {100 - 15 * (i % 3)}%;'></div>"
+        for i in range(rows)
+    )
+
+    st.markdown(f"""
+        <style>
+            .abaete-skeleton {{
+                height: 1.1rem;
+                margin: 0.6rem 0;
+                border-radius: 0.4rem;
+                background: linear-gradient(90deg, #eeeeee 25%, #f5f5f5 50%, #eeeeee 75%);
+                background-size: 200% 100%;
+                animation: abaete-skeleton-pulse 1.2s ease-in-out infinite;
+            }}
+            @keyframes abaete-skeleton-pulse {{
+                0% {{ background-position: 200% 0; }}
+                100% {{ background-position: -200% 0; }}
+            }}
+        </style>
+        {bars}
+    """, unsafe_allow_html=True)
@@ -3,8 +3,432 @@
 
 import streamlit as st
 import logging
+import threading
+import functools
+import itertools
+import sys
+import os
+import time
 
-from typing import Callable
+from collections import OrderedDict
+from concurrent.futures import wait as futures_wait
+from contextlib  import contextmanager
+from typing      import Callable, Any, Iterator
+from utils.concurrency import submit_background
+
+
+# 🗂️ ARMAZENAMENTO ANINHADO DAS VARIÁVEIS DE UMA MÁQUINA ──────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Separador de sub-namespaces nos nomes de variáveis (ex.: "goal_progress__<goal_id>").
+NAMESPACE_SEPARATOR = "__"
+
+# Prefixo da chave, no session_state, que guarda as variáveis de cada máquina.
+VARIABLES_KEY_PREFIX = "__sm_vars__"
+
+# Prefixo da chave, no session_state, que guarda os valores memorizados por seletores de cada máquina.
+MEMO_KEY_PREFIX = "__sm_memo__"
+
+# Chave, no session_state, do registro de máquinas da sessão ({chave da máquina: estado inicial}).
+REGISTRY_KEY = "__sm_registry__"
+
+# Marcador de variável ausente.
+_MISSING = object()
+
+
+def _forget_memos(memo_key: str, var_name: str) -> None:
+    """
+    <docstrings> Remove os valores memorizados por seletores que dependem de uma variável ou de um namespace.
+
+    Args:
+        memo_key (str): Chave, no session_state, das memórias da máquina.
+        var_name (str): Variável removida (ex.: "goal_progress__abc", que cobre também "goal_progress__abc__x")
+            ou namespace removido (ex.: "goal_progress__").
+    """
+    memos = st.session_state.get(memo_key)
+    if not memos:
+        return
+
+    prefix = var_name if var_name.endswith(NAMESPACE_SEPARATOR) else f"{var_name}{NAMESPACE_SEPARATOR}"
+    for memo in [k for k, (_, _, inputs) in memos.items() if any(v == var_name or v.startswith(prefix) for v in inputs)]:
+        del memos[memo]
+
+
+def _changed(old: Any, new: Any) -> bool:
+    """
+    <docstrings> Indica se um novo valor difere do anterior (identidade e, depois, igualdade).
+    """
+    if old is new:
+        return False
+    if old is _MISSING:
+        return True
+    try:
+        return bool(old != new)
+    except Exception:
+        return True   # ⬅ Tipos sem comparação booleana (ex.: DataFrames) contam sempre como alterados.
+
+
+class StateNamespace:
+    """
+    <docstrings> Nó da árvore de variáveis de uma máquina: valores próprios e sub-namespaces.
+
+    Um nome como "goal_progress__abc" é guardado em children["goal_progress"].values["abc"], de modo que
+    listar ou remover um namespace custa apenas o número de variáveis dele, e não de todo o session_state.
+    Cada variável tem também uma versão, que muda quando seu valor muda (ver StateMachine.version()).
+
+    """
+    __slots__ = ("values", "children", "versions")
+
+    def __init__(self):
+        self.values: dict[str, Any] = {}
+        self.children: dict[str, "StateNamespace"] = {}
+        self.versions: dict[str, int] = {}
+
+    def child(self, name: str, create: bool = False) -> "StateNamespace | None":
+        """
+        <docstrings> Retorna o sub-namespace informado, criando-o se solicitado.
+        """
+        node = self.children.get(name)
+        if node is None and create:
+            node = self.children[name] = StateNamespace()
+        return node
+
+    def walk(self, path: list[str], create: bool = False) -> "StateNamespace | None":
+        """
+        <docstrings> Percorre uma sequência de sub-namespaces a partir deste nó.
+        """
+        node = self
+        for name in path:
+            node = node.child(name, create=create)
+            if node is None:
+                return None
+        return node
+
+    def flatten(self, prefix: str = "") -> dict[str, Any]:
+        """
+        <docstrings> Retorna todas as variáveis do nó e de seus descendentes, com o nome completo.
+        """
+        flat = {f"{prefix}{name}": value for name, value in self.values.items()}
+        for name, node in self.children.items():
+            flat.update(node.flatten(f"{prefix}{name}{NAMESPACE_SEPARATOR}"))
+        return flat
+
+    def __len__(self) -> int:
+        return len(self.values) + sum(len(node) for node in self.children.values())
+
+
+# Relógio global de versões: cada alteração de variável recebe um número novo, nunca reutilizado.
+_version_clock = itertools.count(1)
+
+
+# 📏 NAMESPACES LIMITADOS POR MEMÓRIA (LRU) ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Orçamento padrão (bytes estimados) de cada namespace limitado.
+DEFAULT_NAMESPACE_BYTES = int(os.getenv("ABAETE_STATE_NAMESPACE_BYTES", str(1024 * 1024)))
+
+
+def estimate_size(value: Any, _seen: set | None = None) -> int:
+    """
+    <docstrings> Estima, em bytes, a memória ocupada por um valor e pelos objetos que ele contém.
+
+    Percorre dicts, listas, tuplas, conjuntos e objetos com __slots__ (ex.: modelos de services.models),
+    contando cada objeto uma única vez. É uma estimativa: strings internadas e objetos compartilhados com
+    o resto do processo também são somados.
+
+    Args:
+        value (any): Valor a medir.
+
+    Returns:
+        int: Tamanho estimado em bytes.
+    """
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, seen) + estimate_size(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, seen) for item in value)
+    elif hasattr(value, "__slots__") and not isinstance(value, (str, bytes, int, float, bool)):
+        size += sum(estimate_size(getattr(value, slot, None), seen) for slot in value.__slots__)
+
+    return size
+
+
+class BoundedNamespace(StateNamespace):
+    """
+    <docstrings> Namespace com orçamento de memória, cujas entradas menos usadas recentemente são descartadas.
+
+    Cada entrada é um nome próprio do namespace, com seu valor e seu sub-namespace homônimo: em
+    "goal_progress", a entrada "abc" cobre "goal_progress__abc" e "goal_progress__abc__x". Por isso só
+    dados recarregáveis devem ficar num namespace limitado, nunca estado de formulário ou de interface.
+    A entrada mais recente nunca é descartada, mesmo que sozinha exceda o orçamento. Valores memorizados
+    por seletores (ver StateMachine.memo) que dependem de uma entrada descartada também são removidos.
+
+    """
+    __slots__ = ("max_bytes", "max_items", "on_evict", "prefix", "memo_key", "sizes", "total_bytes", "hits", "misses", "evictions", "evicted_bytes")
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_items: int | None = None,
+        on_evict: Callable | None = None,
+        prefix: str = "",
+        memo_key: str | None = None
+    ):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self.on_evict = on_evict                                  # ⬅ Chamado com (nome, valor) a cada descarte.
+        self.prefix = prefix                                      # ⬅ Nome completo do namespace (ex.: "goal_progress__").
+        self.memo_key = memo_key                                  # ⬅ Memórias de seletores da máquina dona do namespace.
+        self.sizes: OrderedDict[str, int] = OrderedDict()         # ⬅ Entradas em ordem de uso (mais antiga primeiro).
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+
+    def touch(self, name: str) -> None:
+        """
+        <docstrings> Marca a entrada como usada recentemente.
+        """
+        if name in self.sizes:
+            self.sizes.move_to_end(name)
+
+    def account(self, name: str) -> None:
+        """
+        <docstrings> Recalcula o tamanho da entrada após uma escrita e aplica o orçamento.
+        """
+        size = estimate_size(self.values.get(name)) if name in self.values else 0
+        if name in self.children:
+            size += estimate_size(self.children[name].flatten())
+
+        self.total_bytes += size - self.sizes.get(name, 0)
+        self.sizes[name] = size
+        self.sizes.move_to_end(name)
+        self._evict()
+
+    def discard(self, name: str) -> None:
+        """
+        <docstrings> Remove a entrada da contabilidade, se ela não existir mais no namespace.
+        """
+        if name in self.values or name in self.children:
+            self.account(name)
+        else:
+            self.total_bytes -= self.sizes.pop(name, 0)
+
+    def _evict(self) -> None:
+        while len(self.sizes) > 1 and (
+            self.total_bytes > self.max_bytes or (self.max_items is not None and len(self.sizes) > self.max_items)
+        ):
+            name, size = self.sizes.popitem(last=False)
+            value = self.values.pop(name, None)
+            self.versions.pop(name, None)
+            self.children.pop(name, None)
+
+            self.total_bytes -= size
+            self.evictions += 1
+            self.evicted_bytes += size
+
+            logging.debug(f"[StateMachine] Namespace limitado: '{name}' descartado ({size} bytes).")
+
+            if self.memo_key is not None:
+                _forget_memos(self.memo_key, f"{self.prefix}{name}")
+
+            if self.on_evict is not None:
+                try:
+                    self.on_evict(name, value)
+                except Exception as e:
+                    logging.exception(f"[StateMachine] Erro no callback de descarte de '{name}': {e}")
+
+    def stats(self) -> dict:
+        """
+        <docstrings> Retorna as métricas do namespace (ocupação, acertos, falhas e descartes).
+        """
+        return {
+            "entries": len(self.sizes),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "max_items": self.max_items,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "evicted_bytes": self.evicted_bytes,
+        }
+
+
+# 🔁 AGRUPAMENTO DE RERUNS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Lote ativo na execução atual do script (cada execução do Streamlit roda em sua própria thread).
+_batch_local = threading.local()
+
+# Chave, no session_state, da visualização de página em andamento (encadeamento de reruns).
+RERUN_CHAIN_KEY = "_sm_rerun_chain"
+
+# Chave, no session_state, das estatísticas acumuladas de reruns por página.
+RERUN_STATS_KEY = "_sm_rerun_stats"
+
+# Chave, no session_state, da página da execução mais recente (ver current_page()).
+CURRENT_PAGE_KEY = "_sm_current_page"
+
+# Rastreamento opcional de cada transição (máquina, estados, instante na execução e rerun).
+TRACE_TRANSITIONS = os.getenv("ABAETE_SM_TRACE", "false").lower() in ("1", "true", "yes")
+
+# Máximo de transições guardadas por visualização de página no rastreamento.
+TRACE_MAX_EVENTS = 200
+
+
+class RerunBatch:
+    """
+    <docstrings> Transições de uma execução do script cujos reruns foram adiados para o final.
+
+    """
+    __slots__ = ("page", "transitions", "deferred", "poll", "ready", "started", "trace")
+
+    def __init__(self, page: str):
+        self.page = page
+        self.transitions = 0                # ⬅ Transições feitas durante o lote.
+        self.deferred = 0                   # ⬅ Transições que pediram rerun e foram adiadas.
+        self.poll = None                    # ⬅ Intervalo (s) de verificação antes de um rerun de acompanhamento (ex.: init_async pendente).
+        self.ready: list[Callable[[], bool]] = []  # ⬅ Condições que disparam o rerun de acompanhamento.
+        self.started = time.perf_counter()  # ⬅ Início da execução do script.
+        self.trace: list[dict] = []         # ⬅ Transições rastreadas (com ABAETE_SM_TRACE).
+
+    def request_poll(self, delay: float, ready: Callable[[], bool]) -> None:
+        """
+        <docstrings> Pede um rerun de acompanhamento, mesmo sem transições, assim que `ready()` for verdadeiro.
+
+        A condição é verificada a cada `delay` segundos por um fragmento desenhado ao final do lote,
+        sem bloquear a execução do script.
+        """
+        self.poll = delay if self.poll is None else min(self.poll, delay)
+        self.ready.append(ready)
+
+
+def _rerun_when_ready(checks: list[Callable[[], bool]]) -> None:
+    """
+    <docstrings> Corpo do fragmento de acompanhamento: reexecuta a página quando alguma condição for satisfeita.
+    """
+    if any(check() for check in checks):
+        st.rerun(scope="app")
+
+
+def get_rerun_stats() -> dict[str, dict]:
+    """
+    <docstrings> Retorna as estatísticas de reruns por página na sessão atual.
+
+    Returns:
+        dict[str, dict]: {página: {"views", "reruns", "coalesced", "last_reruns", "seconds", "last_seconds"}},
+            em que "coalesced" conta os reruns evitados ao agrupar transições e "seconds" soma o tempo de
+            script de todas as execuções. Com ABAETE_SM_TRACE, inclui também "machines" ({máquina:
+            {"transitions", "reruns"}}) e "last_trace" (transições da última visualização).
+    """
+    return st.session_state.get(RERUN_STATS_KEY, {})
+
+
+def current_page() -> str | None:
+    """
+    <docstrings> Retorna a página da execução mais recente da sessão, registrada por StateMachine.batch().
+
+    Tarefas em segundo plano (com o contexto da sessão) comparam esse valor com a página que as agendou
+    para perceber que o usuário navegou.
+
+    Returns:
+        str | None: Nome da página (ex.: "1_Agenda.py"), ou None antes da primeira execução em lote.
+    """
+    return st.session_state.get(CURRENT_PAGE_KEY)
+
+
+def _trace_transition(key: str, previous: Any, new_state: Any, rerun: bool, batch: RerunBatch | None) -> None:
+    """
+    <docstrings> Registra uma transição no rastreamento (ABAETE_SM_TRACE) e no log de depuração.
+    """
+    at = round(time.perf_counter() - batch.started, 4) if batch is not None else None
+    logging.debug(f"[StateMachine/{key}] {previous!r} → {new_state!r} em {at}s (rerun={rerun})")
+
+    if batch is not None:
+        batch.trace.append({"machine": key, "from": previous, "to": new_state, "at": at, "rerun": bool(rerun)})
+
+
+def _finish_page_view(page: str, chain: dict) -> None:
+    """
+    <docstrings> Contabiliza uma visualização de página concluída (execução que terminou sem rerun).
+    """
+    reruns, coalesced, seconds = chain["reruns"], chain["coalesced"], round(chain["seconds"], 4)
+
+    stats = st.session_state.setdefault(RERUN_STATS_KEY, {})
+    entry = stats.setdefault(page, {"views": 0, "reruns": 0, "coalesced": 0, "last_reruns": 0, "seconds": 0.0, "last_seconds": 0.0})
+    entry["views"] += 1
+    entry["reruns"] += reruns
+    entry["coalesced"] += coalesced
+    entry["last_reruns"] = reruns
+    entry["seconds"] = round(entry["seconds"] + seconds, 4)
+    entry["last_seconds"] = seconds
+
+    # Com rastreamento, agrega transições e reruns pedidos por máquina.
+    if TRACE_TRANSITIONS:
+        machines = entry.setdefault("machines", {})
+        for event in chain["trace"]:
+            counts = machines.setdefault(event["machine"], {"transitions": 0, "reruns": 0})
+            counts["transitions"] += 1
+            counts["reruns"] += event["rerun"]
+        entry["last_trace"] = chain["trace"]
+
+    logging.debug(
+        f"[StateMachine] {page}: {reruns} rerun(s) na visualização, {coalesced} evitado(s) por agrupamento, "
+        f"{seconds}s de script."
+    )
+
+
+# 🌙 CARREGAMENTO EM SEGUNDO PLANO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Tempo máximo (s) de um callback de init_async antes do estado de timeout.
+ASYNC_TIMEOUT = float(os.getenv("ABAETE_ASYNC_TIMEOUT", "15"))
+
+# Intervalo (s) entre as verificações de um callback de init_async em andamento.
+ASYNC_POLL_INTERVAL = float(os.getenv("ABAETE_ASYNC_POLL_INTERVAL", "0.3"))
+
+# Execução de init_async em andamento na thread atual: (chave da máquina dona, ficha da execução).
+_async_local = threading.local()
+
+# Fichas das execuções de init_async, nunca reutilizadas.
+_async_tokens = itertools.count(1)
+
+
+def _run_async(key: str, token: int, callback: Callable, *args, **kwargs):
+    """
+    <docstrings> Executa o callback de init_async marcando a thread com a ficha da execução.
+    """
+    _async_local.run = (key, token)
+    try:
+        return callback(*args, **kwargs)
+    finally:
+        _async_local.run = None
+
+
+def _stale_async_write() -> bool:
+    """
+    <docstrings> Indica se a thread atual executa um init_async abandonado (timeout, nova tentativa, reset ou logout).
+
+    A ficha vigente fica na variável "async__token" da máquina dona; reset() e teardown() a descartam junto
+    com as demais variáveis, e o timeout a remove. Escritas de uma execução cuja ficha não é mais a vigente
+    são ignoradas por set_variable(), delete_variable() e to().
+    """
+    run = getattr(_async_local, "run", None)
+    if run is None:
+        return False
+
+    key, token = run
+    store = st.session_state.get(f"{VARIABLES_KEY_PREFIX}{key}")
+    node = store.child("async") if store is not None else None
+    if node is not None and node.values.get("token") == token:
+        return False
+
+    logging.debug(f"[StateMachine/{key}] Escrita de init_async abandonado ignorada.")
+    return True
 
 
 # 🏗️ CLASSE PARA NAVEGAÇÃO REATIVA EM STREAMLIT ───────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
@@ -16,6 +440,9 @@ class StateMachine:
     <docstrings> Essa classe encapsula a manipulação de estados dentro do session_state,
     permitindo controle reativo, inicialização condicional e reinicializações previsíveis em aplicações Streamlit.
     Também oferece um sistema de variáveis auxiliares que persistem manutenção de estados.
+
+    As variáveis de cada máquina ficam numa única árvore (StateNamespace) no session_state, dividida em
+    sub-namespaces pelo separador "__" do nome da variável.
     
     """
 
@@ -36,7 +463,7 @@ class StateMachine:
             enable_logging (bool): Flag para ativar logs de depuração.
 
         Calls:
-            st.session_state.setdefault(): Inicializa a chave no session | instanciado por st.
+            st.session_state.setdefault(): Inicializa a chave no session e registra a máquina | instanciado por st.
 
         """
         self.key = key
@@ -45,6 +472,9 @@ class StateMachine:
 
         st.session_state.setdefault(self.key, initial_state)
 
+        # Registra a máquina na sessão, para que teardown_all() alcance todas elas.
+        st.session_state.setdefault(REGISTRY_KEY, {}).setdefault(self.key, initial_state)
+
 
     # 📐 PROPRIEDADE QUE RETORNA O ESTADO ATUAL DA MÁQUINA DE ESTADOS ────────────────────────────────────────────────────────────────────────────────────────────────────────────
     
@@ -64,13 +494,16 @@ class StateMachine:
 
     # 🕹️ MÉTODO PARA TRANSICIONAR ESTADOS (CUSTOM) ────────────────────────────────────────────────────────────────────────────────────────────────────────────
    
-    def to(self, new_state: str, rerun: bool = True) -> None:
+    def to(self, new_state: str, rerun: bool = True, defer: bool = False) -> None:
         """
         <docstrings> Transiciona explicitamente o estado da máquina para outro valor.
 
         Args:
             new_state (str): Novo estado a ser atribuído.
-            rerun (bool, optional): Se True, força um st.rerun(). Valor padrão é True.
+            rerun (bool, optional): Se True, força um st.rerun(), que encerra a execução atual. Valor padrão é True.
+            defer (bool, optional): Dentro de StateMachine.batch, adia o rerun para o final do lote e deixa a
+                execução seguir com o novo estado. Use apenas quando o código seguinte continua válido após a
+                transição (ex.: flags de estabilização, carregamentos concluídos). Valor padrão é False.
 
         Calls:
             st.session_state.__setitem__(): Atualiza o estado | instanciado por st.session_state.
@@ -81,44 +514,197 @@ class StateMachine:
 
         """
         
+        # Transições de um init_async abandonado são descartadas.
+        if _stale_async_write():
+            return
+
         # Se "enable_logging" estiver habilitado (True)...
         if self.enable_logging:
             logging.debug(f"[StateMachine/{self.key}] Transição: {self.current} → {new_state}")
 
         # Transiciona a máquina de estados.
+        previous = st.session_state.get(self.key)
         st.session_state[self.key] = new_state
 
+        batch = getattr(_batch_local, "batch", None)
+
+        # Rastreamento opcional da transição (ABAETE_SM_TRACE).
+        if TRACE_TRANSITIONS:
+            _trace_transition(self.key, previous, new_state, rerun, batch)
+
+        # Dentro de um lote (StateMachine.batch), contabiliza a transição; com defer, o rerun fica para o final.
+        if batch is not None:
+            batch.transitions += 1
+            batch.deferred += rerun
+            if defer:
+                return
+
         # Se "rerun" estiver habilitado (True), reinicia o app.
         if rerun:
             st.rerun()
 
 
+    # 📦 MÉTODO PARA AGRUPAR TRANSIÇÕES EM UM ÚNICO RERUN ────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    @contextmanager
+    def batch(page: str) -> Iterator[RerunBatch]:
+        """
+        <docstrings> Agrupa as transições da execução do script e dispara no máximo um rerun, ao final.
+
+        Dentro do bloco, to(defer=True) apenas atualiza o estado e a execução segue com o novo valor; se alguma
+        transição pediu rerun, um único st.rerun() é feito na saída. Transições sem defer continuam encerrando
+        a execução imediatamente. O rerun também acontece quando o bloco termina com st.stop(), mas não quando
+        termina com erro. Blocos aninhados se juntam ao mais externo. Carregamentos de init_async() ainda em
+        andamento desenham um fragmento (st.fragment com run_every) que reexecuta a página quando terminarem,
+        sem bloquear o script.
+
+        Também contabiliza os reruns e o tempo de script por visualização de página e, com ABAETE_SM_TRACE,
+        rastreia cada transição (ver get_rerun_stats()).
+
+        Args:
+            page (str): Nome da página (ex.: "1_Agenda.py").
+
+        Calls:
+            st.rerun(): Reinicia o ciclo do Streamlit ao final, se necessário | definida em streamlit.runtime.
+            st.fragment(): Verifica periodicamente os carregamentos pendentes | definida em streamlit.
+            _finish_page_view(): Contabiliza a visualização concluída | definida neste módulo.
+
+        Yields:
+            RerunBatch: Lote ativo.
+
+        Example:
+            with StateMachine.batch("1_Agenda.py"):
+                page_1()
+        """
+
+        # Bloco aninhado: usa o lote já ativo.
+        if getattr(_batch_local, "batch", None) is not None:
+            yield _batch_local.batch
+            return
+
+        # Registra a página em execução (ver current_page()).
+        st.session_state[CURRENT_PAGE_KEY] = page
+
+        # Continua a visualização iniciada em uma execução anterior desta página, se ela terminou em rerun.
+        chain = st.session_state.get(RERUN_CHAIN_KEY)
+        if not chain or chain.get("page") != page:
+            chain = {"page": page, "reruns": 0, "coalesced": 0, "seconds": 0.0, "trace": []}
+
+        batch = _batch_local.batch = RerunBatch(page)
+        failed = False
+
+        try:
+            yield batch
+
+        # Erros comuns não disparam rerun; st.stop() e st.rerun() derivam de BaseException e seguem adiante.
+        except Exception:
+            failed = True
+            raise
+
+        finally:
+            _batch_local.batch = None
+
+            # Acumula o tempo de script e as transições rastreadas desta execução na visualização.
+            chain["seconds"] += time.perf_counter() - batch.started
+            run = chain["reruns"]
+            chain["trace"].extend({**event, "run": run} for event in batch.trace[:TRACE_MAX_EVENTS - len(chain["trace"])])
+
+            if (batch.deferred or batch.poll is not None) and not failed:
+                chain["reruns"] += 1
+                chain["coalesced"] += max(batch.deferred - 1, 0)
+                st.session_state[RERUN_CHAIN_KEY] = chain
+
+                # Transições pendentes: um único rerun agora.
+                if batch.deferred:
+                    st.rerun()
+
+                # Sem transições, deixa um fragmento verificando os carregamentos e encerra a execução normalmente.
+                st.fragment(_rerun_when_ready, run_every=batch.poll)(batch.ready)
+
+            else:
+                st.session_state.pop(RERUN_CHAIN_KEY, None)
+                _finish_page_view(page, chain)
+
+
     # 🎬 MÉTODO PARA REINICIAR ESTADOS (DEFAULT) ────────────────────────────────────────────────────────────────────────────────────────────────────────────
    
-    def reset(self, rerun: bool = True) -> None:
+    def reset(self, rerun: bool = True, defer: bool = False) -> None:
         """
         <docstrings> Retorna a máquina ao estado inicial e limpa todas as variáveis auxiliares.
 
         Args:
             rerun (bool, optional): Se True, reinicia o app. Valor padrão é True.
+            defer (bool, optional): Adia o rerun para o final de StateMachine.batch (ver to()). Valor padrão é False.
 
         Calls:
-            st.session_state.pop(): Remove variáveis auxiliares | instanciado por st.session_state.
+            st.session_state.pop(): Remove a árvore de variáveis auxiliares | instanciado por st.session_state.
             self.to(): Método da própria classe para transição de estado.
 
         Returns:
             None.
         """
         
-        # Remove todas as variáveis auxiliares do session_state.
-        prefix = f"{self.key}__"
-        
-        for k in list(st.session_state.keys()):
-            if k.startswith(prefix):
-                st.session_state.pop(k)
+        # Remove todas as variáveis auxiliares e valores memorizados de uma vez, descartando a árvore da máquina.
+        st.session_state.pop(self._variables_key, None)
+        st.session_state.pop(self._memo_key, None)
 
         # Retorna ao estado inicial
-        self.to(self.initial_state, rerun=rerun)
+        self.to(self.initial_state, rerun=rerun, defer=defer)
+
+
+    # 🧹 MÉTODO PARA DESCARTAR A MÁQUINA DA SESSÃO ────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+    def teardown(self) -> int:
+        """
+        <docstrings> Remove do session_state o estado e todas as variáveis da máquina, sem rerun.
+
+        Cancela um init_async() ainda pendente. Na próxima instanciação, a máquina recomeça do estado inicial.
+
+        Returns:
+            int: Quantidade de variáveis auxiliares descartadas.
+        """
+        future = self.get_variable("async__future")
+        if future is not None:
+            future.cancel()
+
+        store = st.session_state.pop(self._variables_key, None)
+        st.session_state.pop(self._memo_key, None)
+        st.session_state.pop(self.key, None)
+        st.session_state.get(REGISTRY_KEY, {}).pop(self.key, None)
+
+        return len(store) if store is not None else 0
+
+
+    # 🧹 MÉTODO PARA DESCARTAR TODAS AS MÁQUINAS DA SESSÃO ────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def teardown_all(keep: tuple[str, ...] = ()) -> dict[str, int]:
+        """
+        <docstrings> Descarta, de uma vez, todas as máquinas registradas na sessão e suas variáveis (ex.: no logout).
+
+        Percorre apenas o registro de máquinas da sessão, sem varrer o session_state.
+
+        Args:
+            keep (tuple[str, ...]): Chaves de máquinas a preservar.
+
+        Calls:
+            StateMachine.teardown(): Descarta cada máquina | definida nesta classe.
+
+        Returns:
+            dict[str, int]: {"machines": máquinas descartadas, "variables": variáveis liberadas}.
+        """
+        registry = st.session_state.get(REGISTRY_KEY, {})
+        machines, variables = 0, 0
+
+        for key, initial_state in list(registry.items()):
+            if key in keep:
+                continue
+            variables += StateMachine(key, initial_state).teardown()
+            machines += 1
+
+        logging.debug(f"[StateMachine] {machines} máquina(s) e {variables} variável(is) descartadas da sessão.")
+        return {"machines": machines, "variables": variables}
 
 
     # 🕥 FUNÇÃO PARA EXECUTAR CALLBACK UMA ÚNICA VEZ ────────────────────────────────────────────────────────────────────────────────────────────────────────────
@@ -156,7 +742,8 @@ class StateMachine:
                 callback(*args, **kwargs)
                 
                 # Transiciona a máquina de estados para sinalizar que o callback já foi executado.
-                self.to(done_state)
+                # Os dados já estão na sessão: dentro de um lote, a execução segue e o rerun fica para o final.
+                self.to(done_state, defer=True)
             
             # Caso contrário...
             except Exception as e:
@@ -164,6 +751,119 @@ class StateMachine:
                 raise
 
     
+    # 🌙 MÉTODO PARA EXECUTAR CALLBACK UMA ÚNICA VEZ EM SEGUNDO PLANO ────────────────────────────────────────────────────────────────────────────────────────────
+
+    def init_async(
+        self,
+        callback: Callable,
+        *args,
+        done_state: str = "done",
+        loading_state: str = "loading",
+        error_state: str = "error",
+        timeout_state: str = "timeout",
+        timeout: float = ASYNC_TIMEOUT,
+        placeholder: Callable | None = None,
+        **kwargs
+    ) -> str:
+        """
+        <docstrings> Variante de init_once() que executa o callback em uma thread de segundo plano, sem bloquear a página.
+
+        No estado inicial, agenda o callback e passa para loading_state. Enquanto ele não termina, desenha o
+        placeholder (ex.: um esqueleto da interface) e, dentro de StateMachine.batch(), pede um rerun de
+        acompanhamento ao final da execução; o resultado é recolhido numa execução seguinte, que transiciona
+        para done_state sem rerun e segue desenhando a página com os dados carregados. Se o callback falhar ou exceder o timeout, a máquina fica em error_state ou
+        timeout_state, com a mensagem na variável "async__error"; reset() permite tentar de novo.
+
+        Cada execução recebe uma ficha ("async__token"). Depois de um timeout, reset() ou teardown(), a ficha
+        deixa de valer e as escritas tardias da execução abandonada (set_variable, delete_variable e to(),
+        em qualquer máquina) são ignoradas.
+
+        Fora de um lote, funciona como init_once(): aguarda o callback (até o timeout) na própria execução.
+
+        Args:
+            callback (Callable): Função a ser chamada; deve gravar seus resultados na sessão (ex.: set_variable).
+            *args: Argumentos posicionais para o callback.
+            done_state (str): Estado após a conclusão. Default = "done".
+            loading_state (str): Estado enquanto o callback executa. Default = "loading".
+            error_state (str): Estado após uma falha do callback. Default = "error".
+            timeout_state (str): Estado após exceder o timeout. Default = "timeout".
+            timeout (float): Tempo máximo (s). Default = ABAETE_ASYNC_TIMEOUT (15).
+            placeholder (Callable | None): Função sem argumentos que desenha a interface provisória.
+            **kwargs: Argumentos nomeados para o callback.
+
+        Calls:
+            submit_background(): Executa o callback com o contexto da sessão | definida em utils.concurrency.
+            self.to(): Transiciona o estado | definida nesta classe.
+
+        Returns:
+            str: Estado atual da máquina após a verificação.
+        """
+
+        # No estado inicial, agenda o callback em segundo plano.
+        if self.current == self.initial_state:
+
+            if self.enable_logging:
+                logging.debug(f"[StateMachine/{self.key}] Executando callback único em segundo plano.")
+
+            token = next(_async_tokens)
+            self.set_variable("async__token", token)
+            self.set_variable("async__future", submit_background(_run_async, self.key, token, callback, *args, **kwargs))
+            self.set_variable("async__started", time.monotonic())
+            self.delete_variable("async__error")
+            self.to(loading_state, rerun=False)
+
+        if self.current != loading_state:
+            return self.current
+
+        future = self.get_variable("async__future")
+        started = self.get_variable("async__started", time.monotonic())
+        batch = getattr(_batch_local, "batch", None)
+
+        # Fora de um lote, não há execução de acompanhamento: aguarda o resultado aqui, até o prazo restante,
+        # e o que não terminar nesse prazo conta como timeout. Dentro de um lote, apenas verifica o prazo.
+        if batch is None and future is not None:
+            futures_wait([future], timeout=max(timeout - (time.monotonic() - started), 0))
+            expired = not future.done()
+        else:
+            expired = time.monotonic() - started >= timeout
+
+        # Sem tarefa registrada (ex.: sessão recriada): não há resultado a recolher.
+        if future is None:
+            self.set_variable("async__error", "Carregamento interrompido.")
+            self.to(error_state, rerun=False)
+
+        # Concluído: recolhe o resultado e transiciona.
+        elif future.done():
+            error = future.exception() if not future.cancelled() else None
+            self.delete_variable("async__future")
+            self.delete_variable("async__token")
+
+            if error is not None:
+                logging.error(f"[StateMachine:{self.key}] Erro em callback do init_async: {error!r}")
+                self.set_variable("async__error", str(error) or repr(error))
+                self.to(error_state, rerun=False)
+            else:
+                self.to(done_state, rerun=False)
+
+        # Excedeu o tempo máximo: abandona a tarefa. cancel() só evita tarefas ainda na fila; sem a ficha,
+        # as escritas de uma tarefa já em execução passam a ser ignoradas quando ela terminar.
+        elif expired:
+            future.cancel()
+            self.delete_variable("async__future")
+            self.delete_variable("async__token")
+            logging.warning(f"[StateMachine:{self.key}] init_async excedeu {timeout}s.")
+            self.set_variable("async__error", f"Tempo limite de {timeout:g}s excedido.")
+            self.to(timeout_state, rerun=False)
+
+        # Em andamento: desenha a interface provisória e volta a verificar em breve.
+        else:
+            if placeholder is not None:
+                placeholder()
+            batch.request_poll(ASYNC_POLL_INTERVAL, lambda: future.done() or time.monotonic() - started >= timeout)
+
+        return self.current
+
+
     # 🕥 MÉTODO PARA TRANSICIONAR ESTADOS UMA ÚNICA VEZ (DEFAULT > CUSTOM) ────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
     def set_once(self, value: str, rerun: bool = False) -> None:
@@ -202,18 +902,28 @@ class StateMachine:
             value (any): Valor a ser armazenado (pode ser qualquer tipo de dado).
 
         Calls:
-            st.session_state.__setitem__(): Método do objeto SessionStateProxy para armazenar valores | instanciado por st.session_state.
+            self._namespace(): Recupera a árvore de variáveis da máquina | definida nesta classe.
 
         Returns:
             None.
 
         """
         
-        # Cria uma chave única no formato: "estado__variavel".
-        scoped_key = f"{self.key}__{var_name}"
+        # Resultados de um init_async abandonado são descartados.
+        if _stale_async_write():
+            return
+
+        # Localiza o sub-namespace (ex.: "goal_progress__abc" → ["goal_progress"], "abc"), criando-o se necessário.
+        node, name, bounded, entry = self._locate(var_name, create=True)
 
-        # Salva essa chave única na sessão associada a um valor passado como argumento.
-        st.session_state[scoped_key] = value
+        # Avança a versão apenas se o valor mudou (recargas idênticas não invalidam seletores).
+        if _changed(node.values.get(name, _MISSING), value):
+            node.versions[name] = next(_version_clock)
+
+        # Salva o valor e, em namespaces limitados, contabiliza a entrada e aplica o orçamento.
+        node.values[name] = value
+        if bounded is not None:
+            bounded.account(entry)
 
     # 📤 MÉTODO PARA RECUPERAR VARIÁVEIS AUXILIARES DO ESTADO ──────────────────────────────────────────────────────────────────────────────────────────────
 
@@ -229,7 +939,7 @@ class StateMachine:
             default (any, optional): Valor padrão se a variável não estiver presente. Default = None.
 
         Calls:
-            st.session_state.get(): Método do objeto SessionStateProxy para acessar valores | instanciado por st.session_state.
+            self._namespace(): Recupera a árvore de variáveis da máquina | definida nesta classe.
 
         Returns:
             any:
@@ -237,8 +947,178 @@ class StateMachine:
 
         """
         
-        scoped_key = f"{self.key}__{var_name}"             # ⬅ Usa o mesmo padrão de chave composta.
-        return st.session_state.get(scoped_key, default)   # ⬅ Retorna o valor ou o fallback informado.
+        node, name, bounded, entry = self._locate(var_name)    # ⬅ Usa a mesma divisão em sub-namespaces.
+        found = node is not None and name in node.values
+
+        # Em namespaces limitados, registra acerto ou falha e renova a entrada lida.
+        if bounded is not None:
+            if found:
+                bounded.hits += 1
+                bounded.touch(entry)
+            else:
+                bounded.misses += 1
+
+        return node.values[name] if found else default        # ⬅ Retorna o valor ou o fallback informado.
+
+
+    # 🗑️ MÉTODO PARA REMOVER VARIÁVEIS AUXILIARES DO ESTADO ──────────────────────────────────────────────────────────────────────────────────────────────
+
+    def delete_variable(self, var_name: str) -> None:
+        """
+        <docstrings> Remove uma variável auxiliar ou, se o nome terminar em "__", todo o sub-namespace.
+
+        Args:
+            var_name (str): Nome da variável (ex.: "goal_progress__abc") ou do namespace (ex.: "goal_progress__").
+
+        Returns:
+            None.
+
+        """
+        # Remoções de um init_async abandonado são descartadas.
+        if _stale_async_write():
+            return
+
+        # Nome terminado no separador: remove o sub-namespace inteiro.
+        if var_name.endswith(NAMESPACE_SEPARATOR):
+            parent, name, bounded, entry = self._locate(var_name[:-len(NAMESPACE_SEPARATOR)])
+            if parent is not None:
+                parent.children.pop(name, None)
+        else:
+            node, name, bounded, entry = self._locate(var_name)
+            if node is not None:
+                node.values.pop(name, None)
+                node.versions.pop(name, None)
+
+        # Atualiza a contabilidade do namespace limitado que contém a variável.
+        if bounded is not None and entry is not None:
+            bounded.discard(entry)
+
+        # Descarta os valores memorizados que dependiam da variável.
+        _forget_memos(self._memo_key, var_name)
+
+
+    # 🔖 MÉTODO PARA CONSULTAR A VERSÃO DE UMA VARIÁVEL ──────────────────────────────────────────────────────────────────────────────────────────────
+
+    def version(self, var_name: str) -> int | None:
+        """
+        <docstrings> Retorna a versão atual de uma variável auxiliar, que muda sempre que o valor muda.
+
+        Args:
+            var_name (str): Nome da variável auxiliar.
+
+        Returns:
+            int | None: Versão da variável ou None, se ela não existir.
+        """
+        node, name, _, _ = self._locate(var_name)
+        return node.versions.get(name) if node is not None and name in node.values else None
+
+
+    # 🧮 MÉTODO PARA MEMORIZAR VALORES DERIVADOS DE VARIÁVEIS ──────────────────────────────────────────────────────────────────────────────────────────────
+
+    def memo(self, name: str, inputs: list[str], compute: Callable, key: tuple = ()) -> Any:
+        """
+        <docstrings> Retorna o valor derivado das variáveis informadas, recalculando-o apenas quando a versão
+        de alguma delas mudar. Prefira declarar seletores com o decorador selector().
+
+        A memória é descartada quando uma entrada é removida (delete_variable) ou descartada por um namespace
+        limitado, de modo que não cresce além das variáveis vivas.
+
+        Args:
+            name (str): Nome único do valor derivado.
+            inputs (list[str]): Nomes das variáveis de entrada.
+            compute (Callable): Função que recebe os valores das entradas (na ordem) e retorna o valor derivado.
+            key (tuple): Parâmetros adicionais que distinguem memórias do mesmo seletor.
+
+        Calls:
+            self.version(): Versão de cada entrada | definida nesta classe.
+            self.get_variable(): Valores das entradas no recálculo | definida nesta classe.
+
+        Returns:
+            any: Valor derivado (memorizado ou recalculado).
+        """
+        versions = tuple(self.version(var) for var in inputs)
+        memos = st.session_state.setdefault(self._memo_key, {})
+
+        cached = memos.get((name, key))
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+
+        value = compute(*(self.get_variable(var) for var in inputs))
+        memos[(name, key)] = (versions, value, tuple(inputs))
+
+        return value
+
+
+    # 📏 MÉTODO PARA LIMITAR A MEMÓRIA DE UM NAMESPACE ──────────────────────────────────────────────────────────────────────────────────────────────
+
+    def limit_namespace(
+        self,
+        namespace: str,
+        max_bytes: int = DEFAULT_NAMESPACE_BYTES,
+        max_items: int | None = None,
+        on_evict: Callable | None = None
+    ) -> BoundedNamespace:
+        """
+        <docstrings> Limita um sub-namespace da máquina por memória estimada (e, opcionalmente, por quantidade),
+        descartando as entradas menos usadas recentemente.
+
+        Pode ser chamado a cada execução: se o namespace já for limitado, apenas atualiza os limites.
+        Use em dados que podem ser recarregados (ex.: "goal_progress", recarregado a cada renderização).
+
+        Args:
+            namespace (str): Nome do namespace (ex.: "goal_progress" ou "goal_progress__").
+            max_bytes (int): Orçamento em bytes estimados. Default = ABAETE_STATE_NAMESPACE_BYTES (1 MiB).
+            max_items (int | None): Número máximo de entradas. Default = None (sem limite).
+            on_evict (Callable | None): Função chamada com (nome, valor) a cada entrada descartada.
+
+        Calls:
+            self._locate(): Localiza o namespace na árvore da máquina | definida nesta classe.
+            BoundedNamespace.account(): Contabiliza as entradas já existentes | definida neste módulo.
+
+        Returns:
+            BoundedNamespace: Namespace limitado.
+        """
+        parent, name, _, _ = self._locate(namespace.removesuffix(NAMESPACE_SEPARATOR), create=True)
+        node = parent.children.get(name)
+
+        # Já limitado: atualiza os limites e aplica o novo orçamento.
+        if isinstance(node, BoundedNamespace):
+            node.max_bytes, node.max_items, node.on_evict = max_bytes, max_items, on_evict
+            node._evict()
+            return node
+
+        # Converte o namespace existente, preservando e contabilizando suas variáveis.
+        prefix = f"{namespace.removesuffix(NAMESPACE_SEPARATOR)}{NAMESPACE_SEPARATOR}"
+        bounded = parent.children[name] = BoundedNamespace(max_bytes, max_items, on_evict, prefix, self._memo_key)
+        if node is not None:
+            bounded.values, bounded.children, bounded.versions = node.values, node.children, node.versions
+            for entry in list(node.values) + [n for n in node.children if n not in node.values]:
+                bounded.account(entry)
+
+        return bounded
+
+
+    # 📊 MÉTODO PARA CONSULTAR AS MÉTRICAS DOS NAMESPACES LIMITADOS ──────────────────────────────────────────────────────────────────────────────────────────────
+
+    def namespace_stats(self) -> dict[str, dict]:
+        """
+        <docstrings> Retorna as métricas de todos os namespaces limitados da máquina.
+
+        Returns:
+            dict[str, dict]: {namespace: {"entries", "bytes", "max_bytes", "max_items", "hits", "misses",
+                "evictions", "evicted_bytes"}}.
+        """
+        stats = {}
+        pending = [("", self._namespace())]
+
+        while pending:
+            prefix, node = pending.pop()
+            for name, child in node.children.items():
+                if isinstance(child, BoundedNamespace):
+                    stats[f"{prefix}{name}"] = child.stats()
+                pending.append((f"{prefix}{name}{NAMESPACE_SEPARATOR}", child))
+
+        return stats
     
 
     # 📋 MÉTODO PARA LISTAR VARIÁVEIS DO SESSION_STATE COM PREFIXO ──────────────────────────────────────────────────────────────
@@ -261,11 +1141,98 @@ class StateMachine:
             }
         """
         
-        prefix = f"{self.key}__{startswith}"
-        scoped_vars = {}
+        # Desce até o sub-namespace mais profundo indicado pelo prefixo; o resto é um filtro parcial.
+        *path, partial = startswith.split(NAMESPACE_SEPARATOR)
+        node = self._namespace().walk(path)
+        if node is None:
+            return {}
+
+        base = "".join(f"{name}{NAMESPACE_SEPARATOR}" for name in path)
+        scoped_vars = {f"{base}{name}": value for name, value in node.values.items() if name.startswith(partial)}
+
+        for name, child in node.children.items():
+            if name.startswith(partial):
+                scoped_vars.update(child.flatten(f"{base}{name}{NAMESPACE_SEPARATOR}"))
 
-        for key in st.session_state.keys():
-            if key.startswith(prefix):
-                raw = key[len(self.key) + 2:]  
-                scoped_vars[raw] = st.session_state[key]
         return scoped_vars
+
+
+    # 🧰 MÉTODOS INTERNOS DE ARMAZENAMENTO ──────────────────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def _variables_key(self) -> str:
+        return f"{VARIABLES_KEY_PREFIX}{self.key}"
+
+    @property
+    def _memo_key(self) -> str:
+        return f"{MEMO_KEY_PREFIX}{self.key}"
+
+    def _locate(self, var_name: str, create: bool = False) -> tuple[StateNamespace | None, str, BoundedNamespace | None, str | None]:
+        """
+        <docstrings> Localiza o namespace de uma variável e o primeiro namespace limitado no caminho.
+
+        Returns:
+            tuple: (namespace ou None se inexistente, nome local, namespace limitado ou None, entrada nele ou None).
+        """
+        *path, name = var_name.split(NAMESPACE_SEPARATOR)
+        node = self._namespace()
+        bounded, entry = None, None
+
+        for part in path:
+            if bounded is None and isinstance(node, BoundedNamespace):
+                bounded, entry = node, part
+            node = node.child(part, create=create)
+            if node is None:
+                return None, name, bounded, entry
+
+        if bounded is None and isinstance(node, BoundedNamespace):
+            bounded, entry = node, name
+
+        return node, name, bounded, entry
+
+    def _namespace(self) -> StateNamespace:
+        """
+        <docstrings> Cria ou recupera a árvore de variáveis da máquina no session_state.
+        """
+        store = st.session_state.get(self._variables_key)
+        if store is None:
+            store = st.session_state[self._variables_key] = StateNamespace()
+        return store
+
+
+# 🧮 DECORADOR PARA DECLARAR SELETORES MEMORIZADOS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def selector(*inputs: str):
+    """
+    <docstrings> Declara um valor derivado de variáveis de uma StateMachine, recalculado apenas quando
+    a versão de alguma entrada muda.
+
+    A função decorada recebe os valores das entradas (na ordem declarada) e os parâmetros nomeados;
+    os nomes das entradas podem usar esses parâmetros como campos de formatação. O resultado é
+    compartilhado entre execuções e não deve ser modificado por quem o recebe.
+
+    Args:
+        *inputs (str): Nomes das variáveis de entrada (ex.: "links", "goal_progress__{goal_id}").
+
+    Returns:
+        Callable: Decorador; a função decorada passa a ser chamada como fn(machine, **params).
+
+    Example:
+        @selector("goal_progress__{goal_id}")
+        def completed_count(progress, goal_id):
+            return sum(1 for p in progress or [] if p.get("completed"))
+
+        completed_count(auth_machine, goal_id=goal_id)
+    """
+    def decorator(fn: Callable) -> Callable:
+        name = f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(machine: StateMachine, **params):
+            names = [var.format(**params) for var in inputs]
+            key = tuple(sorted(params.items()))
+            return machine.memo(name, names, lambda *values: fn(*values, **params), key=key)
+
+        return wrapper
+
+    return decorator
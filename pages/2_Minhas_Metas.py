@@ -53,4 +53,6 @@ def page_2():
         load_session_context(auth_machine)   # ⬅ Carrega o contexto da sessão.
         render_goals_interface(auth_machine) # ⬅ Desenha a interface de metas.
 
-page_2()
\ No newline at end of file
+# Agrupa as transições de estado da execução em, no máximo, um rerun ao final.
+with StateMachine.batch("2_Minhas_Metas.py"):
+    page_2()
@@ -53,4 +53,6 @@ def main():
         load_session_context(auth_machine)    # ⬅ Carrega o contexto da sessão.
         scales_interface_entrypoint(auth_machine) # ⬅ Renderiza a interface de avaliações.
 
-main()
\ No newline at end of file
+# Agrupa as transições de estado da execução em, no máximo, um rerun ao final.
+with StateMachine.batch("3_Avaliações.py"):
+    main()
@@ -2,9 +2,9 @@
 # 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
 import logging
-import streamlit as st
 
-from services.backend import supabase
+from services.backend import get_client, release_client, clear_session_cache
+from services.write_behind import drain_session_writes
 from frameworks.sm import StateMachine
 from utils.variables.constants import REDIRECT_TO_RESET, REDIRECT_TO_LOGIN
 
@@ -26,7 +26,7 @@ def auth_sign_in(email: str, password: str):
         password (str): Senha do usuário.
 
     Calls:
-        supabase.auth.sign_in_with_password(): Método do objeto AuthClient para autenticar usuário | instanciado por supabase.auth.
+        get_client().auth.sign_in_with_password(): Método do objeto AuthClient para autenticar usuário no client da sessão | instanciado por get_client().auth.
         logger.debug(): Método do objeto Logger para registrar mensagens de depuração | instanciado por logger.
         logger.exception(): Método do objeto Logger para registrar erros e stacktrace automático | instanciado por logger.
 
@@ -43,7 +43,7 @@ def auth_sign_in(email: str, password: str):
         logger.debug(f"🔑 AUTH → Tentando login de {email}")
 
         # Executa a autenticação via Supabase.
-        response = supabase.auth.sign_in_with_password({
+        response = get_client().auth.sign_in_with_password({
             "email": email,      
             "password": password 
         })
@@ -71,7 +71,7 @@ def auth_reset_password(email: str) -> bool:
         email (str): Endereço para envio do link de redefinição.
 
     Calls:
-        supabase.auth.reset_password_email(): Método do objeto AuthClient para enviar link de redefinição | instanciado por supabase.auth.
+        get_client().auth.reset_password_email(): Método do objeto AuthClient para enviar link de redefinição | instanciado por get_client().auth.
         logger.debug(): Método do objeto Logger para registrar mensagens de depuração | instanciado por logger.
         logger.exception(): Método do objeto Logger para registrar erros e stacktrace automático | instanciado por logger.
 
@@ -87,7 +87,7 @@ def auth_reset_password(email: str) -> bool:
         logger.debug(f"AUTH → Solicitando redefinição de senha para {email}")
         
         # Dispara o email de redefinição via Supabase.
-        supabase.auth.reset_password_email(email, redirect_to = REDIRECT_TO_RESET)
+        get_client().auth.reset_password_email(email, redirect_to = REDIRECT_TO_RESET)
         
         # Retorna True se o email foi enviado corretamente.
         return True
@@ -114,7 +114,7 @@ def auth_sign_up(email: str, password: str, user_metadata: dict = {}):
         user_metadata (dict, optional): Dados adicionais como nome, etc.
 
     Calls:
-        supabase.auth.sign_up(): Método do objeto AuthClient para registrar novo usuário | instanciado por supabase.auth.
+        get_client().auth.sign_up(): Método do objeto AuthClient para registrar novo usuário | instanciado por get_client().auth.
         logger.debug(): Método do objeto Logger para registrar mensagens de depuração | instanciado por logger.
         logger.exception(): Método do objeto Logger para registrar erros e stacktrace automático | instanciado por logger.
 
@@ -129,7 +129,7 @@ def auth_sign_up(email: str, password: str, user_metadata: dict = {}):
         logger.debug(f"AUTH → Tentando cadastro de {email}")
 
         # Chamada direta sem customização de cliente HTTP
-        response = supabase.auth.sign_up({
+        response = get_client().auth.sign_up({
             "email": email,
             "password": password,
             "options": {
@@ -153,7 +153,11 @@ def auth_sign_out() -> bool:
     <docstrings> Finaliza a sessão do usuário logado.
 
     Calls:
-        supabase.auth.sign_out(): Método do objeto AuthClient para encerrar sessão atual | instanciado por supabase.auth.
+        drain_session_writes(): Envia as escritas pendentes da sessão enquanto o client ainda está autenticado | definida em services.write_behind.py.
+        get_client().auth.sign_out(): Método do objeto AuthClient para encerrar sessão atual | instanciado por get_client().auth.
+        release_client(): Devolve o client da sessão ao pool | definida em services.backend.py.
+        StateMachine.teardown_all(): Descarta todas as máquinas da sessão e suas variáveis | definida em frameworks.sm.py.
+        clear_session_cache(): Descarta o cache de registros da sessão | definida em services.backend.py.
         logger.debug(): Método do objeto Logger para registrar mensagens de depuração | instanciado por logger.
         logger.exception(): Método do objeto Logger para registrar erros e stacktrace automático | instanciado por logger.
 
@@ -168,14 +172,19 @@ def auth_sign_out() -> bool:
         # Loga a solicitação de logout.
         logger.debug("AUTH → Logout solicitado")
         
-        # Encerra sessão ativa no Supabase
-        supabase.auth.sign_out()
+        # Envia os progressos ainda na fila: depois do logout, o client da sessão não passa mais pela RLS.
+        unsent = drain_session_writes()
+        if unsent:
+            logger.warning(f"AUTH → {unsent} escrita(s) pendente(s) não enviada(s) antes do logout")
+
+        # Encerra sessão ativa no Supabase e devolve o client da sessão ao pool.
+        get_client().auth.sign_out()
+        release_client()
         
-        # Reinicia a máquina de estados.
-        for key in list(st.session_state.keys()):
-            valor = st.session_state.get(key)
-            if isinstance(valor, StateMachine):
-                valor.reset()
+        # Descarta todas as máquinas da sessão e os dados do usuário em cache, de uma vez.
+        freed = StateMachine.teardown_all()
+        clear_session_cache()
+        logger.debug(f"AUTH → Sessão limpa: {freed['machines']} máquina(s), {freed['variables']} variável(is)")
 
         # Retorna True se logout ocorreu sem erros.
         return True
@@ -1,23 +1,280 @@
 # 📦 IMPORTAÇÕES ─────────────────────────────────────────────────────────────────────────────
 
+import os
+import time
+import hashlib
 import logging
-from services.backend import fetch_records
+import threading
+
+from utils import fastjson
+from services.backend import fetch_records, invalidate_table, FETCH_FAILED
+from services.models import AvailableScale
 from frameworks.sm import StateMachine
 
 logger = logging.getLogger(__name__)
 
 
+# ⚙️ CONFIGURAÇÕES DO CATÁLOGO ─────────────────────────────────────────────────────────────
+
+# Intervalo mínimo (s) entre verificações da versão do catálogo no backend.
+CATALOG_CHECK_INTERVAL = 60.0
+
+# Intervalo (s) até nova tentativa quando a verificação ou a recarga falhar.
+CATALOG_RETRY_INTERVAL = 5.0
+
+# Idade máxima (s) do catálogo: depois dela, recarrega mesmo sem mudança de versão (edições de itens).
+CATALOG_MAX_AGE = float(os.getenv("ABAETE_CATALOG_MAX_AGE", "600"))
+
+# Colunas leves usadas para calcular a versão do catálogo (sem o JSON de itens).
+# Se a tabela tiver uma coluna de alteração (ex.: "id,updated_at"), edições são detectadas na verificação.
+CATALOG_VERSION_COLUMNS = os.getenv("ABAETE_CATALOG_VERSION_COLUMNS", "id")
+
+# Espera máxima (s) de uma sessão pela primeira carga feita por outra.
+CATALOG_WAIT_TIMEOUT = 15.0
+
+
+# 🗃️ FUNÇÃO AUXILIAR PARA CONVERTER ESTRUTURAS DE ITENS ─────────────────────────────────────
+
+def parse_scale_items(raw_items: dict | str) -> list[dict]:
+    """
+    <docstrings> Converte diferentes formatos brutos de itens de escala (dict ou string JSON) em uma lista de dicionários.
+
+    Essa função é utilizada para garantir que os itens da escala estejam em formato manipulável (`list[dict]`),
+    independentemente de como eles foram armazenados ou recebidos do banco (como string JSON ou dict aninhado).
+
+    Args:
+        raw_items (dict | str): Estrutura crua contendo os itens da escala, geralmente retornada do Supabase.
+
+    Returns:
+        list[dict]: Lista de dicionários representando os itens válidos da escala.
+                    Retorna lista vazia em caso de erro de parsing ou tipo inesperado.
+
+    Calls:
+        isinstance(): Verifica o tipo de uma variável | built-in.
+        fastjson.loads(): Converte string JSON em objeto Python (orjson/msgspec, se instalados) | definida em utils.fastjson.
+        dict.get(): Acessa chave 'items' de um dicionário | instanciado por dict.
+        logger.exception(): Registra erro com traceback | instanciado por logger.
+    """
+
+    # Tenta executar a ação principal...
+    try:
+
+        # Se a entrada for uma string JSON...
+        if isinstance(raw_items, str):
+            raw_items = fastjson.loads(raw_items) # ⬅ Tenta decodificar para Python.
+
+        # Se já for um dicionário...
+        if isinstance(raw_items, dict):
+            itens = raw_items.get("items", []) # ⬅ Tenta extrair a chave 'items'.
+
+        # Caso contrário...
+        else:
+            itens = []  # ⬅ Cria uma lista vazia como fallback.
+
+        # Se ainda assim os itens forem string JSON...
+        if isinstance(itens, str):
+            itens = fastjson.loads(itens) # ⬅ Faz novo parsing.
+
+        # Garante que a saída seja uma lista de dicionários.
+        return itens if isinstance(itens, list) else []
+
+    # Na exceção...
+    except Exception as e:
+
+        # Loga qualquer erro no parsing com stacktrace automático.
+        logger.exception(f"Erro ao parsear items da escala: {e}")
+        return []  # ⬅ Retorna uma lista vazia como fallback de execução.
+
+
+# 🌍 CATÁLOGO DE ESCALAS COMPARTILHADO PELO PROCESSO ─────────────────────────────────────────
+
+class ScaleCatalog:
+    """
+    <docstrings> Cache versionado do catálogo `available_scales`, compartilhado por todas as sessões.
+
+    O catálogo completo (com o JSON de itens) só é recarregado quando a versão muda ou passa de CATALOG_MAX_AGE.
+    A versão é um hash das colunas leves (CATALOG_VERSION_COLUMNS), consultado no máximo a cada
+    CATALOG_CHECK_INTERVAL segundos. Os itens já convertidos ficam ao lado das linhas, evitando o parsing
+    a cada renderização.
+
+    Apenas uma thread verifica e recarrega por vez, sem segurar o lock durante a rede: as demais seguem
+    com o catálogo atual. Uma verificação ou recarga que falhe (erro do backend) mantém o catálogo
+    anterior e é repetida após CATALOG_RETRY_INTERVAL; uma tabela vazia é um catálogo válido (vazio).
+
+    """
+
+    def __init__(self):
+        """
+        <docstrings> Método construtor de classe.
+
+        """
+        self.version = None
+        self.rows: list[dict] = []
+        self.items: dict[str, list[dict]] = {}   # ⬅ available_scale_id → itens convertidos
+        self.reloads = 0
+        self.failures = 0
+        self._loaded = False
+        self._loaded_at = 0.0
+        self._next_check = 0.0
+        self._refreshing = False
+        self._cond = threading.Condition()
+
+    def get(self) -> list[dict]:
+        """
+        <docstrings> Retorna as linhas do catálogo, recarregando-as se a versão no backend tiver mudado.
+
+        Returns:
+            list[dict]: Linhas de `available_scales`. Compartilhadas: trate-as como somente leitura.
+        """
+        with self._cond:
+
+            # Catálogo dentro do intervalo de verificação: nada a fazer.
+            if time.monotonic() < self._next_check:
+                return self.rows
+
+            # Outra thread já está verificando: segue com o catálogo atual ou, sem nenhum, aguarda a primeira carga.
+            if self._refreshing:
+                if not self._loaded:
+                    self._cond.wait_for(lambda: not self._refreshing, timeout=CATALOG_WAIT_TIMEOUT)
+                return self.rows
+
+            self._refreshing = True
+
+        try:
+            self._refresh()
+        finally:
+            with self._cond:
+                self._refreshing = False
+                self._cond.notify_all()
+
+        return self.rows
+
+    def invalidate(self) -> None:
+        """
+        <docstrings> Força a verificação da versão na próxima leitura.
+        """
+        with self._cond:
+            self._next_check = 0.0
+
+    def _refresh(self) -> None:
+        """
+        <docstrings> Verifica a versão e recarrega o catálogo se necessário. Executado fora do lock, por uma thread.
+        """
+        version = self._fetch_version()
+
+        # Verificação com erro: mantém o catálogo atual e tenta de novo em breve.
+        if version is None:
+            self._retry_later("falha na verificação da versão")
+            return
+
+        expired = time.monotonic() - self._loaded_at >= CATALOG_MAX_AGE
+        if self._loaded and version == self.version and not expired:
+            with self._cond:
+                self._next_check = time.monotonic() + CATALOG_CHECK_INTERVAL
+            return
+
+        self._reload(version)
+
+    def _fetch_version(self) -> str | None:
+        """
+        <docstrings> Calcula a versão do catálogo a partir das colunas leves.
+
+        Returns:
+            str | None: Hash das linhas (também para a tabela vazia), ou None em caso de erro.
+        """
+        stamps = fetch_records("available_scales", columns=CATALOG_VERSION_COLUMNS, order="id", cache=False, strict=True)
+        if stamps is FETCH_FAILED:
+            return None
+        columns = CATALOG_VERSION_COLUMNS.split(",")
+        raw = fastjson.dumpb([[s.get(c) for c in columns] for s in stamps], default=str)
+        return hashlib.sha1(raw).hexdigest()
+
+    def _reload(self, version: str) -> None:
+        """
+        <docstrings> Busca o catálogo completo e converte os itens de cada escala.
+
+        A busca passa pelo cache global (com single-flight); a entrada antiga é invalidada antes.
+        Se a busca falhar, o catálogo anterior é mantido; um resultado vazio substitui o catálogo normalmente.
+        """
+        invalidate_table("available_scales")
+        rows = fetch_records("available_scales", model=AvailableScale, strict=True)
+
+        # Falha na recarga: mantém o catálogo anterior.
+        if rows is FETCH_FAILED:
+            self._retry_later("falha na recarga")
+            return
+
+        items = {row["id"]: parse_scale_items(row.get("items")) for row in rows if "id" in row}
+
+        with self._cond:
+            self.rows = rows
+            self.items = items
+            self.version = version
+            self.reloads += 1
+            self._loaded = True
+            self._loaded_at = time.monotonic()
+            self._next_check = self._loaded_at + CATALOG_CHECK_INTERVAL
+
+        logger.debug(f"AVAILABLE_SCALES → Catálogo recarregado ({len(rows)} escalas, versão {version})")
+
+    def _retry_later(self, reason: str) -> None:
+        """
+        <docstrings> Mantém o catálogo atual e agenda nova verificação após CATALOG_RETRY_INTERVAL.
+        """
+        with self._cond:
+            self.failures += 1
+            self._next_check = time.monotonic() + CATALOG_RETRY_INTERVAL
+        logger.warning(f"AVAILABLE_SCALES → {reason}; mantendo o catálogo anterior ({len(self.rows)} escalas)")
+
+
+# Catálogo único do processo.
+_catalog = ScaleCatalog()
+
+
+def get_scale_items(available_scale_id: str) -> list[dict]:
+    """
+    <docstrings> Retorna os itens já convertidos de uma escala do catálogo.
+
+    Args:
+        available_scale_id (str): UUID da escala em `available_scales`.
+
+    Returns:
+        list[dict]: Itens da escala, ou lista vazia se a escala não estiver no catálogo.
+    """
+    _catalog.get()
+    return _catalog.items.get(available_scale_id, [])
+
+
+def invalidate_scale_catalog() -> None:
+    """
+    <docstrings> Força a verificação da versão do catálogo na próxima leitura (ex.: após editar uma escala).
+    """
+    _catalog.invalidate()
+
+
+def warm_scale_catalog() -> int:
+    """
+    <docstrings> Carrega o catálogo do processo antecipadamente (ex.: prefetch), sem tocar na máquina de estados.
+
+    Returns:
+        int: Número de escalas no catálogo.
+    """
+    return len(_catalog.get())
+
+
 # 🔍 FUNÇÃO PARA CARREGAR ESCALAS BASE NA MÁQUINA DE ESTADO ─────────────────────────────────
 
 def load_available_scales(auth_machine: StateMachine) -> None:
     """
     <docstrings> Carrega todas as escalas disponíveis do sistema e armazena na máquina de estados.
 
+    A máquina guarda apenas uma referência às linhas do catálogo do processo, sem duplicá-las por sessão.
+
     Args:
         auth_machine (StateMachine): Instância da máquina onde o dado será persistido.
 
     Calls:
-        fetch_records(): Busca dados da tabela `available_scales` | definida em services.backend.py.
+        ScaleCatalog.get(): Lê o catálogo versionado do processo | definida neste módulo.
         auth_machine.set_variable(): Armazena as escalas como variável local | instanciado por StateMachine.
         logger.debug(): Registra progresso da operação | instanciado por logger.
 
@@ -25,11 +282,11 @@ def load_available_scales(auth_machine: StateMachine) -> None:
         None.
 
     """
-    
+
     # Tenta executar a ação principal...
     try:
         logger.debug("AVAILABLE_SCALES → Carregando escalas base do sistema")
-        escalas = fetch_records("available_scales")
+        escalas = _catalog.get()
         logger.debug(f"AVAILABLE_SCALES → {len(escalas)} escalas base carregadas")
         auth_machine.set_variable("available_scales", escalas)
 
@@ -1,35 +1,68 @@
 
 # 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
+import os
+import time
+import threading
+import contextlib
 import streamlit as st
 
-from supabase             import create_client, Client
-from utils.logs           import track_db_operation, logger
-from postgrest.exceptions import APIError
+from collections                    import OrderedDict
+from supabase                       import create_client, Client
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from utils.logs                     import track_db_operation, logger
+from utils.metrics                  import record_cache_hit
+from postgrest.exceptions           import APIError
+from postgrest.types                import ReturnMethod
+
+# 🔑 FUNÇÃO PARA ESTABELECER A CONEXÃO COM O SUPABASE ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def _backend_mode() -> str:
+    """
+    <docstrings> Retorna o backend configurado: "supabase" (padrão) ou "fake" (em memória, para testes e benchmarks).
+
+    A variável de ambiente ABAETE_BACKEND tem prioridade sobre a chave BACKEND do secrets.
+    """
+    mode = os.getenv("ABAETE_BACKEND")
+
+    # Sem variável de ambiente, consulta o secrets (que pode nem existir em ambientes locais).
+    if not mode:
+        try:
+            mode = st.secrets.get("BACKEND")
+        except Exception:
+            mode = None
+
+    return (mode or "supabase").lower()
 
-# 🔑 FUNÇÃO CACHEADA PARA ESTABELECER A CONEXÃO COM O SUPABASE ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
-@st.cache_resource
 def _init_supabase() -> Client:
     """
-    <docstrings> Inicializa e retorna o Client Supabase usando as credenciais escondidas no secrets.
+    <docstrings> Inicializa e retorna um novo Client Supabase usando as credenciais escondidas no secrets.
+    Com o backend "fake" configurado, retorna um client em memória que dispensa credenciais.
 
     Args:
         None.
 
     Calls:
+        _backend_mode(): Lê o backend configurado | definida neste módulo.
+        FakeClient(): Client em memória | definida em services.fake_backend.py.
         create_client(): Função para cria um objeto Client de comunicação. Não pertence a nenhum objeto | definida no SDK do Supabase.
         logger.exception(): Método do objeto Logger para registrar mensagens de erro e stacktrace automático | instanciado por logger.
 
     Returns:
         Client:
-            Instância conectada do Supabase Client.
+            Instância conectada do Supabase Client (ou FakeClient).
             Em caso de erro, retorna None como fallback de execução.
             
     """
     
     # Tenta executar a operação principal...
     try:
+
+        # Se o backend falso estiver configurado, dispensa secrets e rede.
+        if _backend_mode() == "fake":
+            from services.fake_backend import FakeClient
+            return FakeClient()
         
         # Recupera a URL e o token JWT do projeto (anon key).
         url = st.secrets["SUPABASE_URL"]     
@@ -48,70 +81,892 @@ def _init_supabase() -> Client:
         return None                                                        
 
 
-# 🛡️ INICIALIZAÇÃO DO CLIENT SUPABASE ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+# 🏊 POOL DE CLIENTS SUPABASE POR SESSÃO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Número máximo de clients simultâneos no processo.
+POOL_MAX_SIZE = int(os.getenv("ABAETE_POOL_SIZE", "32"))
+
+# Segundos sem uso após os quais o client de uma sessão pode ser reaproveitado por outra.
+POOL_IDLE_TIMEOUT = float(os.getenv("ABAETE_POOL_IDLE_TIMEOUT", "900"))
+
+# Segundos que uma sessão espera por um client livre antes de desistir.
+POOL_WAIT_TIMEOUT = float(os.getenv("ABAETE_POOL_WAIT_TIMEOUT", "10"))
+
+# Chave de empréstimo usada fora de uma sessão Streamlit (threads sem contexto).
+_PROCESS_LEASE = "__process__"
+
+
+class ClientPool:
+    """
+    <docstrings> Pool de clients Supabase com um client emprestado (lease) por sessão.
+
+    Cada sessão usa sempre o mesmo client, de modo que o estado de autenticação (JWT) de um usuário
+    nunca é compartilhado com outro, e as conexões keep-alive do client são reaproveitadas entre reruns.
+    O tamanho do pool é limitado; clients ociosos além de POOL_IDLE_TIMEOUT podem ser recuperados,
+    e a sessão dona recupera seus tokens quando voltar a pedir um client.
+
+    """
+
+    def __init__(self, factory, max_size: int, idle_timeout: float, wait_timeout: float):
+        """
+        <docstrings> Método construtor de classe.
+
+        Args:
+            factory (Callable[[], Client]): Função que cria um novo client.
+            max_size (int): Número máximo de clients criados.
+            idle_timeout (float): Ociosidade (s) a partir da qual um empréstimo pode ser recuperado.
+            wait_timeout (float): Espera máxima (s) por um client livre.
+
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.wait_timeout = wait_timeout
+        self.created = 0
+        self.waiting = 0
+        self._idle: list[Client] = []
+        self._leases: dict[str, list] = {}         # ⬅ sessão → [client, último uso]
+        self._parked_tokens: dict[str, tuple] = {} # ⬅ sessão → (access_token, refresh_token) de empréstimos recuperados
+        self._cond = threading.Condition()
+
+    def lease(self, session_id: str) -> tuple[Client, bool]:
+        """
+        <docstrings> Empresta o client da sessão, criando ou aguardando um se necessário.
+
+        Args:
+            session_id (str): Identificador da sessão.
+
+        Returns:
+            tuple[Client, bool]: Client da sessão e se ele acabou de ser atribuído.
+
+        Raises:
+            TimeoutError: Se nenhum client ficar livre dentro de wait_timeout.
+            RuntimeError: Se o client não puder ser criado.
+        """
+        with self._cond:
+
+            # Se a sessão já tem um client, apenas renova o uso.
+            lease = self._leases.get(session_id)
+            if lease:
+                lease[1] = time.monotonic()
+                return lease[0], False
+
+            deadline = time.monotonic() + self.wait_timeout
+
+            while True:
+
+                # Reaproveita um client ocioso.
+                if self._idle:
+                    client = self._idle.pop()
+                    break
+
+                # Cria um novo client, se ainda houver espaço.
+                if self.created < self.max_size:
+                    client = self.factory()
+                    if client is None:
+                        raise RuntimeError("Falha ao criar client Supabase")
+                    self.created += 1
+                    break
+
+                # Recupera o client de uma sessão ociosa, se houver.
+                if self._reclaim_idle_lease():
+                    continue
+
+                # Aguarda a devolução de um client.
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Nenhum client Supabase livre após {self.wait_timeout}s")
+
+                self.waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self.waiting -= 1
+
+            self._leases[session_id] = [client, time.monotonic()]
+
+        # Restaura a autenticação de um empréstimo recuperado anteriormente, se houver.
+        tokens = self._parked_tokens.pop(session_id, None)
+        if tokens:
+            try:
+                client.auth.set_session(*tokens)
+            except Exception:
+                logger.exception(f"POOL → Falha ao restaurar a sessão de autenticação de {session_id}")
+
+        return client, True
+
+    def release(self, session_id: str) -> None:
+        """
+        <docstrings> Devolve o client da sessão ao pool, limpando o estado de autenticação.
+
+        Args:
+            session_id (str): Identificador da sessão.
+        """
+        with self._cond:
+            lease = self._leases.pop(session_id, None)
+            self._parked_tokens.pop(session_id, None)
+
+        if lease:
+            self._reset_auth(lease[0])
+            with self._cond:
+                self._idle.append(lease[0])
+                self._cond.notify()
+
+    def owns(self, session_id: str) -> bool:
+        """
+        <docstrings> Indica se a sessão ainda tem um client autenticável: empréstimo ativo ou tokens guardados.
+
+        Args:
+            session_id (str): Identificador da sessão.
+
+        Returns:
+            bool: False para sessões encerradas (logout) ou desconhecidas (ex.: de antes de um reinício).
+        """
+        with self._cond:
+            return session_id in self._leases or session_id in self._parked_tokens
+
+    def metrics(self) -> dict:
+        """
+        <docstrings> Retorna as métricas do pool.
+
+        Returns:
+            dict: in_use, idle, waiting, created e max_size.
+        """
+        with self._cond:
+            return {
+                "in_use": len(self._leases),
+                "idle": len(self._idle),
+                "waiting": self.waiting,
+                "created": self.created,
+                "max_size": self.max_size,
+            }
+
+    def _reclaim_idle_lease(self) -> bool:
+        """
+        <docstrings> Recupera o client da sessão ociosa há mais tempo, além de idle_timeout. Chamado com o lock.
+
+        Returns:
+            bool: True se um client foi devolvido ao pool.
+        """
+        now = time.monotonic()
+        stale = [(lease[1], sid) for sid, lease in self._leases.items() if now - lease[1] > self.idle_timeout]
+        if not stale:
+            return False
+
+        _, session_id = min(stale)
+        client = self._leases.pop(session_id)[0]
+
+        # Guarda os tokens atuais para a sessão dona retomar depois.
+        try:
+            session = client.auth.get_session()
+            if session:
+                self._parked_tokens[session_id] = (session.access_token, session.refresh_token)
+        except Exception:
+            logger.exception(f"POOL → Falha ao preservar a sessão de autenticação de {session_id}")
+
+        self._reset_auth(client)
+        self._idle.append(client)
+        logger.debug(f"POOL → Client da sessão ociosa {session_id} recuperado")
+        return True
+
+    @staticmethod
+    def _reset_auth(client: Client) -> None:
+        """
+        <docstrings> Remove localmente a autenticação de um client, sem revogar os tokens no servidor.
+        """
+        try:
+            client.auth.sign_out({"scope": "local"})
+        except Exception:
+            logger.exception("POOL → Falha ao limpar a autenticação do client")
+
+
+@st.cache_resource(show_spinner=False)
+def _client_pool() -> ClientPool:
+    """
+    <docstrings> Cria o pool de clients, único por processo.
+
+    Sem spinner: também é chamada por threads sem contexto de script (ex.: envio da fila de escrita).
+
+    Returns:
+        ClientPool: Pool compartilhado por todas as sessões.
+    """
+    return ClientPool(_init_supabase, POOL_MAX_SIZE, POOL_IDLE_TIMEOUT, POOL_WAIT_TIMEOUT)
+
+
+# Sessão assumida explicitamente pela thread atual (ex.: workers em segundo plano).
+_thread_scope = threading.local()
+
+
+def _session_id() -> str:
+    """
+    <docstrings> Retorna o identificador da sessão dona da thread atual.
+
+    Ordem: sessão assumida via session_scope(), sessão Streamlit da thread, ou a chave do processo.
+    """
+    scoped = getattr(_thread_scope, "session_id", None)
+    if scoped:
+        return scoped
+
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else _PROCESS_LEASE
+
+
+def current_session_id() -> str:
+    """
+    <docstrings> Retorna o identificador da sessão atual, para que tarefas em segundo plano usem o mesmo client.
+    """
+    return _session_id()
+
+
+@contextlib.contextmanager
+def session_scope(session_id: str | None):
+    """
+    <docstrings> Faz a thread atual usar o client emprestado à sessão informada.
+
+    Args:
+        session_id (str | None): Identificador obtido com current_session_id(). None mantém o padrão.
+
+    Example:
+        with session_scope(sid):
+            upsert_record(...)
+    """
+    previous = getattr(_thread_scope, "session_id", None)
+    _thread_scope.session_id = session_id or previous
+    try:
+        yield
+    finally:
+        _thread_scope.session_id = previous
+
+
+# 🛡️ ACESSO AO CLIENT SUPABASE DA SESSÃO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def get_client() -> Client:
+    """
+    <docstrings> Retorna o client Supabase emprestado à sessão atual.
+
+    Calls:
+        _client_pool(): Recupera o pool do processo | definida neste módulo.
+        ClientPool.lease(): Empresta o client da sessão | definida neste módulo.
+
+    Returns:
+        Client: Client exclusivo da sessão.
+    """
+    client, _ = _client_pool().lease(_session_id())
+    return client
+
+
+def release_client() -> None:
+    """
+    <docstrings> Devolve ao pool o client da sessão atual (ex.: no logout).
+    """
+    _client_pool().release(_session_id())
+
+
+def session_is_live(session_id: str | None) -> bool:
+    """
+    <docstrings> Indica se o client da sessão informada ainda existe no pool, sem emprestar um novo.
+
+    Tarefas sem sessão (None ou a chave do processo) são sempre consideradas ativas.
+    """
+    if not session_id or session_id == _PROCESS_LEASE:
+        return True
+    return _client_pool().owns(session_id)
+
+
+def get_pool_metrics() -> dict:
+    """
+    <docstrings> Retorna as métricas do pool de clients (in_use, idle, waiting, created, max_size).
+    """
+    return _client_pool().metrics()
+
+
+# 🧠 CACHE DE LEITURA (READ-THROUGH) ───────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
-# Instância única do Client disponível para todo o sistema.
-supabase: Client = _init_supabase()
+# Configuração de cada escopo de cache: tempo de vida em segundos (ttl) e limite de entradas (LRU).
+CACHE_SCOPES = {
+    "session": {"ttl": 30.0,  "maxsize": 128},
+    "global":  {"ttl": 300.0, "maxsize": 64},
+}
 
-# Se a conexão falhar...
-if supabase is None:
-    st.stop() # ⬅ Interrompe a execução do programa.
+# Escopo padrão de cache por tabela. Tabelas ausentes não são cacheadas, salvo pedido explícito.
+CACHED_TABLES = {
+    "links":            "session",
+    "goals":            "session",
+    "goal_progress":    "session",
+    "scales":           "session",
+    "scale_progress":   "session",
+    "available_scales": "global",
+}
+
+# Chave do cache de sessão dentro do session_state.
+_SESSION_CACHE_KEY = "_backend_record_cache"
+
+# Sentinela para diferenciar "não encontrado" de um valor cacheado vazio.
+_MISS = object()
+
+
+class RecordCache:
+    """
+    <docstrings> Cache LRU com tempo de vida para resultados de fetch_records, indexado por tabela (tag).
+
+    Cada entrada guarda a geração da tabela no momento em que foi lida. Um upsert incrementa a geração
+    global da tabela, o que invalida as entradas de todos os caches (inclusive de outras sessões).
+
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        """
+        <docstrings> Método construtor de classe.
+
+        Args:
+            ttl (float): Tempo de vida de cada entrada, em segundos.
+            maxsize (int): Número máximo de entradas antes de descartar a menos usada.
+
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()   # ⬅ chave → (expira_em, tabela, geração, valor)
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, table_name: str):
+        """
+        <docstrings> Recupera uma entrada válida do cache, promovendo-a no LRU.
+
+        Returns:
+            any: Valor cacheado ou _MISS se ausente, expirado ou invalidado.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            # Se a entrada existir, ainda estiver no prazo e pertencer à geração atual da tabela...
+            if entry and entry[0] > time.monotonic() and entry[2] == _table_generation(table_name):
+                self._entries.move_to_end(key) # ⬅ Marca como usada recentemente.
+                self.hits += 1
+                return entry[3]
+
+            # Descarta a entrada vencida, se houver.
+            if entry:
+                del self._entries[key]
+
+            self.misses += 1
+            return _MISS
+
+    def set(self, key: tuple, table_name: str, generation: int, value) -> None:
+        """
+        <docstrings> Armazena um valor no cache, descartando as entradas menos usadas acima do limite.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, table_name, generation, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, table_name: str) -> None:
+        """
+        <docstrings> Remove todas as entradas associadas a uma tabela.
+        """
+        with self._lock:
+            for key in [k for k, entry in self._entries.items() if entry[1] == table_name]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        <docstrings> Remove todas as entradas do cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        <docstrings> Retorna os contadores de uso do cache.
+
+        Returns:
+            dict: hits, misses, evictions, size e hit_rate.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+# Geração de cada tabela, compartilhada por todo o processo (tag de invalidação).
+_table_generations: dict[str, int] = {}
+_generations_lock = threading.Lock()
+
+# Cache global, compartilhado por todas as sessões do processo.
+_global_cache = RecordCache(**CACHE_SCOPES["global"])
+
+
+def _table_generation(table_name: str) -> int:
+    """
+    <docstrings> Retorna a geração atual de uma tabela.
+    """
+    return _table_generations.get(table_name, 0)
+
+
+def _session_cache() -> RecordCache | None:
+    """
+    <docstrings> Cria ou recupera o cache da sessão atual no session_state.
+
+    Returns:
+        RecordCache | None: Cache da sessão, ou None quando não há sessão Streamlit ativa.
+    """
+    # Threads sem contexto de script (ex.: envio da fila de escrita) não têm session_state próprio.
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+    try:
+        if _SESSION_CACHE_KEY not in st.session_state:
+            st.session_state[_SESSION_CACHE_KEY] = RecordCache(**CACHE_SCOPES["session"])
+        return st.session_state[_SESSION_CACHE_KEY]
+    except Exception:
+        return None
+
+
+def clear_session_cache() -> None:
+    """
+    <docstrings> Descarta o cache da sessão atual (ex.: no logout), liberando a memória de imediato.
+    """
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return
+    try:
+        st.session_state.pop(_SESSION_CACHE_KEY, None)
+    except Exception:
+        pass
+
+
+def _resolve_cache(table_name: str, cache: str | bool | None) -> RecordCache | None:
+    """
+    <docstrings> Resolve o cache a ser usado por uma busca.
+
+    Args:
+        table_name (str): Nome da tabela.
+        cache (str | bool | None): "session", "global", False (desliga) ou None (padrão da tabela).
+
+    Returns:
+        RecordCache | None: Cache escolhido, ou None se a busca não deve ser cacheada.
+    """
+    scope = CACHED_TABLES.get(table_name) if cache is None or cache is True else cache
+
+    if scope == "global":
+        return _global_cache
+    if scope == "session":
+        return _session_cache()
+    return None
+
+
+def _freeze(value):
+    """
+    <docstrings> Converte filtros (dicts e listas aninhados) em uma estrutura imutável usável como chave.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def invalidate_table(table_name: str) -> None:
+    """
+    <docstrings> Invalida todas as entradas cacheadas de uma tabela, em todas as sessões.
+
+    Args:
+        table_name (str): Nome da tabela alterada.
+
+    Calls:
+        RecordCache.invalidate(): Libera as entradas da tabela no cache global e da sessão | definida neste módulo.
+
+    Returns:
+        None.
+    """
+
+    # Incrementa a geração da tabela: entradas antigas de qualquer sessão passam a ser ignoradas.
+    with _generations_lock:
+        _table_generations[table_name] = _table_generation(table_name) + 1
+
+    # Libera a memória imediatamente nos caches alcançáveis a partir desta sessão.
+    _global_cache.invalidate(table_name)
+    session_cache = _session_cache()
+    if session_cache is not None:
+        session_cache.invalidate(table_name)
+
+
+def get_cache_stats() -> dict:
+    """
+    <docstrings> Retorna os contadores de hit/miss dos caches global e da sessão atual, e da coalescência.
+
+    Returns:
+        dict: {"global": {...}, "session": {...}, "single_flight": {...}}.
+    """
+    session_cache = _session_cache()
+    return {
+        "global": _global_cache.stats(),
+        "session": session_cache.stats() if session_cache is not None else {},
+        "single_flight": _single_flight.stats(),
+    }
+
+
+# 🛫 COALESCÊNCIA DE BUSCAS CONCORRENTES (SINGLE-FLIGHT) ───────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Espera máxima (s) de uma chamada seguidora pela líder antes de buscar por conta própria.
+SINGLE_FLIGHT_WAIT_TIMEOUT = float(os.getenv("ABAETE_SINGLE_FLIGHT_TIMEOUT", "10"))
+
+class SingleFlight:
+    """
+    <docstrings> Garante uma única execução em andamento por chave: chamadas concorrentes aguardam e compartilham o resultado.
+
+    Usado apenas em buscas do escopo global, cujo resultado não depende do usuário (RLS) e pode ser
+    compartilhado entre sessões. Uma seguidora que espera mais que wait_timeout (líder travada) desiste
+    e executa a busca por conta própria.
+
+    """
+
+    def __init__(self, wait_timeout: float = SINGLE_FLIGHT_WAIT_TIMEOUT):
+        """
+        <docstrings> Método construtor de classe.
+
+        Args:
+            wait_timeout (float): Espera máxima (s) pela chamada líder.
+
+        """
+        self.wait_timeout = wait_timeout
+        self.leaders = 0
+        self.shared = 0
+        self.timeouts = 0
+        self._calls: dict = {}   # ⬅ chave → [evento, resultado, exceção]
+        self._lock = threading.Lock()
+
+    def do(self, key: tuple, fn):
+        """
+        <docstrings> Executa fn() uma única vez para as chamadas simultâneas com a mesma chave.
+
+        Args:
+            key (tuple): Chave da busca.
+            fn (Callable): Função que executa a busca.
+
+        Returns:
+            any: Resultado de fn(), obtido pela própria chamada, pela chamada líder ou, se a líder
+                exceder wait_timeout, por uma execução própria.
+
+        Raises:
+            Exception: A mesma exceção levantada na chamada líder.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = [threading.Event(), None, None]
+                self.leaders += 1
+            else:
+                self.shared += 1
+
+        # Seguidora: aguarda a líder e reaproveita o resultado.
+        if not leader:
+
+            # Líder travada: desiste da espera e busca diretamente.
+            if not call[0].wait(self.wait_timeout):
+                with self._lock:
+                    self.timeouts += 1
+                logger.warning(f"SINGLE_FLIGHT → Líder de {key[0]} excedeu {self.wait_timeout}s; buscando diretamente")
+                return fn()
+
+            if call[2] is not None:
+                raise call[2]
+            return call[1]
+
+        # Líder: executa a busca e libera as seguidoras, com sucesso ou erro.
+        try:
+            call[1] = fn()
+            return call[1]
+        except Exception as e:
+            call[2] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call[0].set()
+
+    def stats(self) -> dict:
+        """
+        <docstrings> Retorna quantas buscas foram executadas (leaders), quantas reaproveitaram outra (shared)
+        e quantas desistiram de esperar uma líder travada (timeouts).
+        """
+        return {"leaders": self.leaders, "shared": self.shared, "timeouts": self.timeouts, "in_flight": len(self._calls)}
+
+
+# Coalescência compartilhada por todas as sessões do processo.
+_single_flight = SingleFlight()
+
+
+# 🧩 ESPECIFICAÇÃO DECLARATIVA DE FILTROS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Operadores aceitos em filtros {"coluna": {"operador": valor}} e o método correspondente do QueryBuilder.
+FILTER_OPERATORS = {
+    "eq": "eq",
+    "neq": "neq",
+    "gt": "gt",
+    "gte": "gte",
+    "lt": "lt",
+    "lte": "lte",
+    "in": "in_",
+    "like": "like",
+    "ilike": "ilike",
+    "is": "is_",
+}
+
+
+def _apply_filters(query, filters: dict):
+    """
+    <docstrings> Aplica uma especificação declarativa de filtros a uma query do PostgREST.
+
+    Formatos aceitos por coluna:
+        {"status": "active"}                                  → igualdade (eq)
+        {"status": ["active", "done"]}                        → pertence à lista (in)
+        {"deleted_at": None}                                  → nulo (is null)
+        {"created_at": {"gte": "2025-01-01", "lt": "2025-02-01"}} → operadores de FILTER_OPERATORS
+
+    Args:
+        query: QueryBuilder já com a projeção definida.
+        filters (dict): Especificação de filtros (combinados com AND).
+
+    Returns:
+        QueryBuilder: Query com os filtros aplicados.
+
+    Raises:
+        ValueError: Se um operador desconhecido for informado.
+    """
+
+    # Para cada coluna e sua condição...
+    for col, cond in filters.items():
+
+        # Condição com operadores explícitos.
+        if isinstance(cond, dict):
+            for op, val in cond.items():
+                if op not in FILTER_OPERATORS:
+                    raise ValueError(f"Operador de filtro desconhecido: '{op}' (coluna '{col}')")
+                query = getattr(query, FILTER_OPERATORS[op])(col, list(val) if op == "in" else val)
+
+        # Lista de valores aceitos.
+        elif isinstance(cond, (list, tuple, set)):
+            query = query.in_(col, list(cond))
+
+        # Valor nulo.
+        elif cond is None:
+            query = query.is_(col, "null")
+
+        # Igualdade simples.
+        else:
+            query = query.eq(col, cond)
+
+    return query
+
+
+def _apply_order(query, order: str | list[str] | None):
+    """
+    <docstrings> Aplica a ordenação informada à query. Prefixo "-" indica ordem decrescente.
+
+    Args:
+        query: QueryBuilder.
+        order (str | list[str] | None): Ex.: "-created_at" ou ["date", "-id"].
+
+    Returns:
+        QueryBuilder: Query ordenada.
+    """
+    if not order:
+        return query
+
+    for col in [order] if isinstance(order, str) else order:
+        query = query.order(col.lstrip("-"), desc=col.startswith("-"))
+
+    return query
 
 
 # 📤 CRUD DE BUSCAS ───────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
-@track_db_operation(
-    "📤 FETCH",
-    fallback=lambda *args, **kwargs: {}
-    if kwargs.get("single", False) else []
-)
+# Sentinela devolvida por _query_records (e por fetch_records com strict=True) quando a busca falha
+# (o erro já foi registrado pelo decorator). Permite distinguir uma falha de uma tabela vazia.
+FETCH_FAILED = object()
+
+
 def fetch_records(
     table_name: str,
     filters: dict | None = None,
     *,
     single: bool = False,
-    columns: str = "*"
+    columns: str = "*",
+    order: str | list[str] | None = None,
+    limit: int | None = None,
+    count: str | None = None,
+    cache: str | bool | None = None,
+    model: type | None = None,
+    strict: bool = False
 ) -> dict | list[dict]:
     """
-    <docstrings> Busca registros em qualquer tabela do Supabase.
+    <docstrings> Busca registros em qualquer tabela do Supabase, passando antes pelo cache de leitura.
+
+    Apenas as buscas que chegam ao servidor (_query_records) entram nas métricas e na contabilidade da
+    execução; acertos do cache são contados à parte. Buscas que falham não são cacheadas.
 
     Args:
         table_name (str): Nome da tabela.
-        filters (dict | None, optional): Filtros para otimizar a busca. Default = None.
+        filters (dict | None, optional): Especificação de filtros (ver _apply_filters). Default = None.
     
     Keyword-only:
         single (bool, optional): Se True, retorna um único registro. Default = False.
-        columns (str, optional): Colunas a selecionar. Default = "*".
+        columns (str, optional): Colunas a selecionar (projeção). Default = "*".
+        order (str | list[str] | None, optional): Ordenação; prefixo "-" para decrescente. Default = None.
+        limit (int | None, optional): Número máximo de registros. Default = None.
+        count (str | None, optional): "exact", "planned" ou "estimated". Se informado, o retorno passa a ser
+            {"data": list[dict], "count": int}. Default = None.
+        cache (str | bool | None, optional): Escopo do cache ("session" ou "global"), False para ignorá-lo
+            ou None para usar o padrão da tabela em CACHED_TABLES. Default = None.
+        model (type | None, optional): Modelo de services.models para decodificar os registros
+            (ex.: GoalProgress). O cache guarda os registros já decodificados. Default = None.
+        strict (bool, optional): Se True, uma falha devolve FETCH_FAILED em vez do retorno vazio, para que
+            o chamador distinga erro de ausência de registros. Default = False.
 
     Calls:
-        supabase.from_(): Seleciona o dataframe| instanciado por supabase.
-        .select(): Define as colunas de busca| instanciado por QueryBuilder.
-        .eq(): Adiciona filtro por coluna | instanciado por QueryBuilder.
-        .single(): Define que o retorno esperado é único | instanciado por QueryBuilder.
-        .execute(): Executa a query no servidor | instanciado por QueryBuilder.
+        _resolve_cache(): Escolhe o cache da busca | definida neste módulo.
+        RecordCache.get() / RecordCache.set(): Leitura e escrita no cache | definida neste módulo.
+        record_cache_hit(): Conta o acerto do cache nas métricas e na execução | definida em utils.metrics.
+        SingleFlight.do(): Coalesce buscas globais simultâneas | definida neste módulo.
+        _query_records(): Executa a busca no servidor | definida neste módulo.
     
     Returns:
-        dict | list[dict]: Registro único (dict) ou lista de registros. Fallback via decorator.
+        dict | list[dict]: Registro único (dict), lista de registros ou {"data", "count"}. Fallback vazio em caso de erro
+        (ou FETCH_FAILED, com strict=True).
+        Resultados cacheados são compartilhados: trate-os como somente leitura.
     
     """
     
     # Garante um dicionário vazio se nenhum filtro for informado.
     filters = filters or {}
 
+    # Resolve o cache aplicável (ou None, se a busca não for cacheável).
+    record_cache = _resolve_cache(table_name, cache)
+
+    # Agrupa os modificadores da busca.
+    options = {"single": single, "columns": columns, "order": order, "limit": limit, "count": count, "model": model}
+
+    # Se não houver cache, executa a busca diretamente.
+    if record_cache is None:
+        result = _query_records(table_name, filters, **options)
+        return _fetch_failure(single, count, strict) if result is FETCH_FAILED else result
+
+    # Monta a chave da busca e tenta respondê-la a partir do cache.
+    key = (table_name, _freeze(filters), columns, single, _freeze(order), limit, count, model)
+    cached = record_cache.get(key, table_name)
+
+    if cached is not _MISS:
+        record_cache_hit(table_name)
+        return cached
+
+    def load():
+        # Captura a geração antes da busca: um upsert concorrente invalida o resultado lido.
+        generation = _table_generation(table_name)
+        result = _query_records(table_name, filters, **options)
+
+        # Falha: não cacheia, para que a próxima leitura tente de novo.
+        if result is not FETCH_FAILED:
+            record_cache.set(key, table_name, generation, result)
+        return result
+
+    # No escopo global, buscas idênticas simultâneas (de qualquer sessão) compartilham uma única requisição.
+    # A falha é convertida só depois, pois quem aguarda a mesma busca pode ter pedido strict diferente.
+    result = _single_flight.do(key, load) if record_cache is _global_cache else load()
+    return _fetch_failure(single, count, strict) if result is FETCH_FAILED else result
+
+
+def _fetch_failure(single: bool, count: str | None, strict: bool):
+    """
+    <docstrings> Retorno de fetch_records em caso de erro: FETCH_FAILED (strict) ou o vazio na mesma forma do retorno normal.
+    """
+    if strict:
+        return FETCH_FAILED
+    if single:
+        return {}
+    return {"data": [], "count": 0} if count else []
+
+
+def _decode(result, model: type | None):
+    """
+    <docstrings> Decodifica o resultado de _query_records no modelo informado, preservando a forma do retorno.
+    """
+    if model is None:
+        return result
+    if isinstance(result, dict) and "count" in result and "data" in result:
+        return {"data": model.decode(result["data"]), "count": result["count"]}
+    return model.decode(result)
+
+
+@track_db_operation("📤 FETCH", fallback=FETCH_FAILED)
+def _query_records(
+    table_name: str,
+    filters: dict,
+    *,
+    single: bool,
+    columns: str,
+    order: str | list[str] | None = None,
+    limit: int | None = None,
+    count: str | None = None,
+    model: type | None = None
+) -> dict | list[dict]:
+    """
+    <docstrings> Executa a busca no Supabase, sem cache, e decodifica o resultado no modelo informado.
+
+    Args:
+        table_name (str): Nome da tabela.
+        filters (dict): Especificação de filtros.
+
+    Keyword-only:
+        single (bool): Se True, retorna um único registro.
+        columns (str): Colunas a selecionar.
+        order (str | list[str] | None): Ordenação.
+        limit (int | None): Número máximo de registros.
+        count (str | None): Modo de contagem do PostgREST.
+        model (type | None): Modelo de services.models para decodificar os registros.
+
+    Calls:
+        get_client().from_(): Seleciona o dataframe| instanciado por get_client().
+        .select(): Define as colunas de busca| instanciado por QueryBuilder.
+        _apply_filters(): Aplica os filtros declarativos | definida neste módulo.
+        _apply_order(): Aplica a ordenação | definida neste módulo.
+        .limit(): Limita o número de registros | instanciado por QueryBuilder.
+        .single(): Define que o retorno esperado é único | instanciado por QueryBuilder.
+        .execute(): Executa a query no servidor | instanciado por QueryBuilder.
+        _decode(): Decodifica os registros no modelo | definida neste módulo.
+
+    Returns:
+        dict | list[dict]: Registro único (dict), lista de registros ou {"data", "count"}.
+            FETCH_FAILED em caso de erro (via decorator).
+
+    """
+
     # Inicia a query sobre a tabela informada, selecionando as colunas desejadas.
-    query = supabase.from_(table_name).select(columns)
+    query = get_client().from_(table_name).select(columns, count=count)
     
-    # Para cada par coluna:valor fornecido nos filtros...
-    for col, val in filters.items():
-        query = query.eq(col, val) # ⬅ Adiciona um critério de igualdade à query.
+    # Aplica filtros, ordenação e limite.
+    query = _apply_filters(query, filters)
+    query = _apply_order(query, order)
+
+    if limit is not None:
+        query = query.limit(limit)
 
     # Se apenas um resultado for solicitado...
     if single:
         
         # Tenta executar a operação principal...
         try:
-            response = query.single().execute() # ⬅ Adiciona .single() à query e executa.
-            return response.data or {}          # ⬅ Retorna o resultado da busca ou dicionário vazio como fallback.
+            response = query.single().execute()            # ⬅ Adiciona .single() à query e executa.
+            return _decode(response.data or {}, model)     # ⬅ Retorna o resultado da busca ou dicionário vazio como fallback.
         
         # Na exceção...
         except APIError as e:
@@ -129,11 +984,252 @@ def fetch_records(
     
     # Executa a query.
     response = query.execute()
+
+    # Se a contagem foi solicitada, retorna dados e total juntos.
+    if count:
+        return _decode({"data": response.data or [], "count": response.count or 0}, model)
     
     # Retorna o resultado da busca ou uma lista vazia como fallback (Single = False).
-    return response.data or []
+    return _decode(response.data or [], model)
   
 
+# 🔢 CRUD DE CONTAGEM E EXISTÊNCIA ───────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+@track_db_operation("🔢 COUNT", fallback=None)
+def count_records(table_name: str, filters: dict | None = None, *, count: str = "exact") -> int | None:
+    """
+    <docstrings> Conta registros no servidor, sem transferir linhas (requisição HEAD com contagem).
+
+    Args:
+        table_name (str): Nome da tabela.
+        filters (dict | None, optional): Especificação de filtros (ver _apply_filters). Default = None.
+
+    Keyword-only:
+        count (str, optional): "exact", "planned" ou "estimated". Default = "exact".
+
+    Calls:
+        get_client().from_(): Seleciona a tabela | instanciado por get_client().
+        .select(): Requisição HEAD com contagem | instanciado por QueryBuilder.
+        _apply_filters(): Aplica os filtros declarativos | definida neste módulo.
+        .execute(): Executa a query no servidor | instanciado por QueryBuilder.
+
+    Returns:
+        int | None: Número de registros, ou None em caso de erro (via decorator).
+
+    """
+    query = get_client().from_(table_name).select("*", count=count, head=True)
+    query = _apply_filters(query, filters or {})
+    return query.execute().count or 0
+
+
+def exists(table_name: str, filters: dict | None = None) -> bool | None:
+    """
+    <docstrings> Verifica se há ao menos um registro que satisfaça os filtros, sem transferir linhas.
+
+    Args:
+        table_name (str): Nome da tabela.
+        filters (dict | None, optional): Especificação de filtros (ver _apply_filters). Default = None.
+
+    Calls:
+        count_records(): Contagem via requisição HEAD | definida neste módulo.
+
+    Returns:
+        bool | None: True se existir, False se não existir, None se a contagem falhar.
+
+    """
+    total = count_records(table_name, filters)
+    return None if total is None else total > 0
+
+
+# 🛰️ CHAMADA DE FUNÇÕES DO BANCO (RPC) ───────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+@track_db_operation("🛰️ RPC", fallback=None)
+def call_rpc(function_name: str, params: dict | None = None):
+    """
+    <docstrings> Executa uma função do banco exposta pelo PostgREST (ex.: bootstrap_session) em uma única requisição.
+
+    Args:
+        function_name (str): Nome da função no schema público.
+        params (dict | None, optional): Argumentos nomeados da função. Default = None.
+
+    Calls:
+        get_client().rpc(): Monta a chamada da função | instanciado por get_client().
+        .execute(): Executa a chamada no servidor | instanciado por FilterRequestBuilder.
+
+    Returns:
+        any: Retorno da função (já decodificado do JSON), ou None em caso de erro (via decorator),
+            inclusive quando a função não existir no banco.
+
+    """
+    return get_client().rpc(function_name, params or {}).execute().data
+
+
+# 📜 CRUD DE BUSCAS PAGINADAS (STREAMING) ─────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Quantidade padrão de registros por página em buscas paginadas.
+PAGE_SIZE = 500
+
+def iter_records(
+    table_name: str,
+    filters: dict | None = None,
+    *,
+    order_by: str = "id",
+    key: str | None = "id",
+    page_size: int = PAGE_SIZE,
+    columns: str = "*",
+    pages: bool = False
+):
+    """
+    <docstrings> Percorre uma tabela em páginas, buscando cada página sob demanda (generator).
+
+    Por padrão usa paginação por chave (keyset): cada página começa depois da última linha lida,
+    ordenando por `order_by` (nulos por último) e desempatando pela coluna única e não nula `key`.
+    Com key=None, usa paginação por intervalo (range/offset), útil apenas para tabelas sem coluna única
+    e ordenadas por uma coluna sem repetições (offset sobre valores repetidos pode duplicar ou pular linhas).
+
+    Args:
+        table_name (str): Nome da tabela.
+        filters (dict | None, optional): Especificação de filtros (ver _apply_filters). Default = None.
+
+    Keyword-only:
+        order_by (str, optional): Coluna de ordenação. Default = "id".
+        key (str | None, optional): Coluna única usada como cursor e desempate. Default = "id".
+        page_size (int, optional): Registros por requisição. Default = PAGE_SIZE.
+        columns (str, optional): Colunas a selecionar. Default = "*".
+        pages (bool, optional): Se True, produz listas (páginas) em vez de registros. Default = False.
+
+    Calls:
+        _fetch_page(): Busca uma página no servidor | definida neste módulo.
+        logger.error(): Registra a interrupção da leitura | instanciado por logger.
+
+    Yields:
+        dict | list[dict]: Registros (ou páginas de registros) na ordem definida.
+
+    """
+
+    filters = filters or {}
+    page_size = max(int(page_size), 1)
+
+    # Garante que as colunas de cursor estejam na projeção.
+    if columns != "*":
+        extra = [c for c in (order_by, key) if c and c not in columns.split(",")]
+        columns = ",".join([columns, *extra]) if extra else columns
+
+    cursor = None  # ⬅ Última linha lida (modo keyset).
+    offset = 0     # ⬅ Posição da próxima página (modo range).
+
+    while True:
+        page = _fetch_page(
+            table_name, filters,
+            order_by=order_by, key=key, cursor=cursor, offset=offset,
+            page_size=page_size, columns=columns
+        )
+
+        # Se a página falhar, interrompe a leitura explicitamente (o decorator já registrou o erro).
+        if page is None:
+            logger.error(f"FETCH → Leitura paginada de '{table_name}' interrompida após {offset} registro(s)")
+            return
+
+        if page:
+            if pages:
+                yield page
+            else:
+                yield from page
+
+        # Página incompleta significa fim da tabela.
+        if len(page) < page_size:
+            return
+
+        offset += len(page)
+        cursor = page[-1]
+
+
+@track_db_operation("📜 FETCH PAGE", fallback=None)
+def _fetch_page(
+    table_name: str,
+    filters: dict,
+    *,
+    order_by: str,
+    key: str | None,
+    cursor: dict | None,
+    offset: int,
+    page_size: int,
+    columns: str
+) -> list[dict]:
+    """
+    <docstrings> Busca uma única página de registros para iter_records().
+
+    Calls:
+        get_client().from_(): Seleciona a tabela | instanciado por get_client().
+        _apply_filters(): Aplica os filtros declarativos | definida neste módulo.
+        .select() / .order(): Monta a query | instanciado por QueryBuilder.
+        .gt() / .or_(): Filtros de cursor no modo keyset | instanciado por QueryBuilder.
+        .limit() / .range(): Delimita a página | instanciado por QueryBuilder.
+        .execute(): Executa a query | instanciado por QueryBuilder.
+
+    Returns:
+        list[dict]: Registros da página. Fallback None via decorator.
+    """
+
+    query = _apply_filters(get_client().from_(table_name).select(columns), filters)
+
+    # 🔑 MODO KEYSET ─────────────────────────────────────────────────────────────
+    if key:
+
+        # Após a primeira página, continua a partir da última linha lida.
+        if cursor is not None:
+            if order_by == key:
+                query = query.gt(key, cursor[key])
+            else:
+                query = query.or_(_keyset_condition(order_by, key, cursor))
+
+        query = query.order(order_by)
+        if order_by != key:
+            query = query.order(key)
+
+        return query.limit(page_size).execute().data or []
+
+    # 📏 MODO RANGE ─────────────────────────────────────────────────────────────
+    return query.order(order_by).range(offset, offset + page_size - 1).execute().data or []
+
+
+def _quote_filter_value(value) -> str:
+    """
+    <docstrings> Cita um valor para expressões lógicas do PostgREST (or/and), escapando aspas e barras invertidas.
+    """
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def _keyset_condition(order_by: str, key: str, cursor: dict) -> str:
+    """
+    <docstrings> Monta a condição "depois do cursor" para a ordenação (order_by ASC NULLS LAST, key ASC).
+
+    Args:
+        order_by (str): Coluna de ordenação (pode ter valores nulos e repetidos).
+        key (str): Coluna única e não nula usada como desempate.
+        cursor (dict): Última linha lida.
+
+    Returns:
+        str: Expressão para QueryBuilder.or_().
+
+    Raises:
+        ValueError: Se a linha do cursor não tiver valor na coluna `key`.
+    """
+    if cursor.get(key) is None:
+        raise ValueError(f"Paginação por chave exige '{key}' não nulo (tabela ordenada por '{order_by}')")
+
+    last_key = _quote_filter_value(cursor[key])
+
+    # Cursor entre os nulos (que vêm por último): restam apenas os nulos com chave maior.
+    if cursor.get(order_by) is None:
+        return f"and({order_by}.is.null,{key}.gt.{last_key})"
+
+    # Cursor não nulo: valores maiores, empates com chave maior e todos os nulos.
+    last_order = _quote_filter_value(cursor[order_by])
+    return f"{order_by}.gt.{last_order},and({order_by}.eq.{last_order},{key}.gt.{last_key}),{order_by}.is.null"
+
+
 # 📥 CRUD DE CRIAÇÃO E ATUALIZAÇÃO (UPSERT) ────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
 @track_db_operation(
@@ -160,9 +1256,10 @@ def upsert_record(
         returning (bool, optional): Se True, retorna dados afetados. Default = True.
 
     Calls:
-        supabase.from_(): Seleciona tabela | instanciado por supabase.
+        get_client().from_(): Seleciona tabela | instanciado por get_client().
         .upsert(): Prepara comando de inserção ou atualização | instanciado por QueryBuilder.
         .execute(): Executa a query | instanciado por QueryBuilder.
+        invalidate_table(): Invalida o cache de leitura da tabela | definida neste módulo.
     
     Returns:
         dict | list[dict]: Registro ou lista. Fallback de execução via decorator.
@@ -170,11 +1267,14 @@ def upsert_record(
     """
 
     # Prepara a operação de upsert com os dados e conflito opcional.
-    query = supabase.from_(table_name).upsert(payload, on_conflict=on_conflict)
+    query = get_client().from_(table_name).upsert(payload, on_conflict=on_conflict)
 
     # Executa a operação no servidor.
     response = query.execute()
 
+    # Invalida as buscas cacheadas da tabela alterada.
+    invalidate_table(table_name)
+
     # Garante um valor default se não houver retorno.
     data = response.data or []
     
@@ -188,3 +1288,96 @@ def upsert_record(
     
     # Retorna a lista completa dos dados afetados.
     return data
+
+
+# 📦 CRUD DE CRIAÇÃO E ATUALIZAÇÃO EM LOTE (BULK UPSERT) ────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Quantidade padrão de registros enviados por requisição em upserts em lote.
+BULK_BATCH_SIZE = 500
+
+@track_db_operation(
+    "📦 BULK UPSERT",
+    fallback=lambda *args, **kwargs: []
+)
+def upsert_records(
+    table_name: str,
+    payloads: list[dict],
+    *,
+    on_conflict: str | None = None,
+    returning: bool = True,
+    batch_size: int = BULK_BATCH_SIZE
+) -> list[dict]:
+    """
+    <docstrings> Insere ou atualiza vários registros em lotes, com uma requisição por lote.
+
+    Args:
+        table_name (str): Nome da tabela.
+        payloads (list[dict]): Registros a inserir ou atualizar.
+
+    Keyword-only:
+        on_conflict (str | None, optional): Coluna(s) para resolução de conflitos. Default = None.
+        returning (bool, optional): Se True, inclui os registros afetados no relatório. Default = True.
+        batch_size (int, optional): Quantidade máxima de registros por requisição. Default = BULK_BATCH_SIZE.
+
+    Calls:
+        get_client().from_(): Seleciona tabela | instanciado por get_client().
+        .upsert(): Prepara comando de inserção ou atualização | instanciado por QueryBuilder.
+        .execute(): Executa a query | instanciado por QueryBuilder.
+        invalidate_table(): Invalida o cache de leitura da tabela | definida neste módulo.
+        logger.exception(): Registra a falha de um lote com stacktrace | instanciado por logger.
+
+    Returns:
+        list[dict]: Um relatório por lote no formato
+            {"chunk": int, "start": int, "end": int, "rows": int, "ok": bool, "data": list[dict], "error": str | None},
+            em que payloads[start:end] são os registros enviados no lote. Fallback de execução via decorator.
+
+    """
+
+    # Garante um tamanho de lote válido.
+    batch_size = max(int(batch_size), 1)
+
+    # Sem retorno solicitado, pede ao PostgREST uma resposta mínima (sem corpo).
+    return_method = ReturnMethod.representation if returning else ReturnMethod.minimal
+
+    reports = []
+
+    # Para cada fatia de até batch_size registros...
+    for chunk, start in enumerate(range(0, len(payloads), batch_size)):
+        rows = payloads[start:start + batch_size]
+
+        # Tenta enviar o lote em uma única requisição...
+        try:
+            response = get_client().from_(table_name).upsert(
+                rows,
+                on_conflict=on_conflict or "",
+                returning=return_method
+            ).execute()
+
+            reports.append({
+                "chunk": chunk,
+                "start": start,
+                "end": start + len(rows),
+                "rows": len(rows),
+                "ok": True,
+                "data": (response.data or []) if returning else [],
+                "error": None
+            })
+
+        # Se o lote falhar, registra a falha e segue para o próximo.
+        except Exception as e:
+            logger.exception(f"BULK UPSERT → Falha no lote {chunk} de '{table_name}' ({len(rows)} registros)")
+            reports.append({
+                "chunk": chunk,
+                "start": start,
+                "end": start + len(rows),
+                "rows": len(rows),
+                "ok": False,
+                "data": [],
+                "error": getattr(e, "message", "") or str(e)
+            })
+
+    # Se algum lote foi gravado, invalida as buscas cacheadas da tabela.
+    if any(report["ok"] for report in reports):
+        invalidate_table(table_name)
+
+    return reports
@@ -0,0 +1,540 @@
+
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import os
+import re
+import json
+import uuid
+import logging
+import threading
+
+from types                import SimpleNamespace
+from datetime             import datetime, timezone
+from postgrest.exceptions import APIError
+
+
+# 👨‍💻 LOGGER ESPECÍFICO PARA O MÓDULO ATUAL ──────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+logger = logging.getLogger(__name__)
+
+
+# 🗄️ ARMAZENAMENTO EM MEMÓRIA ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+class FakeStore:
+    """
+    <docstrings> Tabelas e usuários em memória, compartilhados por todos os clients falsos do processo.
+
+    """
+
+    def __init__(self):
+        """
+        <docstrings> Método construtor de classe.
+
+        Attributes:
+            tables (dict[str, list[dict]]): Linhas de cada tabela.
+            users (dict[str, dict]): Usuários de autenticação indexados por email.
+            lock (threading.RLock): Lock para acesso concorrente entre sessões.
+
+        """
+        self.tables: dict[str, list[dict]] = {}
+        self.users: dict[str, dict] = {}
+        self.lock = threading.RLock()
+
+    def seed(self, tables: dict | None = None, users: list[dict] | None = None) -> None:
+        """
+        <docstrings> Carrega linhas e usuários no armazenamento, substituindo tabelas homônimas.
+
+        Args:
+            tables (dict[str, list[dict]] | None): Linhas por tabela.
+            users (list[dict] | None): Usuários com email, password, id (opcional) e user_metadata (opcional).
+        """
+        with self.lock:
+            for name, rows in (tables or {}).items():
+                self.tables[name] = [dict(row) for row in rows]
+
+            for user in users or []:
+                self.users[user["email"]] = {
+                    "id": user.get("id") or str(uuid.uuid4()),
+                    "email": user["email"],
+                    "password": user.get("password", ""),
+                    "user_metadata": user.get("user_metadata", {}),
+                }
+
+    def load_file(self, path: str) -> None:
+        """
+        <docstrings> Carrega um arquivo JSON no formato {"tables": {...}, "users": [...]}.
+
+        Args:
+            path (str): Caminho do arquivo de seed.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.seed(data.get("tables"), data.get("users"))
+        logger.debug(f"FAKE → Seed carregado de {path}")
+
+    def reset(self) -> None:
+        """
+        <docstrings> Remove todas as tabelas e usuários.
+        """
+        with self.lock:
+            self.tables.clear()
+            self.users.clear()
+
+
+# Armazenamento único do processo.
+_store = FakeStore()
+
+# Carrega o seed configurado, se houver.
+if os.getenv("ABAETE_FAKE_SEED"):
+    _store.load_file(os.environ["ABAETE_FAKE_SEED"])
+
+
+def get_fake_store() -> FakeStore:
+    """
+    <docstrings> Retorna o armazenamento em memória do processo (para seeds em benchmarks e scripts).
+    """
+    return _store
+
+
+# 🔍 AVALIAÇÃO DE FILTROS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def _coerce(stored, value):
+    """
+    <docstrings> Converte o valor do filtro para o tipo do valor armazenado, como o PostgreSQL faria.
+    """
+    if stored is None or value is None or isinstance(stored, str) or not isinstance(value, str):
+        return value
+    try:
+        if isinstance(stored, bool):
+            return value.lower() == "true"
+        return type(stored)(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _like(stored, pattern: str, flags: int = 0) -> bool:
+    """
+    <docstrings> Avalia LIKE/ILIKE com os curingas % e _ (ou * na sintaxe do PostgREST).
+    """
+    if stored is None:
+        return False
+    regex = "".join(".*" if c in "%*" else "." if c == "_" else re.escape(c) for c in pattern)
+    return re.fullmatch(regex, str(stored), flags) is not None
+
+
+def _is(stored, value) -> bool:
+    """
+    <docstrings> Avalia IS null/true/false.
+    """
+    value = str(value).lower()
+    if value == "null":
+        return stored is None
+    return stored is (value == "true")
+
+
+def _compare(op: str, stored, value) -> bool:
+    """
+    <docstrings> Compara um valor armazenado com o valor do filtro segundo o operador do PostgREST.
+    """
+    if op == "is":
+        return _is(stored, value)
+    if op == "in":
+        return stored in [_coerce(stored, v) for v in value]
+    if op == "like":
+        return _like(stored, value)
+    if op == "ilike":
+        return _like(stored, value, re.IGNORECASE)
+
+    value = _coerce(stored, value)
+    if op == "eq":
+        return stored == value
+    if op == "neq":
+        return stored != value
+    if stored is None or value is None:
+        return False
+    try:
+        return {"gt": stored > value, "gte": stored >= value, "lt": stored < value, "lte": stored <= value}[op]
+    except TypeError:
+        return False
+
+
+def _split_top_level(text: str) -> list[str]:
+    """
+    <docstrings> Divide uma expressão lógica do PostgREST nas vírgulas de nível superior.
+    """
+    parts, depth, quoted, escaped, current = [], 0, False, False, ""
+    for c in text:
+        if escaped:
+            escaped = False
+        elif quoted and c == "\\":
+            escaped = True
+        elif c == '"':
+            quoted = not quoted
+        elif not quoted and c == "(":
+            depth += 1
+        elif not quoted and c == ")":
+            depth -= 1
+        elif not quoted and c == "," and depth == 0:
+            parts.append(current)
+            current = ""
+            continue
+        current += c
+    parts.append(current)
+    return [p for p in parts if p]
+
+
+def _unquote(value: str) -> str:
+    """
+    <docstrings> Remove as aspas de um valor citado do PostgREST, desfazendo os escapes com barra invertida.
+    """
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return re.sub(r"\\(.)", r"\1", value[1:-1])
+    return value
+
+
+def _parse_logic(expression: str, conjunction: str = "or"):
+    """
+    <docstrings> Converte uma expressão como `a.gt.1,and(a.eq.1,b.gt.2)` em um predicado sobre linhas.
+    """
+    predicates = []
+
+    for part in _split_top_level(expression):
+
+        # Grupo aninhado and(...) / or(...).
+        match = re.fullmatch(r"(and|or)\((.*)\)", part)
+        if match:
+            predicates.append(_parse_logic(match.group(2), match.group(1)))
+            continue
+
+        # Condição simples coluna.operador.valor.
+        col, op, value = part.split(".", 2)
+        if op == "in":
+            value = [_unquote(v) for v in _split_top_level(value.strip("()"))]
+        else:
+            value = _unquote(value)
+        predicates.append(lambda row, c=col, o=op, v=value: _compare(o, row.get(c), v))
+
+    combine = any if conjunction == "or" else all
+    return lambda row: combine(p(row) for p in predicates)
+
+
+# 📡 QUERY BUILDER FALSO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+class FakeResponse:
+    """
+    <docstrings> Resposta no formato de APIResponse do postgrest-py (atributos data e count).
+    """
+
+    def __init__(self, data, count: int | None = None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    """
+    <docstrings> Subconjunto do QueryBuilder do postgrest-py usado pelo backend, avaliado sobre o FakeStore.
+
+    """
+
+    def __init__(self, store: FakeStore, table_name: str):
+        """
+        <docstrings> Método construtor de classe.
+
+        Args:
+            store (FakeStore): Armazenamento em memória.
+            table_name (str): Nome da tabela.
+
+        """
+        self.store = store
+        self.table_name = table_name
+        self._columns = "*"
+        self._count = None
+        self._head = False
+        self._predicates = []
+        self._order = []
+        self._limit = None
+        self._offset = 0
+        self._single = False
+        self._upsert = None
+
+    # 🔎 PROJEÇÃO E CONTAGEM ─────────────────────────────────────────────────
+
+    def select(self, *columns: str, count=None, head=None):
+        self._columns = ",".join(columns) or "*"
+        self._count = count
+        self._head = bool(head)
+        return self
+
+    # 🧩 FILTROS ─────────────────────────────────────────────────────────────
+
+    def _filter(self, op: str, column: str, value):
+        self._predicates.append(lambda row: _compare(op, row.get(column), value))
+        return self
+
+    def eq(self, column, value):     return self._filter("eq", column, value)
+    def neq(self, column, value):    return self._filter("neq", column, value)
+    def gt(self, column, value):     return self._filter("gt", column, value)
+    def gte(self, column, value):    return self._filter("gte", column, value)
+    def lt(self, column, value):     return self._filter("lt", column, value)
+    def lte(self, column, value):    return self._filter("lte", column, value)
+    def in_(self, column, values):   return self._filter("in", column, list(values))
+    def like(self, column, pattern): return self._filter("like", column, pattern)
+    def ilike(self, column, pattern): return self._filter("ilike", column, pattern)
+    def is_(self, column, value):    return self._filter("is", column, value)
+
+    def or_(self, filters: str, reference_table=None):
+        self._predicates.append(_parse_logic(filters))
+        return self
+
+    # 📏 ORDENAÇÃO E PAGINAÇÃO ───────────────────────────────────────────────
+
+    def order(self, column: str, *, desc: bool = False, nullsfirst: bool = False, foreign_table=None):
+        self._order.append((column, desc))
+        return self
+
+    def limit(self, size: int, *, foreign_table=None):
+        self._limit = size
+        return self
+
+    def range(self, start: int, end: int, foreign_table=None):
+        self._offset = start
+        self._limit = end - start + 1
+        return self
+
+    def single(self):
+        self._single = True
+        return self
+
+    def maybe_single(self):
+        return self.single()
+
+    # 📥 ESCRITA ─────────────────────────────────────────────────────────────
+
+    def upsert(self, json_data, *, count=None, returning=None, ignore_duplicates: bool = False, on_conflict: str = "", default_to_null: bool = True):
+        self._upsert = {
+            "rows": json_data if isinstance(json_data, list) else [json_data],
+            "on_conflict": [c.strip() for c in (on_conflict or "id").split(",") if c.strip()],
+            "minimal": getattr(returning, "value", returning) == "minimal",
+            "ignore_duplicates": ignore_duplicates,
+        }
+        return self
+
+    # 🚀 EXECUÇÃO ────────────────────────────────────────────────────────────
+
+    def execute(self) -> FakeResponse:
+        """
+        <docstrings> Executa a operação montada sobre o armazenamento em memória.
+
+        Returns:
+            FakeResponse: Dados (cópias) e contagem, como no postgrest-py.
+
+        Raises:
+            APIError: Em single() sem exatamente uma linha, como o PostgREST (PGRST116).
+        """
+        with self.store.lock:
+            if self._upsert is not None:
+                return self._execute_upsert()
+            return self._execute_select()
+
+    def _execute_select(self) -> FakeResponse:
+        rows = [row for row in self.store.tables.get(self.table_name, []) if all(p(row) for p in self._predicates)]
+        total = len(rows)
+
+        # Ordena do critério menos para o mais significativo (sort estável); nulos por último.
+        for column, desc in reversed(self._order):
+            present = [r for r in rows if r.get(column) is not None]
+            missing = [r for r in rows if r.get(column) is None]
+            rows = sorted(present, key=lambda r: r[column], reverse=desc) + missing
+
+        end = None if self._limit is None else self._offset + self._limit
+        rows = rows[self._offset:end]
+
+        data = [] if self._head else [self._project(row) for row in rows]
+
+        if self._single:
+            if len(data) != 1:
+                raise APIError({
+                    "message": "JSON object requested, multiple (or no) rows returned",
+                    "code": "PGRST116",
+                    "details": f"The result contains {len(data)} rows",
+                    "hint": None,
+                })
+            return FakeResponse(data[0], total if self._count else None)
+
+        return FakeResponse(data, total if self._count else None)
+
+    def _execute_upsert(self) -> FakeResponse:
+        table = self.store.tables.setdefault(self.table_name, [])
+        keys = self._upsert["on_conflict"]
+        affected = []
+
+        for payload in self._upsert["rows"]:
+            existing = None
+            if all(k in payload for k in keys):
+                existing = next((r for r in table if all(r.get(k) == payload[k] for k in keys)), None)
+
+            # Conflito: atualiza a linha existente (ou ignora, se solicitado).
+            if existing is not None:
+                if not self._upsert["ignore_duplicates"]:
+                    existing.update(payload)
+                    affected.append(existing)
+                continue
+
+            # Sem conflito: insere com os defaults de id e created_at.
+            row = {"id": str(uuid.uuid4()), "created_at": datetime.now(timezone.utc).isoformat(), **payload}
+            table.append(row)
+            affected.append(row)
+
+        data = [] if self._upsert["minimal"] else [dict(row) for row in affected]
+        return FakeResponse(data, None)
+
+    def _project(self, row: dict) -> dict:
+        if self._columns.strip() == "*":
+            return dict(row)
+        return {c: row.get(c) for c in (c.strip() for c in self._columns.split(",")) if c}
+
+
+# 🛰️ FUNÇÕES DO BANCO (RPC) FALSAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def _rpc_bootstrap_session(store: FakeStore, params: dict) -> dict:
+    """
+    <docstrings> Equivalente local de public.bootstrap_session (ver .documentation/bootstrap_session.sql).
+    """
+    user_id = params.get("p_user_id")
+    tables = store.tables
+
+    user_profile = next((dict(r) for r in tables.get("user_profile", []) if r.get("auth_user_id") == user_id), None)
+    professional_profile = next((dict(r) for r in tables.get("professional_profile", []) if r.get("auth_user_id") == user_id), None)
+
+    role = "professional" if professional_profile and professional_profile.get("professional_status") is True else "patient"
+    role_field = f"{role}_id"
+
+    return {
+        "user_profile": user_profile,
+        "professional_profile": professional_profile,
+        "role": role,
+        "links": [dict(r) for r in tables.get("links", []) if r.get(role_field) == user_id],
+    }
+
+
+# Funções disponíveis via FakeClient.rpc().
+_RPC_FUNCTIONS = {
+    "bootstrap_session": _rpc_bootstrap_session,
+}
+
+
+class FakeRpc:
+    """
+    <docstrings> Chamada de função do banco (rpc) avaliada sobre o FakeStore.
+
+    """
+
+    def __init__(self, store: FakeStore, function_name: str, params: dict):
+        self.store = store
+        self.function_name = function_name
+        self.params = params
+
+    def execute(self) -> FakeResponse:
+        """
+        <docstrings> Executa a função registrada em _RPC_FUNCTIONS.
+
+        Raises:
+            APIError: Se a função não existir, como o PostgREST (PGRST202).
+        """
+        function = _RPC_FUNCTIONS.get(self.function_name)
+        if function is None:
+            raise APIError({
+                "message": f"Could not find the function public.{self.function_name} in the schema cache",
+                "code": "PGRST202",
+                "details": None,
+                "hint": None,
+            })
+        with self.store.lock:
+            return FakeResponse(function(self.store, self.params))
+
+
+# 🔑 AUTENTICAÇÃO FALSA ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+class FakeAuth:
+    """
+    <docstrings> Subconjunto do cliente de autenticação (gotrue) usado pelo app: login, cadastro, logout e reset.
+
+    """
+
+    def __init__(self, store: FakeStore):
+        self.store = store
+        self._session = None
+
+    def _make_session(self, user: dict) -> SimpleNamespace:
+        user_obj = SimpleNamespace(id=user["id"], email=user["email"], user_metadata=dict(user["user_metadata"]))
+        return SimpleNamespace(
+            user=user_obj,
+            access_token=f"fake-access-{user['id']}",
+            refresh_token=f"fake-refresh-{user['id']}",
+        )
+
+    def sign_in_with_password(self, credentials: dict) -> SimpleNamespace:
+        with self.store.lock:
+            user = self.store.users.get(credentials.get("email"))
+        if not user or user["password"] != credentials.get("password"):
+            raise Exception("Invalid login credentials")
+        self._session = self._make_session(user)
+        return SimpleNamespace(user=self._session.user, session=self._session)
+
+    def sign_up(self, credentials: dict) -> SimpleNamespace:
+        with self.store.lock:
+            if credentials["email"] in self.store.users:
+                raise Exception("User already registered")
+            self.store.seed(users=[{
+                "email": credentials["email"],
+                "password": credentials["password"],
+                "user_metadata": credentials.get("options", {}).get("data", {}),
+            }])
+            user = self.store.users[credentials["email"]]
+        session = self._make_session(user)
+        return SimpleNamespace(user=session.user, session=None)
+
+    def sign_out(self, options: dict | None = None) -> None:
+        self._session = None
+
+    def reset_password_email(self, email: str, options: dict | None = None, redirect_to: str | None = None) -> None:
+        logger.debug(f"FAKE → Email de redefinição simulado para {email}")
+
+    def get_session(self):
+        return self._session
+
+    def set_session(self, access_token: str, refresh_token: str):
+        user_id = access_token.removeprefix("fake-access-")
+        with self.store.lock:
+            user = next((u for u in self.store.users.values() if u["id"] == user_id), None)
+        self._session = self._make_session(user) if user else None
+        return self._session
+
+
+# 🧪 CLIENT FALSO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+class FakeClient:
+    """
+    <docstrings> Substituto local do supabase.Client, com as mesmas entradas usadas pelo app (from_, table, rpc, auth).
+
+    """
+
+    def __init__(self, store: FakeStore | None = None):
+        """
+        <docstrings> Método construtor de classe.
+
+        Args:
+            store (FakeStore | None): Armazenamento a usar. Default = armazenamento do processo.
+
+        """
+        self.store = store or _store
+        self.auth = FakeAuth(self.store)
+
+    def from_(self, table_name: str) -> FakeQuery:
+        return FakeQuery(self.store, table_name)
+
+    def table(self, table_name: str) -> FakeQuery:
+        return self.from_(table_name)
+
+    def rpc(self, function_name: str, params: dict | None = None) -> FakeRpc:
+        return FakeRpc(self.store, function_name, params or {})
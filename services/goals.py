@@ -5,6 +5,7 @@
 import logging
 
 from services.backend import upsert_record, fetch_records
+from services.models  import Goal
 from frameworks.sm    import StateMachine
 
 
@@ -38,7 +39,8 @@ def load_goals_by_link_id(link_id: str, auth_machine: StateMachine) -> None:
     # Executa a busca na tabela goals.
     goals = fetch_records(
         table_name="goals",
-        filters={"link_id": link_id}
+        filters={"link_id": link_id},
+        model=Goal
     )
 
     # Loga a quantidade de metas encontradas.
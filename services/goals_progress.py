@@ -4,8 +4,10 @@
 
 import logging
 
-from services.backend import upsert_record, fetch_records
-from frameworks.sm    import StateMachine
+from services.backend     import fetch_records
+from services.write_behind import enqueue_upsert, overlay_pending
+from services.models       import GoalProgress
+from frameworks.sm         import StateMachine
 
 
 # 👨‍💻 LOGGER ESPECÍFICO PARA O MÓDULO ATUAL ──────────────────────────────────────────────────────────────────────────────────────────────────────────────
@@ -26,6 +28,8 @@ def load_goal_progress(goal_id: str = None, link_id: str = None, auth_machine: S
 
     Calls:
         fetch_records(): Busca progresso na tabela `goal_progress` | definida em services.backend.py.
+        overlay_pending(): Aplica progressos ainda na fila de escrita | definida em services.write_behind.py.
+        auth_machine.limit_namespace(): Limita a memória do namespace de progresso | instanciado por StateMachine.
         auth_machine.set_variable(): Armazena os dados no escopo do StateMachine.
 
     Returns:
@@ -36,10 +40,14 @@ def load_goal_progress(goal_id: str = None, link_id: str = None, auth_machine: S
         logger.warning("GOAL_PROGRESS → auth_machine não fornecida.")
         return
 
+    # Progresso é recarregado a cada renderização: limita a memória do namespace na sessão (LRU).
+    auth_machine.limit_namespace("goal_progress")
+
     try:
         if link_id:
             logger.debug(f"GOAL_PROGRESS → Buscando progresso de todas as metas do link {link_id}")
-            progresso = fetch_records("goal_progress", filters={"link_id": link_id})
+            progresso = fetch_records("goal_progress", filters={"link_id": link_id}, model=GoalProgress)
+            progresso = GoalProgress.decode(overlay_pending(progresso, "goal_progress", {"link_id": link_id}, ["goal_id", "date"]))
 
             # Organiza por goal_id
             agrupado = {}
@@ -56,7 +64,8 @@ def load_goal_progress(goal_id: str = None, link_id: str = None, auth_machine: S
 
         elif goal_id:
             logger.debug(f"GOAL_PROGRESS → Buscando progresso da meta {goal_id}")
-            progresso = fetch_records("goal_progress", filters={"goal_id": goal_id})
+            progresso = fetch_records("goal_progress", filters={"goal_id": goal_id}, model=GoalProgress)
+            progresso = GoalProgress.decode(overlay_pending(progresso, "goal_progress", {"goal_id": goal_id}, ["goal_id", "date"]))
             auth_machine.set_variable(f"goal_progress__{goal_id}", progresso)
             logger.debug(f"GOAL_PROGRESS → {len(progresso)} registro(s) encontrado(s) para {goal_id}")
 
@@ -70,30 +79,31 @@ def save_goal_progress(data: dict) -> bool:
     """
     <docstrings> Insere ou atualiza um registro de progresso de uma meta.
 
+    A gravação é enfileirada e confirmada de imediato; o envio ao backend ocorre em segundo plano.
+
     Args:
         data (dict): Dados do progresso da meta (goal_id, link_id, date, completed, etc.).
 
     Calls:
-        upsert_record(): Insere ou atualiza na tabela `goal_progress` | definida em services.backend.py.
+        enqueue_upsert(): Enfileira o upsert na tabela `goal_progress` | definida em services.write_behind.py.
         logger.debug(): Método do objeto Logger para registrar mensagens de depuração | instanciado por logger.
 
     Returns:
-        bool: True se salvo com sucesso, False como fallback.
+        bool: True se a gravação foi aceita, False como fallback.
     """
 
     # Loga a tentativa de salvar o progresso.
     logger.debug(f"GOAL_PROGRESS → Tentando salvar progresso: {data}")
 
-    # Executa o upsert na tabela goal_progress.
-    result = upsert_record(
+    # Enfileira o upsert na tabela goal_progress.
+    result = enqueue_upsert(
         table_name="goal_progress",
         payload=data,
-        on_conflict="goal_id,date",  # ← evita duplicidade por meta e dia
-        returning=True
+        on_conflict="goal_id,date"  # ← evita duplicidade por meta e dia (e torna o reenvio idempotente)
     )
 
     # Loga o resultado.
-    logger.debug(f"GOAL_PROGRESS → Resultado do upsert: {result}")
+    logger.debug(f"GOAL_PROGRESS → Gravação aceita: {result}")
 
-    # Retorna True se houve retorno, ou False como fallback.
-    return bool(result)
+    # Retorna True se a gravação foi aceita, ou False como fallback.
+    return result
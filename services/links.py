@@ -3,7 +3,8 @@
 
 import logging
 
-from services.backend import upsert_record, fetch_records
+from services.backend import upsert_record, fetch_records, exists
+from services.models  import Link
 from frameworks.sm    import StateMachine
 from utils.gender import get_professional_title
 
@@ -39,7 +40,8 @@ def load_links_for_professional(professional_id: str, auth_machine: StateMachine
     # Realiza a busca dos vínculos existentes na tabela.
     links = fetch_records(
         table_name="links",
-        filters={"professional_id": professional_id}
+        filters={"professional_id": professional_id},
+        model=Link
     )
 
     # Loga o número de vínculos encontrados.
@@ -75,7 +77,8 @@ def load_links_for_patient(patient_id: str, auth_machine: StateMachine) -> None:
     # Realiza a busca na tabela com filtro por patient_id.
     links = fetch_records(
         table_name="links",
-        filters={"patient_id": patient_id}
+        filters={"patient_id": patient_id},
+        model=Link
     )
 
     # Loga o número de vínculos encontrados.
@@ -117,7 +120,8 @@ def load_links_by_role(
 
     links = fetch_records(
         table_name="links",
-        filters={role_field: role_id}
+        filters={role_field: role_id},
+        model=Link
     )
 
     logger.debug(f"LINK → {len(links)} vínculo(s) encontrado(s) para {role_field} {role_id}")
@@ -178,6 +182,25 @@ def fetch_patient_info_by_email(email: str) -> dict | None:
         return None
 
 
+# 🔎 FUNÇÃO PARA VERIFICAR SE JÁ EXISTE VÍNCULO ENTRE PROFISSIONAL E PACIENTE ──────────────────────────────────────────────────────────────────────────────
+
+def link_exists(professional_id: str, patient_id: str) -> bool | None:
+    """
+    <docstrings> Verifica no servidor se já existe vínculo (em qualquer status) entre o profissional e o paciente.
+
+    Args:
+        professional_id (str): UUID do profissional.
+        patient_id (str): UUID do paciente.
+
+    Calls:
+        exists(): Contagem via requisição HEAD na tabela `links` | definida em services.backend.py.
+
+    Returns:
+        bool | None: True se existir, False se não existir, None se a verificação falhar.
+    """
+    return exists("links", {"professional_id": professional_id, "patient_id": patient_id})
+
+
 # 💾 FUNÇÃO PARA SALVAR VÍNCULO ENTRE PROFISSIONAL E PACIENTE ──────────────────────────────────────────────────────────────────────────────────────────────
 
 def save_links(auth_machine: StateMachine, data: dict) -> bool:
@@ -0,0 +1,207 @@
+
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import dataclasses
+
+from dataclasses import dataclass
+from typing      import Any, Iterable
+
+
+# 🧱 BASE DOS MODELOS DE REGISTRO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+class Record:
+    """
+    <docstrings> Base dos modelos compactos (dataclasses com __slots__) decodificados das respostas do backend.
+
+    Mantém a interface de leitura de dict usada pelos componentes (`r["x"]`, `r.get("x")`, `"x" in r`,
+    `{**r}`, `len`, iteração, `items()`), de modo que modelos e dicts possam circular pelos mesmos caminhos.
+    Como num dict, um campo presente na linha com valor nulo devolve None em `get` e está contido em `in`;
+    campos declarados que não vieram na linha (ex.: `columns` parcial) ficam em `absent` e se comportam como
+    chaves inexistentes. Colunas não declaradas no modelo são preservadas em `extra`. Ambos são None quando
+    vazios. Os modelos são imutáveis: para alterar, use `to_dict()` ou `replace()`.
+
+    """
+    __slots__ = ()
+
+    # Nomes dos campos declarados, preenchidos por _fields() na primeira chamada de cada classe.
+    _FIELDS: tuple[str, ...] = ()
+
+    @classmethod
+    def _fields(cls) -> tuple[str, ...]:
+        if "_FIELDS" not in cls.__dict__:
+            cls._FIELDS = tuple(f.name for f in dataclasses.fields(cls) if f.name not in ("extra", "absent"))
+        return cls._FIELDS
+
+    # 🏗️ DECODIFICAÇÃO ──────────────────────────────────────────────────────
+
+    @classmethod
+    def from_row(cls, row: "dict | Record"):
+        """
+        <docstrings> Cria o modelo a partir de uma linha do PostgREST (dict) ou devolve a instância recebida.
+
+        Args:
+            row (dict | Record): Linha da resposta do backend.
+
+        Returns:
+            Record: Instância do modelo.
+        """
+        if isinstance(row, cls):
+            return row
+        if isinstance(row, Record):
+            row = row.to_dict()
+
+        fields = cls._fields()
+        extra = {k: v for k, v in row.items() if k not in fields} or None
+        absent = frozenset(k for k in fields if k not in row) or None
+        return cls(**{k: row.get(k) for k in fields}, extra=extra, absent=absent)
+
+    @classmethod
+    def decode(cls, rows: "dict | list[dict] | None"):
+        """
+        <docstrings> Decodifica uma resposta do backend (registro único ou lista) no modelo.
+
+        Returns:
+            Record | list[Record] | None: Mesma forma da entrada; dicts vazios e None são preservados.
+        """
+        if isinstance(rows, list):
+            return [cls.from_row(row) for row in rows]
+        if rows:
+            return cls.from_row(rows)
+        return rows
+
+    # 🧭 INTERFACE DE LEITURA COMPATÍVEL COM DICT ───────────────────────────
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields() and not (self.absent and key in self.absent):
+            return getattr(self, key)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._fields():
+            return not (self.absent and key in self.absent)
+        return bool(self.extra and key in self.extra)
+
+    def keys(self) -> list[str]:
+        fields = [k for k in self._fields() if k not in self.absent] if self.absent else list(self._fields())
+        return fields + list(self.extra or ())
+
+    def values(self) -> list[Any]:
+        return [self[k] for k in self.keys()]
+
+    def items(self) -> list[tuple[str, Any]]:
+        return [(k, self[k]) for k in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self._fields()) - len(self.absent or ()) + len(self.extra or ())
+
+    def replace(self, **changes: Any) -> "Record":
+        """
+        <docstrings> Retorna uma cópia do modelo com os campos declarados informados alterados (e presentes).
+        """
+        absent = (self.absent or frozenset()) - changes.keys()
+        return dataclasses.replace(self, **changes, absent=absent or None)
+
+    def to_dict(self) -> dict:
+        """
+        <docstrings> Converte o modelo de volta para dict (ex.: para pandas ou para payloads de upsert).
+        """
+        return dict(self.items())
+
+
+def to_dicts(records: Iterable) -> list[dict]:
+    """
+    <docstrings> Converte uma lista de modelos (ou dicts) em dicts, por exemplo para montar um DataFrame.
+    """
+    return [r.to_dict() if isinstance(r, Record) else r for r in records]
+
+
+# 🔗 VÍNCULOS ────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True, slots=True)
+class Link(Record):
+    id: str | None = None
+    professional_id: str | None = None
+    patient_id: str | None = None
+    professional_name: str | None = None
+    patient_name: str | None = None
+    status: str | None = None
+    created_at: str | None = None
+    extra: dict | None = None
+    absent: frozenset | None = None
+
+
+# 🎯 METAS E PROGRESSO ───────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True, slots=True)
+class Goal(Record):
+    id: str | None = None
+    link_id: str | None = None
+    goal: str | None = None
+    timeframe: str | None = None
+    effort_type: str | None = None
+    priority_level: int | None = None
+    created_at: str | None = None
+    extra: dict | None = None
+    absent: frozenset | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class GoalProgress(Record):
+    id: str | None = None
+    goal_id: str | None = None
+    link_id: str | None = None
+    date: str | None = None
+    completed: bool | None = None
+    duration_minutes: int | None = None
+    created_at: str | None = None
+    extra: dict | None = None
+    absent: frozenset | None = None
+
+
+# 📋 ESCALAS ─────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True, slots=True)
+class ScaleAssignment(Record):
+    id: str | None = None
+    link_id: str | None = None
+    available_scale_id: str | None = None
+    scale_name: str | None = None
+    status: str | None = None
+    created_at: str | None = None
+    extra: dict | None = None
+    absent: frozenset | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ScaleProgress(Record):
+    id: str | None = None
+    scale_id: str | None = None
+    link_id: str | None = None
+    date: str | None = None
+    completed: bool | None = None
+    answers: Any = None
+    created_at: str | None = None
+    extra: dict | None = None
+    absent: frozenset | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class AvailableScale(Record):
+    id: str | None = None
+    scale_name: str | None = None
+    description: str | None = None
+    items: Any = None
+    created_at: str | None = None
+    updated_at: str | None = None
+    extra: dict | None = None
+    absent: frozenset | None = None
@@ -0,0 +1,176 @@
+
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import os
+import time
+import logging
+import streamlit as st
+
+from typing                     import Callable
+from frameworks.sm              import StateMachine, current_page
+from services.backend           import fetch_records, CACHE_SCOPES
+from services.models            import Goal, GoalProgress, Link, ScaleAssignment, ScaleProgress
+from services.available_scales  import warm_scale_catalog
+from utils.concurrency          import submit_background
+
+
+# 👨‍💻 LOGGER ESPECÍFICO PARA O MÓDULO ATUAL ──────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+logger = logging.getLogger(__name__)
+
+
+# ⚙️ CONFIGURAÇÕES DO PREFETCH ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Liga/desliga o carregamento antecipado dos dados das outras páginas.
+PREFETCH_ENABLED = os.getenv("ABAETE_PREFETCH", "true").lower() in ("1", "true", "yes")
+
+# Número máximo de buscas por rodada de prefetch.
+PREFETCH_BUDGET = int(os.getenv("ABAETE_PREFETCH_BUDGET", "6"))
+
+# Tempo máximo (s) de uma rodada de prefetch; buscas ainda não iniciadas são descartadas.
+PREFETCH_SECONDS = float(os.getenv("ABAETE_PREFETCH_SECONDS", "5"))
+
+# Chave, no session_state, da rodada de prefetch mais recente.
+_PREFETCH_KEY = "_prefetch_state"
+
+
+# 🗂️ FUNÇÃO PARA MONTAR AS BUSCAS DAS PRÓXIMAS PÁGINAS ──────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def _plan(auth_machine: StateMachine) -> list[tuple[str, Callable]]:
+    """
+    <docstrings> Lista, em ordem de prioridade, as buscas que as páginas de metas e avaliações farão ao abrir.
+
+    Os argumentos repetem os dos carregadores (services.goals, services.goals_progress, services.scales,
+    services.scales_progress e services.links), para que as entradas aquecidas sejam as mesmas do cache.
+
+    Args:
+        auth_machine (StateMachine): Máquina de autenticação com papel e vínculos já carregados.
+
+    Returns:
+        list[tuple[str, Callable]]: Pares (nome da busca, função sem argumentos).
+    """
+    tasks = []
+
+    # Profissional: as páginas usam os vínculos com pacientes e o catálogo de escalas.
+    if auth_machine.get_variable("role") == "professional":
+        tasks.append(("available_scales", warm_scale_catalog))
+        user_id = auth_machine.get_variable("user_id")
+        if user_id and not auth_machine.get_variable("professional_patient_links"):
+            tasks.append(("links", lambda: fetch_records("links", filters={"professional_id": user_id}, model=Link)))
+        return tasks
+
+    # Paciente: as páginas só carregam dados quando há um único vínculo.
+    links = auth_machine.get_variable("links", default=[])
+    if len(links) != 1 or not links[0].get("id"):
+        return tasks
+
+    link_id = links[0]["id"]
+    tasks.extend([
+        ("goals",            lambda: fetch_records("goals", filters={"link_id": link_id}, model=Goal)),
+        ("goal_progress",    lambda: fetch_records("goal_progress", filters={"link_id": link_id}, model=GoalProgress)),
+        ("scales",           lambda: fetch_records("scales", filters={"link_id": link_id, "status": "active"}, model=ScaleAssignment)),
+        ("scale_progress",   lambda: fetch_records("scale_progress", filters={"link_id": link_id}, model=ScaleProgress)),
+        ("available_scales", warm_scale_catalog),
+    ])
+    return tasks
+
+
+# 🛰️ FUNÇÃO PARA AQUECER O CACHE EM SEGUNDO PLANO ──────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def _run(tasks: list[tuple[str, Callable]], page: str, state: dict) -> dict:
+    """
+    <docstrings> Executa as buscas em sequência até o fim, o orçamento acabar ou o usuário sair da página.
+
+    Args:
+        tasks (list[tuple[str, Callable]]): Buscas montadas por _plan().
+        page (str): Página que agendou o prefetch.
+        state (dict): Registro da rodada no session_state, atualizado ao final.
+
+    Returns:
+        dict: {"fetched", "skipped", "stopped", "seconds"}.
+    """
+    started = time.monotonic()
+    fetched, stopped = [], None
+
+    for name, task in tasks:
+
+        # Interrompe se o usuário navegou, se o orçamento de buscas acabou ou se o tempo se esgotou.
+        if current_page() != page:
+            stopped = "navigated"
+        elif len(fetched) >= PREFETCH_BUDGET:
+            stopped = "budget"
+        elif time.monotonic() - started > PREFETCH_SECONDS:
+            stopped = "timeout"
+        if stopped:
+            break
+
+        try:
+            task()
+            fetched.append(name)
+        except Exception as e:
+            logger.warning(f"PREFETCH → Falha ao buscar {name}: {e}")
+
+    stats = {
+        "fetched": fetched,
+        "skipped": len(tasks) - len(fetched),
+        "stopped": stopped,
+        "seconds": round(time.monotonic() - started, 3),
+    }
+    state.update(stats, finished_at=time.monotonic())
+    logger.debug(f"PREFETCH → {len(fetched)} busca(s) em {stats['seconds']}s a partir de {page} (parada: {stopped})")
+    return stats
+
+
+# 🚀 FUNÇÃO PARA AGENDAR O PREFETCH APÓS A DASHBOARD ────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def prefetch_next_pages(auth_machine: StateMachine, page: str) -> bool:
+    """
+    <docstrings> Agenda, em segundo plano, o carregamento dos dados das páginas de metas e avaliações no cache da sessão.
+
+    Deve ser chamada depois que a dashboard termina de desenhar. Cada rodada roda no máximo uma vez por
+    versão dos vínculos, e de novo só quando as entradas aquecidas já expiraram do cache da sessão. A rodada
+    para ao sair de `page`, após ABAETE_PREFETCH_BUDGET buscas ou após ABAETE_PREFETCH_SECONDS segundos.
+
+    Args:
+        auth_machine (StateMachine): Máquina de autenticação com o contexto da sessão carregado.
+        page (str): Página atual (ex.: "1_Agenda.py"), a mesma passada a StateMachine.batch().
+
+    Calls:
+        _plan(): Monta as buscas conforme o papel do usuário | definida neste módulo.
+        submit_background(): Executa a rodada com o contexto da sessão | definida em utils.concurrency.
+
+    Returns:
+        bool: True se uma nova rodada foi agendada.
+    """
+
+    # Sem o contexto da sessão (perfil e vínculos), ainda não há o que antecipar.
+    if not PREFETCH_ENABLED or auth_machine.get_variable("role") is None:
+        return False
+
+    version = auth_machine.version("links")
+    previous = st.session_state.get(_PREFETCH_KEY)
+
+    # Evita repetir a rodada enquanto ela está em andamento ou suas entradas ainda valem no cache.
+    if previous and previous["version"] == version:
+        finished_at = previous.get("finished_at")
+        if finished_at is None or time.monotonic() - finished_at < CACHE_SCOPES["session"]["ttl"]:
+            return False
+
+    tasks = _plan(auth_machine)
+    if not tasks:
+        return False
+
+    state = {"version": version, "page": page, "finished_at": None}
+    st.session_state[_PREFETCH_KEY] = state
+    submit_background(_run, tasks, page, state)
+    return True
+
+
+def get_prefetch_stats() -> dict:
+    """
+    <docstrings> Retorna o registro da rodada de prefetch mais recente da sessão.
+
+    Returns:
+        dict: {"version", "page", "finished_at", "fetched", "skipped", "stopped", "seconds"}, ou {} se não houve rodada.
+    """
+    return dict(st.session_state.get(_PREFETCH_KEY) or {})
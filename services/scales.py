@@ -5,7 +5,8 @@ import logging
 
 from datetime           import date
 from frameworks.sm      import StateMachine
-from services.backend   import fetch_records, upsert_record
+from services.backend   import fetch_records, upsert_record, upsert_records, count_records
+from services.models    import ScaleAssignment
 
 
 # 👨‍💻 LOGGER ESPECÍFICO PARA O MÓDULO ATUAL ────────────────────────────────────────────────────────────────────────────────────────────────────────────────
@@ -34,7 +35,8 @@ def load_scales_by_link_id(link_id: str, auth_machine: StateMachine) -> list[dic
     
     scales = fetch_records(
         table_name="scales",
-        filters={"link_id": link_id, "status": "active"}
+        filters={"link_id": link_id, "status": "active"},
+        model=ScaleAssignment
     )
 
     logger.debug(f"SCALES → {len(scales)} escala(s) carregada(s) para o link {link_id}")
@@ -54,42 +56,101 @@ def save_scale_assignment(data: dict) -> str | bool:
     Args:
         data (dict): Dados da atribuição da escala.
 
+    Calls:
+        save_scale_assignments(): Atribuição em lote | definida neste módulo.
+
     Returns:
         str | bool:
             - "created": se foi criada nova atribuição.
             - "duplicate_today": se já existe uma atribuição para o mesmo dia.
             - False: se ocorreu erro.
     """
+    result = save_scale_assignments([data])
+
+    if result["created"]:
+        return "created"
+    if result["duplicate_today"]:
+        return "duplicate_today"
+    return False
+
+
+# 💾 FUNÇÃO PARA ATRIBUIR UMA ESCALA A VÁRIOS VÍNCULOS ────────────────────────────────────────────────────────────────────────────────────
+
+def save_scale_assignments(payloads: list[dict]) -> dict[str, list[str]]:
+    """
+    <docstrings> Atribui escalas a vários vínculos de uma vez, ignorando as já atribuídas hoje.
+
+    A verificação de duplicatas usa uma contagem (HEAD) e, só se houver alguma, uma busca leve dos vínculos;
+    as atribuições novas são gravadas com um upsert em lote, em vez de uma requisição por paciente.
+
+    Args:
+        payloads (list[dict]): Atribuições (link_id, available_scale_id, scale_name, status).
+
+    Calls:
+        count_records(): Conta as atribuições ativas de hoje | definida em services.backend.py.
+        fetch_records(): Busca os vínculos já atribuídos hoje | definida em services.backend.py.
+        upsert_records(): Upsert em lote na tabela `scales` | definida em services.backend.py.
+
+    Returns:
+        dict[str, list[str]]: link_ids por resultado: {"created": [...], "duplicate_today": [...], "failed": [...]}.
+    """
+    result = {"created": [], "duplicate_today": [], "failed": []}
+    if not payloads:
+        return result
 
     try:
-        # Verifica se já existe uma atribuição ATIVA da mesma escala para o mesmo vínculo no mesmo dia
-        registros = fetch_records(
-            table_name="scales",
-            filters={
-                "available_scale_id": data["available_scale_id"],
-                "link_id": data["link_id"]
+        # Atribuições ativas de hoje, por escala, entre os vínculos informados.
+        duplicated: set[str] = set()
+        for available_scale_id in {p["available_scale_id"] for p in payloads}:
+            filters = {
+                "available_scale_id": available_scale_id,
+                "link_id": [p["link_id"] for p in payloads if p["available_scale_id"] == available_scale_id],
+                "status": "active",
+                "created_at": {"gte": str(date.today())}
             }
-        )
-
-        hoje = str(date.today())
-        for r in registros:
-            criado_em = r.get("created_at", "")[:10]  # apenas a parte YYYY-MM-DD
-            if criado_em == hoje and r.get("status") == "active":
-                logger.warning(f"SCALES → Escala já atribuída hoje ao vínculo {data['link_id']}")
-                return "duplicate_today"
-
-        # Se não houver duplicata para hoje, cria novo registro
-        resultado = upsert_record(
-            table_name="scales",
-            payload=data,
-            on_conflict="id",
-            returning=True
-        )
-        return "created" if resultado else False
+
+            # Se a verificação falhar, não arrisca criar duplicatas.
+            total = count_records("scales", filters)
+            if total is None:
+                result["failed"] = [p["link_id"] for p in payloads]
+                return result
+
+            if total:
+                rows = fetch_records("scales", filters, columns="link_id,available_scale_id", cache=False)
+                if len(rows) < total:
+                    result["failed"] = [p["link_id"] for p in payloads]
+                    return result
+                duplicated.update((r["link_id"], r["available_scale_id"]) for r in rows)
+
+        novos = []
+        for payload in payloads:
+            if (payload["link_id"], payload["available_scale_id"]) in duplicated:
+                result["duplicate_today"].append(payload["link_id"])
+            else:
+                novos.append(payload)
+
+        if result["duplicate_today"]:
+            logger.warning(f"SCALES → Escala já atribuída hoje a {len(result['duplicate_today'])} vínculo(s)")
+
+        if not novos:
+            return result
+
+        # Grava as atribuições novas em lote; cada lote reporta sucesso ou falha.
+        reports = upsert_records(table_name="scales", payloads=novos, on_conflict="id", returning=False)
+        if not reports:
+            result["failed"] = [p["link_id"] for p in novos]
+            return result
+
+        for report in reports:
+            chunk = novos[report["start"]:report["end"]]
+            result["created" if report["ok"] else "failed"].extend(p["link_id"] for p in chunk)
+
+        return result
 
     except Exception as e:
-        logger.exception(f"SCALES → Erro ao salvar atribuição: {e}")
-        return False
+        logger.exception(f"SCALES → Erro ao salvar atribuições: {e}")
+        result["failed"] = [p["link_id"] for p in payloads if p["link_id"] not in result["duplicate_today"]]
+        return result
 
 
 # 💾 FUNÇÃO PARA ATUALIZAR O REGISTO DE UMA ESCALA ────────────────────────────────────────────────────────────────────────────────────
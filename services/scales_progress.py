@@ -3,7 +3,9 @@
 import logging
 from datetime import date
 
-from services.backend import fetch_records, upsert_record
+from services.backend import fetch_records, iter_records
+from services.write_behind import enqueue_upsert, overlay_pending, overlay_pending_pages
+from services.models import ScaleProgress
 from frameworks.sm import StateMachine
 
 logger = logging.getLogger(__name__)
@@ -15,7 +17,9 @@ def load_scale_progress(link_id: str, auth_machine: StateMachine) -> None:
     """
     <docstrings> Carrega os registros de progresso das escalas para um vínculo.
 
-    Agrupa por `scale_id` e armazena na máquina de estados com prefixo.
+    Agrupa por `scale_id` e armazena na máquina de estados como `scale_progress_cache__{scale_id}`. O namespace
+    `scale_progress_cache` é limitado (LRU) e guarda apenas essas listas recarregáveis; o estado dos formulários
+    (`scale_progress__{scale_id}__resp`, `__done`, `__idx`) fica fora dele e nunca é descartado.
 
     Args:
         link_id (str): UUID do vínculo.
@@ -23,16 +27,22 @@ def load_scale_progress(link_id: str, auth_machine: StateMachine) -> None:
 
     Calls:
         fetch_records(): Busca registros da tabela `scale_progress` | definida em services.backend.py.
+        overlay_pending(): Aplica progressos ainda na fila de escrita | definida em services.write_behind.py.
+        auth_machine.limit_namespace(): Limita a memória do namespace de progresso | instanciado por StateMachine.
         auth_machine.set_variable(): Armazena dados agrupados | instanciado por StateMachine.
         logger.debug(): Logs do processo | instanciado por logger.
 
     Returns:
         None
     """
+    # Progresso é recarregado a cada renderização: limita a memória do namespace na sessão (LRU).
+    auth_machine.limit_namespace("scale_progress_cache")
+
     try:
         logger.debug(f"SCALE_PROGRESS → Buscando progresso para o link {link_id}")
 
-        progresso = fetch_records("scale_progress", filters={"link_id": link_id})
+        progresso = fetch_records("scale_progress", filters={"link_id": link_id}, model=ScaleProgress)
+        progresso = ScaleProgress.decode(overlay_pending(progresso, "scale_progress", {"link_id": link_id}, ["scale_id", "date", "link_id"]))
 
         agrupado = {}
         for entry in progresso:
@@ -41,7 +51,7 @@ def load_scale_progress(link_id: str, auth_machine: StateMachine) -> None:
                 agrupado.setdefault(sid, []).append(entry)
 
         for sid, registros in agrupado.items():
-            auth_machine.set_variable(f"scale_progress__{sid}", registros)
+            auth_machine.set_variable(f"scale_progress_cache__{sid}", registros)
 
         logger.debug(f"SCALE_PROGRESS → Progresso agrupado para {len(agrupado)} escalas")
 
@@ -49,30 +59,55 @@ def load_scale_progress(link_id: str, auth_machine: StateMachine) -> None:
         logger.exception(f"SCALE_PROGRESS → Erro ao buscar progresso: {e}")
 
 
+# 📜 FUNÇÃO PARA PERCORRER O HISTÓRICO DE PROGRESSO EM PÁGINAS ─────────────────────────
+
+def iter_scale_progress_pages(link_id: str):
+    """
+    <docstrings> Percorre o histórico de progresso das escalas de um vínculo, página a página.
+
+    As páginas são lidas sob demanda, ordenadas por data (com desempate pelo id), e já incluem os
+    progressos ainda na fila de escrita.
+
+    Args:
+        link_id (str): UUID do vínculo.
+
+    Calls:
+        iter_records(): Lê a tabela `scale_progress` em páginas | definida em services.backend.py.
+        overlay_pending_pages(): Aplica progressos ainda na fila de escrita | definida em services.write_behind.py.
+
+    Yields:
+        list[dict]: Páginas de registros de progresso.
+    """
+    filters = {"link_id": link_id}
+    pages = iter_records("scale_progress", filters, order_by="date", key="id", pages=True)
+    yield from overlay_pending_pages(pages, "scale_progress", filters, ["scale_id", "date", "link_id"])
+
+
 # 💾 FUNÇÃO PARA SALVAR PROGRESSO DE ESCALA ─────────────────────────────────────────────
 
 def save_scale_progress(data: dict) -> bool:
     """
     <docstrings> Salva ou atualiza um registro de progresso de escala.
 
+    A gravação é enfileirada e confirmada de imediato; o envio ao backend ocorre em segundo plano.
+
     Args:
         data (dict): Dados do progresso (scale_id, link_id, date, mood_rating, etc.)
 
     Calls:
-        upsert_record(): Insere ou atualiza progresso em `scale_progress` | definida em services.backend.py.
+        enqueue_upsert(): Enfileira o upsert em `scale_progress` | definida em services.write_behind.py.
         logger.debug(): Loga operações | instanciado por logger.
 
     Returns:
-        bool: True se salvo com sucesso, False como fallback.
+        bool: True se a gravação foi aceita, False como fallback.
     """
     logger.debug(f"SCALE_PROGRESS → Tentando salvar progresso: {data}")
 
-    result = upsert_record(
+    result = enqueue_upsert(
         table_name="scale_progress",
         payload=data,
-        on_conflict="scale_id,date,link_id",
-        returning=True
+        on_conflict="scale_id,date,link_id"
     )
 
-    logger.debug(f"SCALE_PROGRESS → Resultado do upsert: {result}")
-    return bool(result)
+    logger.debug(f"SCALE_PROGRESS → Gravação aceita: {result}")
+    return result
@@ -0,0 +1,545 @@
+
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import os
+import time
+import random
+import sqlite3
+import logging
+import threading
+
+from pathlib          import Path
+from utils             import fastjson
+from services.backend import upsert_record, current_session_id, session_scope, session_is_live
+
+
+# 👨‍💻 LOGGER ESPECÍFICO PARA O MÓDULO ATUAL ──────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+logger = logging.getLogger(__name__)
+
+
+# ⚙️ CONFIGURAÇÕES DA FILA ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Liga/desliga a gravação assíncrona (com "false", os saves voltam a ser síncronos).
+WRITE_BEHIND_ENABLED = os.getenv("ABAETE_WRITE_BEHIND", "true").lower() in ("1", "true", "yes")
+
+# Arquivo SQLite onde a fila é persistida.
+QUEUE_PATH = Path(os.getenv("ABAETE_QUEUE_PATH", Path(__file__).parent.parent / ".queue" / "writes.db"))
+
+# Tentativas antes de mover a escrita para a fila morta ("dead").
+MAX_ATTEMPTS = 8
+
+# Atraso inicial e máximo (s) do backoff exponencial entre tentativas.
+BASE_DELAY = 0.5
+MAX_DELAY = 60.0
+
+# Tempo máximo (s) que o logout espera pelo envio das escritas pendentes da sessão.
+DRAIN_TIMEOUT = 5.0
+
+
+# 🗃️ CLASSE DA FILA DE ESCRITA ASSÍNCRONA (WRITE-BEHIND) ──────────────────────────────────────────────────────────────────────────────────────────────────
+
+class WriteBehindQueue:
+    """
+    <docstrings> Fila durável de upserts: confirma a gravação imediatamente e envia ao backend em segundo plano.
+
+    Cada escrita é persistida em SQLite antes de ser confirmada, e uma thread dedicada a envia com
+    backoff exponencial. Como os upserts usam chaves `on_conflict`, reenvios são idempotentes; escritas
+    pendentes para a mesma chave são coalescidas (a última vence).
+
+    O envio depende do client autenticado da sessão de origem (RLS). Por isso o logout drena a fila da
+    sessão antes de devolver o client (drain), e escritas cuja sessão já não existe (logout ou reinício
+    do processo) vão direto para a fila morta, sem emprestar um client novo. As escritas mortas ficam
+    disponíveis em dead_writes() para o aviso ao usuário e para o operador.
+
+    """
+
+    def __init__(self, path: Path):
+        """
+        <docstrings> Método construtor de classe.
+
+        Args:
+            path (Path): Caminho do arquivo SQLite.
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS writes (
+                id              INTEGER PRIMARY KEY AUTOINCREMENT,
+                dedupe_key      TEXT NOT NULL,
+                table_name      TEXT NOT NULL,
+                payload         TEXT NOT NULL,
+                on_conflict     TEXT,
+                session_id      TEXT,
+                status          TEXT NOT NULL DEFAULT 'pending',
+                attempts        INTEGER NOT NULL DEFAULT 0,
+                enqueued_at     REAL NOT NULL,
+                next_attempt_at REAL NOT NULL,
+                last_error      TEXT
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS writes_due ON writes (status, next_attempt_at)")
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._worker = None
+
+        # Sessões com escritas mortas neste processo, para o aviso da sidebar sem consultar o SQLite a cada rerun.
+        # Começa vazio: ids de sessão não sobrevivem a um reinício, então as mortas antigas não são de sessões vivas.
+        self._dead_sessions: set[str] = set()
+
+        # Métricas acumuladas desde o início do processo.
+        self.flushed = 0
+        self.retries = 0
+        self.dead = 0
+        self.last_flush_latency = 0.0
+        self.max_flush_latency = 0.0
+        self._total_flush_latency = 0.0
+
+    # 📥 ENFILEIRAMENTO ──────────────────────────────────────────────────────
+
+    def enqueue(self, table_name: str, payload: dict, on_conflict: str | None) -> int:
+        """
+        <docstrings> Persiste uma escrita e acorda a thread de envio.
+
+        Args:
+            table_name (str): Tabela de destino.
+            payload (dict): Registro a inserir ou atualizar.
+            on_conflict (str | None): Colunas da chave de conflito (garantem idempotência).
+
+        Returns:
+            int: Identificador da escrita na fila.
+        """
+        dedupe_key = self._dedupe_key(table_name, payload, on_conflict)
+        now = time.time()
+
+        with self._lock:
+            # Coalesce: uma escrita pendente para a mesma chave é substituída pela nova.
+            self._db.execute("DELETE FROM writes WHERE dedupe_key = ? AND status = 'pending'", (dedupe_key,))
+            cursor = self._db.execute(
+                "INSERT INTO writes (dedupe_key, table_name, payload, on_conflict, session_id, enqueued_at, next_attempt_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (dedupe_key, table_name, fastjson.dumps(payload, default=str), on_conflict, current_session_id(), now, now)
+            )
+
+        self._ensure_worker()
+        self._wakeup.set()
+        logger.debug(f"WRITE_BEHIND → Escrita {cursor.lastrowid} enfileirada para '{table_name}'")
+        return cursor.lastrowid
+
+    # 🔎 LEITURA DAS PENDÊNCIAS ──────────────────────────────────────────────
+
+    def pending(self, table_name: str, filters: dict | None = None) -> list[dict]:
+        """
+        <docstrings> Retorna os payloads ainda não enviados de uma tabela, filtrados por igualdade.
+
+        Args:
+            table_name (str): Tabela de destino.
+            filters (dict | None): Filtros de igualdade sobre o payload.
+
+        Returns:
+            list[dict]: Payloads pendentes, do mais antigo ao mais recente.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT payload FROM writes WHERE table_name = ? AND status = 'pending' ORDER BY id",
+                (table_name,)
+            ).fetchall()
+
+        payloads = [fastjson.loads(row[0]) for row in rows]
+        return [p for p in payloads if all(p.get(k) == v for k, v in (filters or {}).items())]
+
+    def overlay(self, rows: list[dict], table_name: str, filters: dict, keys: list[str]) -> list[dict]:
+        """
+        <docstrings> Sobrepõe as escritas pendentes aos registros lidos do backend (read-your-writes).
+
+        Args:
+            rows (list[dict]): Registros lidos do backend.
+            table_name (str): Tabela lida.
+            filters (dict): Filtros usados na leitura.
+            keys (list[str]): Colunas da chave de conflito, usadas para casar registros.
+
+        Returns:
+            list[dict]: Registros com as pendências aplicadas.
+        """
+        pending = self.pending(table_name, filters)
+        if not pending:
+            return rows
+
+        merged = {tuple(r.get(k) for k in keys): r for r in rows}
+        for payload in pending:
+            key = tuple(payload.get(k) for k in keys)
+            merged[key] = {**merged.get(key, {}), **payload}
+
+        return list(merged.values())
+
+    def has_dead(self, session_id: str) -> bool:
+        """
+        <docstrings> Indica, sem consultar o SQLite, se a sessão teve escritas movidas para a fila morta.
+        """
+        return session_id in self._dead_sessions
+
+    def dead_writes(self, session_id: str | None = None) -> list[dict]:
+        """
+        <docstrings> Retorna as escritas que esgotaram as tentativas ou perderam a sessão de origem.
+
+        Args:
+            session_id (str | None): Restringe às escritas de uma sessão. None retorna todas.
+
+        Returns:
+            list[dict]: {"id", "table_name", "payload", "attempts", "enqueued_at", "last_error"}, da mais antiga à mais recente.
+        """
+        query = "SELECT id, table_name, payload, attempts, enqueued_at, last_error FROM writes WHERE status = 'dead'"
+        params: tuple = ()
+        if session_id is not None:
+            query += " AND session_id = ?"
+            params = (session_id,)
+
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY id", params).fetchall()
+
+        return [
+            {"id": i, "table_name": t, "payload": fastjson.loads(p), "attempts": a, "enqueued_at": e, "last_error": err}
+            for i, t, p, a, e, err in rows
+        ]
+
+    # 🚰 DRENAGEM NO LOGOUT ──────────────────────────────────────────────────
+
+    def drain(self, session_id: str, timeout: float = DRAIN_TIMEOUT) -> int:
+        """
+        <docstrings> Envia imediatamente as escritas pendentes de uma sessão, ignorando o backoff.
+
+        Chamada antes de devolver o client da sessão ao pool (logout), enquanto ele ainda está autenticado.
+        O que não for enviado dentro do prazo vai para a fila morta, pois não poderá mais ser reenviado.
+
+        Args:
+            session_id (str): Sessão cujas escritas devem ser enviadas.
+            timeout (float): Tempo máximo (s) de drenagem.
+
+        Returns:
+            int: Número de escritas que não puderam ser enviadas.
+        """
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            with self._lock:
+                due = self._db.execute(
+                    "SELECT id, table_name, payload, on_conflict, session_id, attempts, enqueued_at FROM writes "
+                    "WHERE status = 'pending' AND session_id = ? ORDER BY id",
+                    (session_id,)
+                ).fetchall()
+
+            if not due:
+                return 0
+
+            for write_id, table_name, payload, on_conflict, sid, attempts, enqueued_at in due:
+                if time.monotonic() >= deadline:
+                    break
+                self._flush_one(write_id, table_name, fastjson.loads(payload), on_conflict, sid, attempts, enqueued_at)
+
+            # Aguarda um pouco antes de reenviar as que falharam.
+            time.sleep(max(min(BASE_DELAY, deadline - time.monotonic()), 0.0))
+
+        # Prazo esgotado: o client será devolvido, então o restante não poderá mais ser enviado.
+        with self._lock:
+            left = self._db.execute(
+                "SELECT id, table_name, attempts FROM writes WHERE status = 'pending' AND session_id = ?",
+                (session_id,)
+            ).fetchall()
+
+        for write_id, table_name, attempts in left:
+            self._bury(write_id, table_name, session_id, attempts, "sessão encerrada antes do envio")
+
+        return len(left)
+
+    # 📊 MÉTRICAS ────────────────────────────────────────────────────────────
+
+    def metrics(self) -> dict:
+        """
+        <docstrings> Retorna profundidade da fila e latências de envio.
+
+        Returns:
+            dict: depth, dead, flushed, retries e latências (s) entre enfileirar e confirmar.
+        """
+        with self._lock:
+            depth = self._db.execute("SELECT COUNT(*) FROM writes WHERE status = 'pending'").fetchone()[0]
+            dead = self._db.execute("SELECT COUNT(*) FROM writes WHERE status = 'dead'").fetchone()[0]
+
+        return {
+            "depth": depth,
+            "dead": dead,
+            "flushed": self.flushed,
+            "retries": self.retries,
+            "last_flush_latency": round(self.last_flush_latency, 3),
+            "avg_flush_latency": round(self._total_flush_latency / self.flushed, 3) if self.flushed else 0.0,
+            "max_flush_latency": round(self.max_flush_latency, 3),
+        }
+
+    # 🔁 ENVIO EM SEGUNDO PLANO ──────────────────────────────────────────────
+
+    def _ensure_worker(self) -> None:
+        """
+        <docstrings> Inicia a thread de envio, se ainda não estiver ativa.
+        """
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="abaete-write-behind", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        """
+        <docstrings> Laço da thread de envio: processa as escritas vencidas e dorme até a próxima.
+        """
+        while True:
+            try:
+                wait = self._flush_due()
+            except Exception:
+                logger.exception("WRITE_BEHIND → Erro inesperado no envio da fila")
+                wait = BASE_DELAY
+
+            self._wakeup.wait(wait)
+            self._wakeup.clear()
+
+    def _flush_due(self) -> float:
+        """
+        <docstrings> Envia todas as escritas vencidas.
+
+        Returns:
+            float: Segundos até a próxima escrita agendada (ou 60 se a fila estiver vazia).
+        """
+        now = time.time()
+        with self._lock:
+            due = self._db.execute(
+                "SELECT id, table_name, payload, on_conflict, session_id, attempts, enqueued_at FROM writes "
+                "WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY id",
+                (now,)
+            ).fetchall()
+
+        for write_id, table_name, payload, on_conflict, session_id, attempts, enqueued_at in due:
+            self._flush_one(write_id, table_name, fastjson.loads(payload), on_conflict, session_id, attempts, enqueued_at)
+
+        with self._lock:
+            row = self._db.execute("SELECT MIN(next_attempt_at) FROM writes WHERE status = 'pending'").fetchone()
+
+        return max(row[0] - time.time(), 0.0) if row[0] is not None else 60.0
+
+    def _flush_one(self, write_id, table_name, payload, on_conflict, session_id, attempts, enqueued_at) -> None:
+        """
+        <docstrings> Envia uma escrita com o client da sessão que a criou; reagenda com backoff em caso de falha.
+        """
+
+        # Sessão encerrada ou desconhecida: um client novo não estaria autenticado e a escrita falharia na RLS.
+        if not session_is_live(session_id):
+            self._bury(write_id, table_name, session_id, attempts, "sessão de origem encerrada")
+            return
+
+        with session_scope(session_id):
+            result = upsert_record(table_name=table_name, payload=payload, on_conflict=on_conflict, returning=True)
+
+        # Sucesso: remove da fila e registra a latência ponta a ponta.
+        if result:
+            latency = time.time() - enqueued_at
+            with self._lock:
+                # A drenagem do logout e a thread de envio podem enviar a mesma escrita; conta apenas uma vez.
+                if not self._db.execute("DELETE FROM writes WHERE id = ?", (write_id,)).rowcount:
+                    return
+                self.flushed += 1
+                self.last_flush_latency = latency
+                self.max_flush_latency = max(self.max_flush_latency, latency)
+                self._total_flush_latency += latency
+            return
+
+        attempts += 1
+
+        # Esgotou as tentativas: move para a fila morta, preservando o registro.
+        if attempts >= MAX_ATTEMPTS:
+            self._bury(write_id, table_name, session_id, attempts, f"upsert sem retorno após {attempts} tentativas")
+            return
+
+        # Reagenda com backoff exponencial e jitter.
+        delay = min(BASE_DELAY * (2 ** attempts), MAX_DELAY) * random.uniform(0.5, 1.5)
+        with self._lock:
+            self._db.execute(
+                "UPDATE writes SET attempts = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                (attempts, time.time() + delay, "upsert sem retorno", write_id)
+            )
+            self.retries += 1
+        logger.warning(f"WRITE_BEHIND → Escrita {write_id} em '{table_name}' falhou; nova tentativa em {delay:.1f}s")
+
+    def _bury(self, write_id: int, table_name: str, session_id: str | None, attempts: int, reason: str) -> None:
+        """
+        <docstrings> Move uma escrita para a fila morta, preservando o registro e o motivo.
+        """
+        with self._lock:
+            self._db.execute(
+                "UPDATE writes SET status = 'dead', attempts = ?, last_error = ? WHERE id = ?",
+                (attempts, reason, write_id)
+            )
+            self.dead += 1
+            if session_id is not None:
+                self._dead_sessions.add(session_id)
+        logger.error(f"WRITE_BEHIND → Escrita {write_id} em '{table_name}' movida para a fila morta: {reason}")
+
+    @staticmethod
+    def _dedupe_key(table_name: str, payload: dict, on_conflict: str | None) -> str:
+        """
+        <docstrings> Monta a chave de coalescência a partir das colunas de conflito.
+        """
+        keys = [k.strip() for k in (on_conflict or "").split(",") if k.strip()]
+        if not keys or not all(k in payload for k in keys):
+            return f"{table_name}:{fastjson.dumps(payload, default=str, sort_keys=True)}"
+        return f"{table_name}:{fastjson.dumps([payload[k] for k in keys], default=str)}"
+
+
+# 🌍 INSTÂNCIA ÚNICA DO PROCESSO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_write_queue() -> WriteBehindQueue:
+    """
+    <docstrings> Cria ou recupera a fila do processo. Escritas pendentes de execuções anteriores são retomadas.
+
+    Returns:
+        WriteBehindQueue: Fila compartilhada por todas as sessões.
+    """
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = WriteBehindQueue(QUEUE_PATH)
+            _queue._ensure_worker()
+        return _queue
+
+
+def enqueue_upsert(table_name: str, payload: dict, on_conflict: str | None) -> bool:
+    """
+    <docstrings> Grava de forma assíncrona quando habilitado, ou síncrona como fallback.
+
+    Args:
+        table_name (str): Tabela de destino.
+        payload (dict): Registro a inserir ou atualizar.
+        on_conflict (str | None): Colunas da chave de conflito.
+
+    Calls:
+        get_write_queue().enqueue(): Persiste a escrita na fila | definida neste módulo.
+        upsert_record(): Upsert síncrono | definida em services.backend.py.
+
+    Returns:
+        bool: True se a escrita foi aceita (enfileirada ou gravada).
+    """
+    if WRITE_BEHIND_ENABLED:
+        try:
+            get_write_queue().enqueue(table_name, payload, on_conflict)
+            return True
+        except Exception:
+            logger.exception("WRITE_BEHIND → Falha ao enfileirar; gravando de forma síncrona")
+
+    return bool(upsert_record(table_name=table_name, payload=payload, on_conflict=on_conflict, returning=True))
+
+
+def overlay_pending(rows: list[dict], table_name: str, filters: dict, keys: list[str]) -> list[dict]:
+    """
+    <docstrings> Aplica as escritas pendentes aos registros lidos, se a fila estiver habilitada.
+    """
+    if not WRITE_BEHIND_ENABLED:
+        return rows
+    try:
+        return get_write_queue().overlay(rows, table_name, filters, keys)
+    except Exception:
+        logger.exception("WRITE_BEHIND → Falha ao aplicar escritas pendentes")
+        return rows
+
+
+def overlay_pending_pages(pages, table_name: str, filters: dict, keys: list[str]):
+    """
+    <docstrings> Versão em fluxo de overlay_pending: aplica as escritas pendentes a páginas lidas sob demanda.
+
+    Cada pendência substitui o registro correspondente na página em que ele aparece; as que não casarem com
+    nenhum registro lido são produzidas numa página final. Só as pendências ficam em memória, não as páginas.
+
+    Args:
+        pages (Iterable[list[dict]]): Páginas lidas do backend (ex.: iter_records(..., pages=True)).
+        table_name (str): Tabela lida.
+        filters (dict): Filtros usados na leitura.
+        keys (list[str]): Colunas da chave de conflito, usadas para casar registros.
+
+    Yields:
+        list[dict]: Páginas com as pendências aplicadas.
+    """
+    pending: dict[tuple, dict] = {}
+    if WRITE_BEHIND_ENABLED:
+        try:
+            for payload in get_write_queue().pending(table_name, filters):
+                key = tuple(payload.get(k) for k in keys)
+                pending[key] = {**pending.get(key, {}), **payload}
+        except Exception:
+            logger.exception("WRITE_BEHIND → Falha ao aplicar escritas pendentes")
+
+    for page in pages:
+        if pending:
+            page = [
+                {**row, **pending.pop(key)} if (key := tuple(row.get(k) for k in keys)) in pending else row
+                for row in page
+            ]
+        yield page
+
+    if pending:
+        yield list(pending.values())
+
+
+def drain_session_writes(timeout: float = DRAIN_TIMEOUT) -> int:
+    """
+    <docstrings> Envia as escritas pendentes da sessão atual antes do logout.
+
+    Returns:
+        int: Número de escritas que não puderam ser enviadas (0 com a fila desligada).
+    """
+    if not WRITE_BEHIND_ENABLED:
+        return 0
+    try:
+        return get_write_queue().drain(current_session_id(), timeout)
+    except Exception:
+        logger.exception("WRITE_BEHIND → Falha ao drenar as escritas da sessão")
+        return 0
+
+
+def get_dead_writes(session_id: str | None = None) -> list[dict]:
+    """
+    <docstrings> Retorna as escritas mortas de uma sessão (ou de todas, com None), para aviso ou inspeção.
+    """
+    if not WRITE_BEHIND_ENABLED:
+        return []
+    try:
+        return get_write_queue().dead_writes(session_id)
+    except Exception:
+        logger.exception("WRITE_BEHIND → Falha ao ler a fila morta")
+        return []
+
+
+def session_dead_writes() -> list[dict]:
+    """
+    <docstrings> Retorna as escritas mortas da sessão atual.
+
+    Chamada a cada rerun pela sidebar: só consulta o SQLite se a sessão já teve alguma escrita movida para a fila morta.
+    """
+    if not WRITE_BEHIND_ENABLED:
+        return []
+    session_id = current_session_id()
+    try:
+        if not get_write_queue().has_dead(session_id):
+            return []
+    except Exception:
+        logger.exception("WRITE_BEHIND → Falha ao ler a fila morta")
+        return []
+    return get_dead_writes(session_id)
+
+
+def get_queue_metrics() -> dict:
+    """
+    <docstrings> Retorna as métricas da fila (depth, dead, flushed, retries, latências).
+    """
+    return get_write_queue().metrics()
@@ -0,0 +1,33 @@
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import os
+import sys
+
+from pathlib import Path
+
+# Os testes rodam contra o backend em memória (services.fake_backend), sem credenciais nem rede.
+# A fila de escrita global fica desligada: os testes dela criam filas próprias em diretórios temporários.
+os.environ.setdefault("ABAETE_BACKEND", "fake")
+os.environ.setdefault("ABAETE_WRITE_BEHIND", "false")
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+
+# 🧪 FIXTURES ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def store():
+    """
+    <docstrings> Armazenamento do backend falso e cache global vazios antes e depois de cada teste.
+    """
+    from services import backend
+    from services.fake_backend import get_fake_store
+
+    fake = get_fake_store()
+    fake.reset()
+    backend._global_cache.clear()
+    yield fake
+    fake.reset()
+    backend._global_cache.clear()
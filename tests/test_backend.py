@@ -0,0 +1,157 @@
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import time
+import threading
+
+from services import backend
+from services.backend import (
+    FETCH_FAILED, RecordCache, SingleFlight, count_records, exists, fetch_records, invalidate_table,
+    iter_records, upsert_record, upsert_records
+)
+from utils.metrics import db_metrics
+
+
+# 🗃️ CACHE DE LEITURA E INVALIDAÇÃO POR GERAÇÃO ──────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def test_global_cache_answers_repeated_fetch_and_counts_hit(store):
+    store.seed({"goals": [{"id": "g1", "link_id": "L"}]})
+    hits_before = db_metrics.cache_hits().get("goals", 0)
+
+    first = fetch_records("goals", {"link_id": "L"}, cache="global")
+    second = fetch_records("goals", {"link_id": "L"}, cache="global")
+
+    assert first == second == [{"id": "g1", "link_id": "L"}]
+    assert db_metrics.cache_hits()["goals"] == hits_before + 1
+
+
+def test_upsert_invalidates_cached_fetch(store):
+    store.seed({"goals": [{"id": "g1", "link_id": "L"}]})
+    assert len(fetch_records("goals", {"link_id": "L"}, cache="global")) == 1
+
+    upsert_record("goals", {"id": "g2", "link_id": "L"}, on_conflict="id")
+
+    assert {r["id"] for r in fetch_records("goals", {"link_id": "L"}, cache="global")} == {"g1", "g2"}
+
+
+def test_entry_read_before_a_concurrent_write_is_not_served():
+    cache = RecordCache(ttl=60, maxsize=8)
+    key = ("generation_test", (), "*")
+
+    # A busca captura a geração antes de ler; um upsert concorrente a incrementa antes do set.
+    generation = backend._table_generation("generation_test")
+    invalidate_table("generation_test")
+    cache.set(key, "generation_test", generation, ["stale"])
+
+    assert cache.get(key, "generation_test") is backend._MISS
+
+
+def test_record_cache_evicts_least_recently_used():
+    cache = RecordCache(ttl=60, maxsize=2)
+    generation = backend._table_generation("lru_test")
+    for name in ("a", "b"):
+        cache.set((name,), "lru_test", generation, name)
+
+    cache.get(("a",), "lru_test")
+    cache.set(("c",), "lru_test", generation, "c")
+
+    assert cache.get(("b",), "lru_test") is backend._MISS
+    assert cache.get(("a",), "lru_test") == "a"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_failed_fetch_is_not_cached_and_strict_reports_failure(store, monkeypatch):
+    store.seed({"goals": [{"id": "g1"}]})
+
+    def down():
+        raise RuntimeError("backend fora do ar")
+
+    monkeypatch.setattr(backend, "get_client", down)
+    assert fetch_records("goals", cache="global") == []
+    assert fetch_records("goals", cache="global", strict=True) is FETCH_FAILED
+    assert fetch_records("goals", single=True, cache=False) == {}
+
+    monkeypatch.undo()
+    assert fetch_records("goals", cache="global") == [{"id": "g1"}]
+
+
+# 📜 PAGINAÇÃO POR CHAVE (KEYSET) E CONTAGEM ─────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def test_keyset_pagination_reads_each_row_once_with_repeated_and_null_order_values(store):
+    dates = ["2026-01-01", "2026-01-01", "2026-01-02", None, 'com "aspas", vírgula']
+    rows = [{"id": f"r{i:02d}", "link_id": "L", "date": dates[i % len(dates)]} for i in range(23)]
+    store.seed({"scale_progress": rows})
+
+    read = [r["id"] for r in iter_records("scale_progress", {"link_id": "L"}, order_by="date", key="id", page_size=4)]
+
+    # Ordem esperada: data crescente, desempate pelo id, nulos por último.
+    expected = sorted(rows, key=lambda r: (r["date"] is None, r["date"] or "", r["id"]))
+    assert read == [r["id"] for r in expected]
+
+
+def test_iter_records_yields_pages(store):
+    store.seed({"goals": [{"id": f"g{i:02d}"} for i in range(10)]})
+
+    pages = list(iter_records("goals", page_size=4, pages=True))
+
+    assert [len(p) for p in pages] == [4, 4, 2]
+
+
+def test_count_and_exists(store):
+    store.seed({"scales": [{"id": "s1", "status": "active"}, {"id": "s2", "status": "done"}]})
+
+    assert count_records("scales", {"status": "active"}) == 1
+    assert exists("scales", {"status": "done"}) is True
+    assert exists("scales", {"status": "archived"}) is False
+
+
+def test_upsert_records_reports_chunk_offsets(store):
+    payloads = [{"id": f"x{i}"} for i in range(5)]
+
+    reports = upsert_records("bulk_test", payloads, on_conflict="id", returning=False, batch_size=2)
+
+    assert [(r["start"], r["end"]) for r in reports] == [(0, 2), (2, 4), (4, 5)]
+    assert all(r["ok"] for r in reports)
+    assert len(store.tables["bulk_test"]) == 5
+
+
+# 🛫 COALESCÊNCIA DE BUSCAS (SINGLE-FLIGHT) ──────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def test_single_flight_shares_one_call_between_concurrent_callers():
+    flight = SingleFlight(wait_timeout=5)
+    calls = []
+    barrier = threading.Barrier(4)
+    results = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return ["linha"]
+
+    def worker():
+        barrier.wait()
+        results.append(flight.do(("catalogo",), fetch))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert results == [["linha"]] * 4
+    assert flight.stats()["shared"] == 3
+
+
+def test_single_flight_follower_stops_waiting_for_a_stuck_leader():
+    flight = SingleFlight(wait_timeout=0.05)
+    release = threading.Event()
+    leader = threading.Thread(target=flight.do, args=(("catalogo",), lambda: release.wait(2)))
+    leader.start()
+    time.sleep(0.02)
+
+    try:
+        assert flight.do(("catalogo",), lambda: "direto") == "direto"
+        assert flight.stats()["timeouts"] == 1
+    finally:
+        release.set()
+        leader.join()
@@ -0,0 +1,54 @@
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import dataclasses
+
+import pytest
+
+from services.backend import fetch_records
+from services.models import Goal, to_dicts
+
+
+# 🧭 INTERFACE DE LEITURA COMPATÍVEL COM DICT ───────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def test_record_reads_like_the_row_it_was_decoded_from():
+    row = {"id": "g1", "goal": None, "link_id": "L", "custom": 7}
+    goal = Goal.from_row(row)
+
+    assert dict(goal) == {**goal} == goal.to_dict() == row
+    assert len(goal) == len(row)
+    assert list(goal) == list(goal.keys()) == ["id", "link_id", "goal", "custom"]
+    assert goal.items() == [(k, row[k]) for k in goal.keys()]
+
+
+def test_stored_null_is_present_and_returned_as_none():
+    goal = Goal.from_row({"id": "g1", "goal": None})
+
+    assert "goal" in goal
+    assert goal.get("goal", "padrão") is None
+    assert goal["goal"] is None
+
+
+def test_column_missing_from_the_row_behaves_like_a_missing_key():
+    goal = Goal.from_row({"id": "g1"})
+
+    assert "timeframe" not in goal
+    assert goal.get("timeframe", "padrão") == "padrão"
+    with pytest.raises(KeyError):
+        goal["timeframe"]
+
+
+def test_records_are_immutable():
+    goal = Goal.from_row({"id": "g1"})
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        goal.id = "g2"
+    assert goal.replace(goal="nova").get("goal") == "nova"
+
+
+def test_fetch_with_model_decodes_and_to_dicts_round_trips(store):
+    store.seed({"goals": [{"id": "g1", "link_id": "L", "goal": "Caminhar"}]})
+
+    goals = fetch_records("goals", {"link_id": "L"}, model=Goal, cache=False)
+
+    assert isinstance(goals[0], Goal)
+    assert to_dicts(goals) == [{"id": "g1", "link_id": "L", "goal": "Caminhar"}]
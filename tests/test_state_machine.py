@@ -0,0 +1,186 @@
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import uuid
+
+import pytest
+import streamlit as st
+
+from streamlit.testing.v1 import AppTest
+from frameworks.sm import StateMachine, selector
+
+
+# 🧪 FIXTURES ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def machine():
+    """
+    <docstrings> Máquina com chave única, descartada ao final do teste.
+    """
+    m = StateMachine(f"test_{uuid.uuid4().hex}", "start")
+    yield m
+    m.teardown()
+
+
+@selector("progress__{goal_id}")
+def _total(progress, goal_id):
+    return len(progress or [])
+
+
+# 📏 NAMESPACES LIMITADOS (LRU) ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def test_bounded_namespace_evicts_least_recently_used_entry(machine):
+    machine.limit_namespace("progress", max_items=2)
+    machine.set_variable("progress__a", [1])
+    machine.set_variable("progress__a__idx", 3)
+    machine.set_variable("progress__b", [2])
+
+    machine.get_variable("progress__a")
+    machine.set_variable("progress__c", [3])
+
+    assert machine.get_variable("progress__b") is None
+    assert machine.get_variable("progress__a") == [1]
+    assert machine.get_variable("progress__a__idx") == 3
+    assert machine.namespace_stats()["progress"]["evictions"] == 1
+
+
+def test_bounded_namespace_drops_sub_keys_with_their_entry(machine):
+    machine.limit_namespace("progress", max_items=1)
+    machine.set_variable("progress__a", [1])
+    machine.set_variable("progress__a__idx", 3)
+
+    machine.set_variable("progress__b", [2])
+
+    assert machine.get_variable("progress__a__idx") is None
+
+
+def test_bounded_namespace_respects_byte_budget_but_keeps_newest_entry(machine):
+    machine.limit_namespace("progress", max_bytes=2_000)
+    machine.set_variable("progress__a", "x" * 1_500)
+    machine.set_variable("progress__b", "y" * 5_000)
+
+    assert machine.get_variable("progress__a") is None
+    assert machine.get_variable("progress__b") == "y" * 5_000
+
+
+def test_unbounded_namespaces_are_not_affected(machine):
+    machine.limit_namespace("progress", max_items=1)
+    machine.set_variable("form__a__resp", {"q1": 2})
+    for name in "abc":
+        machine.set_variable(f"progress__{name}", [name])
+
+    assert machine.get_variable("form__a__resp") == {"q1": 2}
+
+
+# 🧮 SELETORES MEMORIZADOS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def test_selector_recomputes_only_when_input_changes(machine):
+    machine.set_variable("progress__a", [1, 2])
+
+    first = _total(machine, goal_id="a")
+    machine.set_variable("progress__a", [1, 2])
+    assert _total(machine, goal_id="a") == first == 2
+
+    machine.set_variable("progress__a", [1, 2, 3])
+    assert _total(machine, goal_id="a") == 3
+
+
+def test_selector_memos_are_dropped_with_evicted_or_deleted_inputs(machine):
+    machine.limit_namespace("progress", max_items=2)
+    for name in "abc":
+        machine.set_variable(f"progress__{name}", [name])
+        _total(machine, goal_id=name)
+
+    memos = st.session_state[machine._memo_key]
+    assert sorted(key for _, ((_, key),) in memos) == ["b", "c"]
+
+    machine.delete_variable("progress__c")
+    assert sorted(key for _, ((_, key),) in memos) == ["b"]
+
+    machine.delete_variable("progress__")
+    assert not memos
+
+
+# 🔁 LOTES DE RERUN E CARREGAMENTO EM SEGUNDO PLANO ──────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def _transition_page():
+    import sys
+    sys.path.insert(0, ".")
+    import streamlit as st
+    from frameworks.sm import StateMachine
+
+    with StateMachine.batch("test_page"):
+        m = StateMachine("flow", "a")
+        st.write(f"state={m.current}")
+        if m.current == "a":
+            m.to("b")
+            st.write("after-transition")
+
+
+def test_transition_inside_batch_ends_the_run():
+    at = AppTest.from_function(_transition_page).run()
+
+    texts = [md.value for md in at.markdown]
+    assert "after-transition" not in texts
+    assert texts == ["state=b"]
+
+
+def _deferred_page():
+    import sys
+    sys.path.insert(0, ".")
+    import streamlit as st
+    from frameworks.sm import StateMachine, get_rerun_stats
+
+    with StateMachine.batch("test_page"):
+        first, second = StateMachine("first", True), StateMachine("second", True)
+        if first.current:
+            first.to(False, defer=True)
+        if second.current:
+            second.to(False, defer=True)
+        st.write("rendered")
+
+    st.session_state["stats"] = get_rerun_stats().get("test_page")
+
+
+def test_deferred_transitions_share_one_rerun():
+    at = AppTest.from_function(_deferred_page).run()
+
+    stats = at.session_state["stats"]
+    assert stats["last_reruns"] == 1
+    assert stats["coalesced"] == 1
+
+
+def _async_page():
+    import sys
+    sys.path.insert(0, ".")
+    import time
+    import streamlit as st
+    from frameworks.sm import StateMachine
+
+    def load(delay):
+        time.sleep(delay)
+        StateMachine("owner", "idle").set_variable("data", "loaded")
+
+    m = StateMachine("loader", "start")
+    m.init_async(load, st.session_state.get("delay", 0.05), timeout=st.session_state.get("timeout", 2.0))
+    st.write(f"state={m.current}")
+
+
+def test_init_async_outside_batch_waits_for_the_callback():
+    at = AppTest.from_function(_async_page).run()
+
+    assert at.markdown[0].value == "state=done"
+    assert at.session_state["__sm_vars__owner"].values["data"] == "loaded"
+
+
+def test_init_async_ignores_writes_from_a_timed_out_run():
+    import time
+
+    at = AppTest.from_function(_async_page)
+    at.session_state["delay"] = 0.5
+    at.session_state["timeout"] = 0.1
+    at.run()
+    assert at.markdown[0].value == "state=timeout"
+
+    time.sleep(0.6)
+    owner = at.session_state["__sm_vars__owner"] if "__sm_vars__owner" in at.session_state else None
+    assert owner is None or "data" not in owner.values
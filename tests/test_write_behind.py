@@ -0,0 +1,113 @@
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import pytest
+
+from services import write_behind
+from services.backend import session_scope
+from services.write_behind import WriteBehindQueue, overlay_pending_pages
+
+
+# 🧪 FIXTURES ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch, store):
+    """
+    <docstrings> Fila em um SQLite temporário, sem a thread de envio: os testes disparam os envios manualmente.
+    """
+    monkeypatch.setattr(WriteBehindQueue, "_ensure_worker", lambda self: None)
+    return WriteBehindQueue(tmp_path / "writes.db")
+
+
+def _progress(day: str, completed: bool) -> dict:
+    return {"goal_id": "g1", "link_id": "L", "date": day, "completed": completed}
+
+
+# 📥 COALESCÊNCIA E LEITURA DAS PENDÊNCIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def test_pending_writes_for_the_same_key_are_coalesced(queue):
+    queue.enqueue("goal_progress", _progress("2026-01-01", False), "goal_id,date")
+    queue.enqueue("goal_progress", _progress("2026-01-01", True), "goal_id,date")
+    queue.enqueue("goal_progress", _progress("2026-01-02", False), "goal_id,date")
+
+    pending = queue.pending("goal_progress", {"link_id": "L"})
+
+    assert [(p["date"], p["completed"]) for p in pending] == [("2026-01-01", True), ("2026-01-02", False)]
+    assert queue.metrics()["depth"] == 2
+
+
+def test_overlay_applies_pending_writes_to_read_rows(queue):
+    rows = [{"id": "p1", **_progress("2026-01-01", False)}]
+    queue.enqueue("goal_progress", _progress("2026-01-01", True), "goal_id,date")
+    queue.enqueue("goal_progress", _progress("2026-01-03", True), "goal_id,date")
+
+    merged = queue.overlay(rows, "goal_progress", {"link_id": "L"}, ["goal_id", "date"])
+
+    assert merged[0] == {"id": "p1", **_progress("2026-01-01", True)}
+    assert merged[1] == _progress("2026-01-03", True)
+
+
+def test_overlay_pending_pages_replaces_rows_in_place_and_appends_the_rest(queue, monkeypatch):
+    monkeypatch.setattr(write_behind, "WRITE_BEHIND_ENABLED", True)
+    monkeypatch.setattr(write_behind, "get_write_queue", lambda: queue)
+    queue.enqueue("goal_progress", _progress("2026-01-02", True), "goal_id,date")
+    queue.enqueue("goal_progress", _progress("2026-01-09", True), "goal_id,date")
+    pages = [[{"id": "p1", **_progress("2026-01-01", False)}], [{"id": "p2", **_progress("2026-01-02", False)}]]
+
+    result = list(overlay_pending_pages(iter(pages), "goal_progress", {"link_id": "L"}, ["goal_id", "date"]))
+
+    assert result[0] == pages[0]
+    assert result[1] == [{"id": "p2", **_progress("2026-01-02", True)}]
+    assert result[2] == [_progress("2026-01-09", True)]
+
+
+# 🔁 ENVIO E FILA MORTA ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def test_flush_sends_the_write_and_removes_it_from_the_queue(queue, store):
+    queue.enqueue("goal_progress", _progress("2026-01-01", True), "goal_id,date")
+
+    queue._flush_due()
+
+    assert store.tables["goal_progress"][0]["completed"] is True
+    assert queue.metrics()["depth"] == 0
+    assert queue.metrics()["flushed"] == 1
+
+
+def test_write_from_an_ended_session_goes_to_the_dead_queue(queue, store):
+    with session_scope("sessao-encerrada"):
+        queue.enqueue("goal_progress", _progress("2026-01-01", True), "goal_id,date")
+
+    queue._flush_due()
+
+    dead = queue.dead_writes("sessao-encerrada")
+    assert [d["payload"]["date"] for d in dead] == ["2026-01-01"]
+    assert dead[0]["last_error"] == "sessão de origem encerrada"
+    assert queue.has_dead("sessao-encerrada")
+    assert "goal_progress" not in store.tables
+
+
+def test_write_that_exhausts_its_attempts_goes_to_the_dead_queue(queue, monkeypatch):
+    monkeypatch.setattr(write_behind, "upsert_record", lambda **kwargs: None)
+    monkeypatch.setattr(write_behind, "MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(write_behind, "BASE_DELAY", 0.0)
+    queue.enqueue("goal_progress", _progress("2026-01-01", True), "goal_id,date")
+
+    for _ in range(3):
+        queue._flush_due()
+
+    assert queue.metrics()["depth"] == 0
+    assert queue.metrics()["retries"] == 2
+    assert queue.dead_writes()[0]["attempts"] == 3
+
+
+def test_drain_sends_pending_writes_and_buries_what_it_cannot_send(queue, monkeypatch, store):
+    queue.enqueue("goal_progress", _progress("2026-01-01", True), "goal_id,date")
+    session_id = write_behind.current_session_id()
+
+    assert queue.drain(session_id, timeout=1.0) == 0
+    assert len(store.tables["goal_progress"]) == 1
+
+    monkeypatch.setattr(write_behind, "upsert_record", lambda **kwargs: None)
+    queue.enqueue("goal_progress", _progress("2026-01-02", True), "goal_id,date")
+
+    assert queue.drain(session_id, timeout=0.2) == 1
+    assert queue.dead_writes(session_id)[0]["last_error"] == "sessão encerrada antes do envio"
@@ -0,0 +1,90 @@
+
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import os
+import logging
+import threading
+
+from concurrent.futures             import ThreadPoolExecutor, Future
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+
+# 👨‍💻 LOGGER ESPECÍFICO PARA O MÓDULO ATUAL ──────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+logger = logging.getLogger(__name__)
+
+
+# 🧵 POOL DE THREADS COMPARTILHADO PELO PROCESSO ──────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Número máximo de workers, configurável por variável de ambiente.
+MAX_WORKERS = int(os.getenv("ABAETE_MAX_WORKERS", "8"))
+
+# Executor único para todas as sessões do processo.
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="abaete-worker")
+
+# Número máximo de carregamentos em segundo plano (ex.: StateMachine.init_async) simultâneos.
+MAX_BACKGROUND_WORKERS = int(os.getenv("ABAETE_BACKGROUND_WORKERS", "4"))
+
+# Executor separado para carregamentos que, por sua vez, agendam buscas no _executor: evita que
+# workers ocupados aguardando subtarefas esgotem o pool compartilhado.
+_background_executor = ThreadPoolExecutor(max_workers=MAX_BACKGROUND_WORKERS, thread_name_prefix="abaete-background")
+
+
+# 🚀 FUNÇÃO PARA EXECUTAR TAREFAS EM SEGUNDO PLANO COM O CONTEXTO DA SESSÃO ──────────────────────────────────────────────────────────────────────────────
+
+def submit_with_context(fn, *args, **kwargs) -> Future:
+    """
+    <docstrings> Agenda uma função no pool de threads, propagando o contexto da sessão Streamlit atual.
+
+    Sem o contexto, a thread não consegue acessar o st.session_state da sessão que a criou.
+
+    Args:
+        fn (Callable): Função a executar.
+        *args: Argumentos posicionais da função.
+        **kwargs: Argumentos nomeados da função.
+
+    Calls:
+        _submit(): Anexa o contexto e agenda a execução no pool compartilhado | definida neste módulo.
+
+    Returns:
+        Future: Resultado futuro da função.
+    """
+
+    return _submit(_executor, fn, *args, **kwargs)
+
+
+# 🌙 FUNÇÃO PARA EXECUTAR CARREGAMENTOS LONGOS EM SEGUNDO PLANO ──────────────────────────────────────────────────────────────────────────────────────────
+
+def submit_background(fn, *args, **kwargs) -> Future:
+    """
+    <docstrings> Agenda um carregamento em segundo plano, com o contexto da sessão, no pool dedicado.
+
+    Use para tarefas que podem agendar outras no pool compartilhado (ex.: bootstrap_session), de modo
+    que aguardá-las não ocupe os workers de que elas dependem.
+
+    Args:
+        fn (Callable): Função a executar.
+        *args: Argumentos posicionais da função.
+        **kwargs: Argumentos nomeados da função.
+
+    Returns:
+        Future: Resultado futuro da função.
+    """
+    return _submit(_background_executor, fn, *args, **kwargs)
+
+
+def _submit(executor: ThreadPoolExecutor, fn, *args, **kwargs) -> Future:
+    """
+    <docstrings> Agenda fn no executor informado, anexando à thread o contexto da sessão atual.
+    """
+
+    # Captura o contexto na thread do script, antes de agendar.
+    ctx = get_script_run_ctx()
+
+    def run():
+        # Anexa o contexto da sessão à thread worker, se houver.
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args, **kwargs)
+
+    return executor.submit(run)
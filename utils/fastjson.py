@@ -0,0 +1,78 @@
+
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import json
+import logging
+
+
+# 👨‍💻 LOGGER ESPECÍFICO PARA O MÓDULO ATUAL ──────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+logger = logging.getLogger(__name__)
+
+
+# ⚡ SELEÇÃO DO DECODIFICADOR DISPONÍVEL ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Usa orjson ou msgspec, quando instalados; caso contrário, o módulo json da biblioteca padrão.
+try:
+    import orjson
+    BACKEND = "orjson"
+except ImportError:
+    orjson = None
+    try:
+        import msgspec
+        BACKEND = "msgspec"
+    except ImportError:
+        msgspec = None
+        BACKEND = "json"
+
+logger.debug(f"FASTJSON → Usando {BACKEND}")
+
+
+# 📥 DECODIFICAÇÃO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def loads(data: str | bytes):
+    """
+    <docstrings> Decodifica JSON com a implementação mais rápida disponível.
+
+    Args:
+        data (str | bytes): Documento JSON.
+
+    Returns:
+        any: Objeto Python decodificado.
+
+    Raises:
+        ValueError: Se o documento for inválido (json.JSONDecodeError, orjson.JSONDecodeError ou msgspec.DecodeError).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if BACKEND == "msgspec":
+        return msgspec.json.decode(data.encode("utf-8") if isinstance(data, str) else data)
+    return json.loads(data)
+
+
+# 📤 CODIFICAÇÃO ────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def dumpb(obj, default=None, sort_keys: bool = False) -> bytes:
+    """
+    <docstrings> Codifica um objeto em JSON (UTF-8) com a implementação mais rápida disponível.
+
+    Args:
+        obj (any): Objeto a codificar.
+        default (Callable | None): Conversão de tipos não suportados (ex.: str).
+        sort_keys (bool): Ordena as chaves (saída determinística).
+
+    Returns:
+        bytes: Documento JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    if BACKEND == "msgspec":
+        return msgspec.json.Encoder(enc_hook=default, order="sorted" if sort_keys else None).encode(obj)
+    return json.dumps(obj, default=default, sort_keys=sort_keys, ensure_ascii=False).encode("utf-8")
+
+
+def dumps(obj, default=None, sort_keys: bool = False) -> str:
+    """
+    <docstrings> Codifica um objeto em JSON e retorna texto (ver dumpb).
+    """
+    return dumpb(obj, default=default, sort_keys=sort_keys).decode("utf-8")
@@ -1,16 +1,33 @@
 
 # 📦 IMPORTAÇÕES NECESSÁRIAS ────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
+import os
+import logging
 import streamlit as st
 
 from frameworks.sm                  import StateMachine
 from utils.variables.session        import VerifyStates, LoadStates
+from utils.concurrency              import submit_with_context
+from services.backend               import fetch_records, call_rpc
+from services.models                import Link
 from services.professional_profile  import load_professional_profile
 from services.user_profile          import load_user_profile
 from services.available_scales      import load_available_scales
 from services.scales_progress       import load_scale_progress
 from services.links                 import load_links_by_role
 from components.onboarding          import render_onboarding_if_needed
+from components.skeleton            import render_skeleton
+
+
+# 👨‍💻 LOGGER ESPECÍFICO PARA O MÓDULO ATUAL ─────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+logger = logging.getLogger(__name__)
+
+
+# ⚙️ CONFIGURAÇÕES ────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Usa a função bootstrap_session do banco (uma requisição); se False ou indisponível, usa as buscas em paralelo.
+BOOTSTRAP_RPC = os.getenv("ABAETE_BOOTSTRAP_RPC", "true").lower() in ("1", "true", "yes")
 
 
 # 🚧 FUNÇÃO PARA VERIFICAR SE O USUÁRIO É UM PROFISSIONAL ─────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
@@ -45,18 +62,125 @@ def is_professional_user(auth_machine: StateMachine) -> bool:
     return professional_profile.get("professional_status") is True if professional_profile else False
 
 
+# 🚀 FUNÇÃO PARA CARREGAR O CONTEXTO DA SESSÃO DE UMA VEZ ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def bootstrap_session(user_id: str, auth_machine: StateMachine) -> None:
+    """
+    <docstrings> Carrega perfil do usuário, perfil profissional, papel e vínculos, e grava tudo de uma vez.
+
+    Usa a função bootstrap_session do banco, que responde tudo em uma única requisição. Se ela estiver
+    desligada (ABAETE_BOOTSTRAP_RPC) ou indisponível, faz as buscas em paralelo. As máquinas de papéis
+    e de vínculos são marcadas como concluídas, sem rerun, para não refazer as buscas.
+
+    Args:
+        user_id (str): UUID do usuário autenticado.
+        auth_machine (StateMachine): Máquina de autenticação onde os dados serão armazenados.
+
+    Calls:
+        _bootstrap_rpc(): Contexto em uma única requisição | definida neste módulo.
+        _bootstrap_parallel(): Contexto por buscas em paralelo | definida neste módulo.
+        auth_machine.set_variable(): Salva variáveis na máquina | instanciado por StateMachine.
+        StateMachine.to(): Marca as máquinas auxiliares como concluídas | definida em frameworks.sm.py.
+
+    Returns:
+        None.
+    """
+
+    # Tenta a requisição única; se falhar, recorre às buscas em paralelo.
+    context = (_bootstrap_rpc(user_id) if BOOTSTRAP_RPC else None) or _bootstrap_parallel(user_id)
+
+    # Grava todo o contexto na máquina de autenticação de uma vez.
+    auth_machine.set_variable("user_profile", context["user_profile"])
+    auth_machine.set_variable("professional_profile", context["professional_profile"])
+    auth_machine.set_variable("role", context["role"])
+    auth_machine.set_variable("links", context["links"])
+
+    # Marca as máquinas de papéis e de vínculos como concluídas, sem rerun.
+    StateMachine("role_machine", VerifyStates.VERIFY.value, enable_logging=True).to(VerifyStates.VERIFIED.value, rerun=False)
+    StateMachine("link_machine", LoadStates.LOAD.value, enable_logging=True).to(LoadStates.LOADED.value, rerun=False)
+
+    logger.debug(f"BOOTSTRAP → Contexto carregado ({context['role']}, {len(context['links'])} vínculo(s))")
+
+
+def _bootstrap_rpc(user_id: str) -> dict | None:
+    """
+    <docstrings> Carrega o contexto da sessão pela função bootstrap_session do banco, em uma única requisição.
+
+    Returns:
+        dict | None: {"user_profile", "professional_profile", "role", "links"}, ou None se a função falhar.
+    """
+    logger.debug(f"BOOTSTRAP → Carregando contexto da sessão de {user_id} via RPC")
+
+    context = call_rpc("bootstrap_session", {"p_user_id": user_id})
+    if not isinstance(context, dict):
+        logger.warning("BOOTSTRAP → RPC bootstrap_session indisponível; usando buscas em paralelo")
+        return None
+
+    return {
+        "user_profile":         context.get("user_profile") or None,
+        "professional_profile": context.get("professional_profile") or None,
+        "role":                 "professional" if context.get("role") == "professional" else "patient",
+        "links":                Link.decode(context.get("links") or []),
+    }
+
+
+def _bootstrap_parallel(user_id: str) -> dict:
+    """
+    <docstrings> Carrega o contexto da sessão com as buscas independentes em paralelo.
+
+    Como o papel do usuário só é conhecido após o perfil profissional, os vínculos são buscados
+    pelos dois papéis ao mesmo tempo e apenas o do papel resolvido é mantido.
+
+    Calls:
+        submit_with_context(): Agenda cada busca no pool de threads | definida em utils.concurrency.py.
+        fetch_records(): CRUD para buscar dados no Supabase | definida em services.backend.py.
+
+    Returns:
+        dict: {"user_profile", "professional_profile", "role", "links"}.
+    """
+    logger.debug(f"BOOTSTRAP → Carregando contexto da sessão de {user_id} em paralelo")
+
+    # Dispara as buscas independentes ao mesmo tempo.
+    futures = {
+        "user_profile":         submit_with_context(fetch_records, "user_profile", {"auth_user_id": user_id}, single=True),
+        "professional_profile": submit_with_context(fetch_records, "professional_profile", {"auth_user_id": user_id}, single=True),
+        "professional_id":      submit_with_context(fetch_records, "links", {"professional_id": user_id}, model=Link),
+        "patient_id":           submit_with_context(fetch_records, "links", {"patient_id": user_id}, model=Link),
+    }
+
+    # Aguarda todas as respostas.
+    results = {name: future.result() for name, future in futures.items()}
+
+    # Resolve o papel do usuário a partir do perfil profissional.
+    professional_profile = results["professional_profile"] or None
+    is_professional = bool(professional_profile) and professional_profile.get("professional_status") is True
+    role_field = "professional_id" if is_professional else "patient_id"
+
+    return {
+        "user_profile":         results["user_profile"] or None,
+        "professional_profile": professional_profile,
+        "role":                 "professional" if is_professional else "patient",
+        "links":                results[role_field],
+    }
+
+
 # 🧭 FUNÇÃO PARA CARREGAR CONTEXTO COMPLETO DA SESSÃO ────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
-def load_session_context(auth_machine: StateMachine) -> str:
+def load_session_context(auth_machine: StateMachine, parallel: bool = True) -> str:
     """
     <docstrings> Carrega os dados completos da sessão: user_profile, professional_profile e vínculos (se paciente).
     Define o papel ('professional' ou 'patient') e salva tudo na máquina de estados.
 
     Args:
         auth_machine (StateMachine): Máquina de estado contendo user_id.
+        parallel (bool, optional): Se True, carrega o contexto com bootstrap_session() em segundo plano,
+            exibindo um esqueleto da página enquanto aguarda. Se False, carrega cada parte em sequência. Default = True.
 
     Calls:
         auth_machine.get_variable(): Recupera user_id | instanciado por StateMachine.
+        profile_machine.init_async(): Executa bootstrap_session() em segundo plano | instanciado por StateMachine.
+        bootstrap_session(): Carrega o contexto (RPC ou buscas em paralelo) | definida neste módulo.
+        render_skeleton(): Interface provisória durante o carregamento | definida em components.skeleton.
         fetch_records(): CRUD para buscar dados no Supabase | definida em services.backend.py.
         auth_machine.set_variable(): Salva variáveis na máquina | instanciado por StateMachine.
         logger.debug(): Registro de logs para acompanhamento | instanciado por logger.
@@ -71,8 +195,28 @@ def load_session_context(auth_machine: StateMachine) -> str:
     # Recupera o UUID do usuário da máquina de autenticação.
     user_id = auth_machine.get_variable("user_id")
  
-    # Se houver UUID autenticado...
-    if user_id:
+    # Se houver UUID autenticado e o modo paralelo estiver ativo...
+    if user_id and parallel:
+        profile_machine.init_async(
+            bootstrap_session,                          # ⬅ Carrega perfil, perfil profissional e vínculos de uma vez.
+            user_id,                                    # ⬅ UUID do usuário autenticado (*args).
+            auth_machine,                               # ⬅ Máquina de autenticação (*args).
+            done_state = LoadStates.LOADED.value,       # ⬅ Desliga a flag da máquina de perfis de usuários.
+            loading_state = LoadStates.LOADING.value,   # ⬅ Estado enquanto o carregamento está em andamento.
+            error_state = LoadStates.ERROR.value,       # ⬅ Estado em caso de falha.
+            timeout_state = LoadStates.TIMEOUT.value,   # ⬅ Estado em caso de tempo limite excedido.
+            placeholder = render_skeleton               # ⬅ Esqueleto exibido enquanto aguarda.
+        )
+
+        # Se o carregamento falhou ou excedeu o tempo limite, oferece uma nova tentativa.
+        if profile_machine.current in (LoadStates.ERROR.value, LoadStates.TIMEOUT.value):
+            st.error(f"❌ Não foi possível carregar seus dados: {profile_machine.get_variable('async__error')}")
+            if st.button("Tentar novamente", use_container_width=True):
+                profile_machine.reset()
+            st.stop()
+
+    # Se houver UUID autenticado (modo sequencial)...
+    elif user_id:
         profile_machine.init_once(  
             load_user_profile,                    # ⬅ Carrega o perfil do usuário na máquina de autenticação.
             user_id,                              # ⬅ UUID do usuário autenticado (*args).
@@ -87,7 +231,10 @@ def load_session_context(auth_machine: StateMachine) -> str:
     user_profile = auth_machine.get_variable("user_profile")
 
     if not isinstance(user_profile, dict):
-        st.warning("⏳ Carregando perfil do usuário...")
+
+        # Durante o carregamento em segundo plano, o esqueleto já está desenhado.
+        if profile_machine.current != LoadStates.LOADING.value:
+            st.warning("⏳ Carregando perfil do usuário...")
         st.stop()
 
     # Desenha o formulário de boas vindas, se necessário.
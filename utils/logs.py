@@ -5,10 +5,14 @@ import sys
 import os
 import logging
 import functools
+import hashlib
 import time
 
-from pathlib    import Path
-from typing     import TypeVar, ParamSpec, Callable, Union
+from pathlib       import Path
+from typing        import TypeVar, ParamSpec, Callable, Union
+from utils.metrics import db_metrics, operation_label, table_label, measure_result, METRICS_BYTES
+from utils.metrics import start_run_ledger, current_run_ledger
+from utils.tracing import LazyPreview, preview, should_trace
 
 
 # 💻 FUNÇÃO PARA CONFIGURAR LOGS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
@@ -86,6 +90,9 @@ def log_page_entry(page_name: str):
     """
     <docstrings> Decorador para logar a entrada em uma página do app.
 
+    Também contabiliza as chamadas ao banco da execução: avisa quando o orçamento (ABAETE_DB_CALL_BUDGET)
+    é excedido ou quando uma mesma chamada se repete, e exibe um resumo na sidebar com LOCAL_DEBUG ativo.
+
     Args:
         page_name (str): Nome da página (ex: 'Página Inicial').
 
@@ -100,9 +107,19 @@ def log_page_entry(page_name: str):
 
             # Registra no log que a página foi acessada
             logger.info(f" 🛤️  Executando {page_name}.py")
-            
-             # Executa a função original, repassando todos os argumentos.
-            return func(*args, **kwargs)
+
+            # Inicia a contabilidade de chamadas ao banco desta execução.
+            ledger = start_run_ledger(page_name)
+
+            try:
+                # Executa a função original, repassando todos os argumentos.
+                result = func(*args, **kwargs)
+                _render_ledger_overlay(ledger)
+                return result
+
+            # Avalia o orçamento mesmo quando a execução é interrompida (st.stop, st.rerun).
+            finally:
+                _check_ledger(ledger)
         
         # Retorna a função wrapper para substituir a função original.
         return wrapper
@@ -111,11 +128,51 @@ def log_page_entry(page_name: str):
     return decorator
 
 
+def _check_ledger(ledger) -> None:
+    """
+    <docstrings> Avisa no log quando a execução excedeu o orçamento de chamadas ou repetiu chamadas idênticas.
+    """
+    if ledger is None:
+        return
+
+    summary = ledger.summary()
+    logger.debug(f"DB_BUDGET → {summary['page']}: {summary['calls']} chamada(s) em {summary['seconds']}s, {summary['cache_hits']} do cache")
+
+    if ledger.over_budget:
+        logger.warning(
+            f"DB_BUDGET → {summary['page']} fez {summary['calls']} chamadas ao banco "
+            f"(orçamento: {summary['budget']}): {summary['by_table']}"
+        )
+
+    for signature, repeats in summary["duplicates"].items():
+        logger.warning(f"DB_BUDGET → Chamada repetida {repeats}x em {summary['page']}: {signature[:300]}")
+
+
+def _render_ledger_overlay(ledger) -> None:
+    """
+    <docstrings> Exibe o resumo de chamadas ao banco na sidebar, apenas em modo de debug local.
+    """
+    if ledger is None or os.getenv("LOCAL_DEBUG", "false").lower() not in ("1", "true", "yes"):
+        return
+
+    import streamlit as st
+
+    summary = ledger.summary()
+    icon = "🔴" if ledger.over_budget or summary["duplicates"] else "🟢"
+    with st.sidebar.expander(f"{icon} Banco: {summary['calls']}/{summary['budget']} chamadas ({summary['seconds']}s)"):
+        st.json({"por_tabela": summary["by_table"], "cache": summary["cache_hits"], "repetidas": summary["duplicates"]})
+
+
 # 📒 DECORADOR PARA RASTREAR OPERAÇÕES DE BANCO DE DADOS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
 
 P = ParamSpec('P')
 R = TypeVar('R')
 
+# A detecção de chamadas repetidas roda em todos os ambientes com uma assinatura barata (função, tabela e hash
+# dos filtros e opções escalares). Em modo de debug local, a assinatura cobre todos os argumentos e traz um trecho
+# legível deles para o log.
+LEDGER_FULL_SIGNATURES = os.getenv("LOCAL_DEBUG", "false").lower() in ("1", "true", "yes")
+
 def track_db_operation(
     op_type: str,
     fallback: Union[Callable[P, R], R] = None
@@ -123,6 +180,9 @@ def track_db_operation(
     """
     <docstrings> Decorator tipado para rastrear operações de banco de dados (fetch/upsert), incluindo tempo de execução e erros.
 
+    Cada execução alimenta utils.metrics.db_metrics (latência, erros e linhas por tabela e operação; bytes só nas
+    chamadas rastreadas ou com ABAETE_METRICS_BYTES).
+
     Args:
         op_type (str): Tipo da operação ("FETCH" ou "UPSERT").
         fallback (Callable[P, R] | R, optional): Valor de retorno ou função de fallback em caso de exceção.
@@ -130,27 +190,82 @@ def track_db_operation(
     Calls:
         functools.wraps(): Preserva metadata da função decorada | built-in.
         time.perf_counter(): Timestamp de alta resolução para medir duração | instanciada manualmente.
-        logger.debug(): Registra mensagens de debug | instanciado por logger.
+        logger.debug(): Registra mensagens de debug, com argumentos e resultado redigidos e truncados | instanciado por logger.
+        should_trace(): Aplica a amostragem por tabela (ABAETE_TRACE_SAMPLING) | definida em utils.tracing.
         logger.exception(): Registra erros e stacktrace | instanciado por logger.
+        db_metrics.observe(): Registra a operação nas métricas do processo | definida em utils.metrics.
+        _record_call(): Registra a chamada na contabilidade da execução da página | definida neste módulo.
 
     Returns:
         Callable: Função decoradora que aplica o wrapper tipado.
 
     """
     
+    # Rótulo da operação nas métricas (ex.: "📤 FETCH" → "fetch").
+    operation = operation_label(op_type)
+
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             start = time.perf_counter()
-            logger.debug(f"{op_type} → Iniciando {func.__name__}() com args={args}, kwargs={kwargs}")
+            table = table_label(args, kwargs)
+
+            # Rastreia apenas com DEBUG ativo e conforme a amostragem da tabela; a formatação é adiada.
+            traced = logger.isEnabledFor(logging.DEBUG) and should_trace(table)
+            if traced:
+                logger.debug("%s → Iniciando %s() com args=%s, kwargs=%s", op_type, func.__name__, LazyPreview(args), LazyPreview(kwargs))
             try:
                 result: R = func(*args, **kwargs)
                 duration = time.perf_counter() - start
-                logger.debug(f"{op_type} → {func.__name__}() retornou {result} (tempo: {duration:.3f}s)")
+                if traced:
+                    logger.debug("%s → %s() retornou %s (tempo: %.3fs)", op_type, func.__name__, LazyPreview(result), duration)
+                # Contar linhas é barato; os bytes exigem reserializar o resultado e ficam para as chamadas rastreadas.
+                rows, size = measure_result(result, with_size=traced or METRICS_BYTES)
+                db_metrics.observe(table, operation, duration, rows=rows, size=size)
+                _record_call(operation, table, func.__name__, args, kwargs, duration)
                 return result
             except Exception:
+                db_metrics.observe(table, operation, time.perf_counter() - start, error=True)
+                _record_call(operation, table, func.__name__, args, kwargs, time.perf_counter() - start)
                 logger.exception(f"{op_type} → Erro em {func.__name__}()")
                 # Retorna o fallback, chamando se for callable
                 return fallback(*args, **kwargs) if callable(fallback) else fallback  # type: ignore
         return wrapper  # type: ignore
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+def _record_call(operation: str, table: str, func_name: str, args: tuple, kwargs: dict, duration: float) -> None:
+    """
+    <docstrings> Registra a chamada na contabilidade da execução atual da página, se houver.
+
+    A assinatura identifica chamadas repetidas na execução (ver LEDGER_FULL_SIGNATURES).
+    """
+    ledger = current_run_ledger()
+    if ledger is not None:
+        if LEDGER_FULL_SIGNATURES:
+            signature = _full_signature(func_name, args, kwargs)
+        else:
+            signature = _call_signature(func_name, table, args, kwargs)
+        ledger.record(operation, table, signature, duration)
+
+
+def _call_signature(func_name: str, table: str, args: tuple, kwargs: dict) -> str:
+    """
+    <docstrings> Identifica uma chamada pela tabela e pelo hash dos filtros e das opções escalares.
+
+    Ignora payloads e demais argumentos grandes (ex.: listas de upsert), de modo que o custo não cresce com eles.
+    """
+    filters = kwargs.get("filters")
+    if filters is None and len(args) > 1 and isinstance(args[1], dict):
+        filters = args[1]
+    options = sorted((k, v) for k, v in kwargs.items() if v is None or isinstance(v, (str, int, float, type)))
+    digest = hashlib.blake2b(repr((filters, options)).encode(), digest_size=6).hexdigest()
+    return f"{func_name}({table})#{digest}"
+
+
+def _full_signature(func_name: str, args: tuple, kwargs: dict) -> str:
+    """
+    <docstrings> Identifica uma chamada pelo hash dos argumentos completos, com um trecho legível para o log.
+    """
+    digest = hashlib.blake2b(repr((args, sorted(kwargs.items()))).encode(), digest_size=6).hexdigest()
+    return f"{func_name}#{digest} {preview(args, 120)}"
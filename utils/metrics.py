@@ -0,0 +1,387 @@
+
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import os
+import re
+import time
+import logging
+import threading
+
+from pathlib import Path
+from utils   import fastjson
+
+
+# 👨‍💻 LOGGER ESPECÍFICO PARA O MÓDULO ATUAL ──────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+logger = logging.getLogger(__name__)
+
+
+# ⚙️ CONFIGURAÇÕES DAS MÉTRICAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Limites superiores (s) dos buckets do histograma de latência.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Arquivo de exportação no formato texto do Prometheus (ex.: textfile collector do node_exporter).
+METRICS_FILE = os.getenv("ABAETE_METRICS_FILE")
+
+# Intervalo (s) entre gravações do arquivo de exportação.
+METRICS_INTERVAL = float(os.getenv("ABAETE_METRICS_INTERVAL", "15"))
+
+# Estima o tamanho em bytes de todas as respostas (reserializando o resultado). Desligado, o tamanho só é
+# estimado nas chamadas rastreadas pela amostragem de utils.tracing.
+METRICS_BYTES = os.getenv("ABAETE_METRICS_BYTES", "false").lower() in ("1", "true", "yes")
+
+
+# 📊 CLASSE DO REGISTRO DE MÉTRICAS DE BANCO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+class DBMetrics:
+    """
+    <docstrings> Métricas das operações de banco, rotuladas por tabela e operação, compartilhadas pelo processo.
+
+    Para cada par (tabela, operação) mantém um histograma de latência, contagem de chamadas e de erros,
+    linhas retornadas e bytes. Os bytes são uma estimativa (tamanho do resultado reserializado em JSON, não o
+    tamanho no fio) e só são medidos em parte das chamadas (ver METRICS_BYTES); `sized` conta quantas.
+    Leituras respondidas pelo cache de services.backend não chegam ao banco e são contadas à parte, por tabela.
+
+    """
+
+    def __init__(self):
+        """
+        <docstrings> Método construtor de classe.
+
+        """
+        self._series: dict[tuple[str, str], dict] = {}
+        self._cache_hits: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, table: str, operation: str, duration: float, rows: int = 0, size: int | None = None, error: bool = False) -> None:
+        """
+        <docstrings> Registra uma operação concluída (com sucesso ou erro).
+
+        Args:
+            table (str): Tabela acessada.
+            operation (str): Operação (ex.: "fetch", "upsert").
+            duration (float): Duração em segundos.
+            rows (int): Linhas retornadas.
+            size (int | None): Bytes estimados da resposta; None quando não medidos.
+            error (bool): Se a operação terminou em exceção.
+        """
+        with self._lock:
+            series = self._series.get((table, operation))
+            if series is None:
+                series = self._series[(table, operation)] = {
+                    "buckets": [0] * len(LATENCY_BUCKETS),
+                    "count": 0,
+                    "sum": 0.0,
+                    "errors": 0,
+                    "rows": 0,
+                    "bytes": 0,
+                    "sized": 0,
+                }
+
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if duration <= bound:
+                    series["buckets"][i] += 1
+
+            series["count"] += 1
+            series["sum"] += duration
+            series["errors"] += int(error)
+            series["rows"] += rows
+            if size is not None:
+                series["bytes"] += size
+                series["sized"] += 1
+
+    def observe_cache_hit(self, table: str) -> None:
+        """
+        <docstrings> Conta uma leitura respondida pelo cache, sem tocar nas séries de latência.
+        """
+        with self._lock:
+            self._cache_hits[table] = self._cache_hits.get(table, 0) + 1
+
+    def cache_hits(self) -> dict[str, int]:
+        """
+        <docstrings> Retorna uma cópia dos acertos de cache por tabela.
+        """
+        with self._lock:
+            return dict(self._cache_hits)
+
+    def snapshot(self) -> dict:
+        """
+        <docstrings> Retorna uma cópia das séries, indexada por (tabela, operação).
+        """
+        with self._lock:
+            return {key: {**s, "buckets": list(s["buckets"])} for key, s in self._series.items()}
+
+    def render_prometheus(self) -> str:
+        """
+        <docstrings> Formata as métricas no formato texto de exposição do Prometheus.
+
+        Returns:
+            str: Texto com as séries abaete_db_*.
+        """
+        series = self.snapshot()
+        lines = [
+            "# HELP abaete_db_duration_seconds Latência das operações de banco.",
+            "# TYPE abaete_db_duration_seconds histogram",
+        ]
+
+        for (table, operation), s in sorted(series.items()):
+            labels = f'table="{table}",operation="{operation}"'
+            for bound, total in zip(LATENCY_BUCKETS, s["buckets"]):
+                lines.append(f'abaete_db_duration_seconds_bucket{{{labels},le="{bound}"}} {total}')
+            lines.append(f'abaete_db_duration_seconds_bucket{{{labels},le="+Inf"}} {s["count"]}')
+            lines.append(f"abaete_db_duration_seconds_sum{{{labels}}} {s['sum']:.6f}")
+            lines.append(f"abaete_db_duration_seconds_count{{{labels}}} {s['count']}")
+
+        for name, field, help_text in (
+            ("abaete_db_errors_total", "errors", "Operações de banco que terminaram em exceção."),
+            ("abaete_db_rows_total", "rows", "Linhas retornadas pelas operações de banco."),
+            ("abaete_db_response_bytes_total", "bytes", "Bytes estimados (JSON reserializado) das respostas medidas."),
+            ("abaete_db_response_bytes_sized_total", "sized", "Operações de banco com tamanho de resposta medido."),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for (table, operation), s in sorted(series.items()):
+                lines.append(f'{name}{{table="{table}",operation="{operation}"}} {s[field]}')
+
+        lines.append("# HELP abaete_db_cache_hits_total Leituras respondidas pelo cache, sem chamada ao banco.")
+        lines.append("# TYPE abaete_db_cache_hits_total counter")
+        for table, hits in sorted(self.cache_hits().items()):
+            lines.append(f'abaete_db_cache_hits_total{{table="{table}"}} {hits}')
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """
+        <docstrings> Remove todas as séries.
+        """
+        with self._lock:
+            self._series.clear()
+            self._cache_hits.clear()
+
+
+# Registro único do processo.
+db_metrics = DBMetrics()
+
+
+# 🏷️ FUNÇÕES AUXILIARES DE ROTULAGEM ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def operation_label(op_type: str) -> str:
+    """
+    <docstrings> Converte o rótulo de log (ex.: "📦 BULK UPSERT") em um nome de operação (ex.: "bulk_upsert").
+    """
+    return re.sub(r"[^a-z0-9]+", "_", op_type.lower()).strip("_") or "unknown"
+
+
+def table_label(args: tuple, kwargs: dict) -> str:
+    """
+    <docstrings> Extrai o nome da tabela dos argumentos de uma operação de banco.
+    """
+    table = kwargs.get("table_name") or (args[0] if args and isinstance(args[0], str) else None)
+    return table or "unknown"
+
+
+def _json_default(value):
+    """
+    <docstrings> Serializa modelos de services.models (via to_dict) e demais objetos como texto.
+    """
+    return value.to_dict() if hasattr(value, "to_dict") else str(value)
+
+
+def measure_result(result, with_size: bool = METRICS_BYTES) -> tuple[int, int | None]:
+    """
+    <docstrings> Conta as linhas de um resultado de operação de banco e, se pedido, estima seus bytes.
+
+    A estimativa reserializa o resultado inteiro em JSON (custo proporcional à resposta), por isso é opcional.
+
+    Args:
+        result: Resultado da operação.
+        with_size (bool): Se deve estimar os bytes.
+
+    Returns:
+        tuple[int, int | None]: (linhas, bytes do resultado serializado em JSON ou None se não medido).
+    """
+    if isinstance(result, dict) and "data" in result:
+        data = result["data"]
+    else:
+        data = result
+
+    if isinstance(data, list):
+        rows = len(data)
+    else:
+        rows = 1 if data else 0
+
+    if not with_size:
+        return rows, None
+
+    try:
+        size = len(fastjson.dumpb(data, default=_json_default)) if data else 0
+    except (TypeError, ValueError):
+        size = None
+
+    return rows, size
+
+
+# 🧾 CONTABILIDADE DE CHAMADAS POR EXECUÇÃO DO SCRIPT ──────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Orçamento de chamadas ao banco por execução (rerun) de página.
+DB_CALL_BUDGET = int(os.getenv("ABAETE_DB_CALL_BUDGET", "25"))
+
+# Chave do registro da execução atual dentro do session_state.
+_LEDGER_KEY = "_db_call_ledger"
+
+
+class RunLedger:
+    """
+    <docstrings> Registro das chamadas ao banco feitas durante uma execução do script de uma página.
+
+    Chamadas idênticas (mesma operação e mesmos argumentos) repetidas na mesma execução indicam
+    buscas redundantes ou padrões N+1.
+
+    """
+
+    def __init__(self, page_name: str, budget: int = DB_CALL_BUDGET):
+        """
+        <docstrings> Método construtor de classe.
+
+        Args:
+            page_name (str): Página em execução.
+            budget (int): Número máximo de chamadas esperado por execução.
+
+        """
+        self.page_name = page_name
+        self.budget = budget
+        self.calls: list[tuple[str, str, float]] = []    # ⬅ (operação, tabela, duração)
+        self.signatures: dict[str, int] = {}             # ⬅ assinatura da chamada → repetições
+        self.cache_hits = 0                              # ⬅ leituras respondidas pelo cache (fora do orçamento)
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, table: str, signature: str | None, duration: float) -> None:
+        """
+        <docstrings> Registra uma chamada ao banco. Sem assinatura (None), a chamada não entra na detecção de repetições.
+        """
+        with self._lock:
+            self.calls.append((operation, table, duration))
+            if signature is not None:
+                self.signatures[signature] = self.signatures.get(signature, 0) + 1
+
+    def record_cache_hit(self) -> None:
+        """
+        <docstrings> Conta uma leitura respondida pelo cache, que não consome o orçamento.
+        """
+        with self._lock:
+            self.cache_hits += 1
+
+    @property
+    def over_budget(self) -> bool:
+        return len(self.calls) > self.budget
+
+    def duplicates(self) -> dict[str, int]:
+        """
+        <docstrings> Retorna as chamadas repetidas na execução e o número de repetições.
+        """
+        return {sig: n for sig, n in self.signatures.items() if n > 1}
+
+    def summary(self) -> dict:
+        """
+        <docstrings> Resume a execução: total de chamadas, tempo, chamadas por tabela e repetições.
+        """
+        by_table: dict[str, int] = {}
+        for operation, table, _ in self.calls:
+            by_table[f"{operation}:{table}"] = by_table.get(f"{operation}:{table}", 0) + 1
+        return {
+            "page": self.page_name,
+            "calls": len(self.calls),
+            "budget": self.budget,
+            "seconds": round(sum(d for _, _, d in self.calls), 3),
+            "by_table": by_table,
+            "cache_hits": self.cache_hits,
+            "duplicates": self.duplicates(),
+        }
+
+
+def _has_script_context() -> bool:
+    """
+    <docstrings> Indica se a thread atual executa (ou foi associada a) um script de sessão do Streamlit.
+    """
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        return get_script_run_ctx(suppress_warning=True) is not None
+    except Exception:
+        return False
+
+
+def start_run_ledger(page_name: str) -> RunLedger | None:
+    """
+    <docstrings> Inicia o registro de chamadas da execução atual da página.
+
+    Returns:
+        RunLedger | None: Registro criado, ou None quando não há sessão Streamlit ativa.
+    """
+    if not _has_script_context():
+        return None
+    try:
+        import streamlit as st
+        ledger = RunLedger(page_name)
+        st.session_state[_LEDGER_KEY] = ledger
+        return ledger
+    except Exception:
+        return None
+
+
+def current_run_ledger() -> RunLedger | None:
+    """
+    <docstrings> Retorna o registro da execução atual da sessão, se houver.
+
+    Threads sem contexto de script (ex.: envio da fila de escrita) não pertencem a nenhuma execução.
+    """
+    if not _has_script_context():
+        return None
+    try:
+        import streamlit as st
+        return st.session_state.get(_LEDGER_KEY)
+    except Exception:
+        return None
+
+
+def record_cache_hit(table: str) -> None:
+    """
+    <docstrings> Registra uma leitura respondida pelo cache nas métricas do processo e na execução atual.
+    """
+    db_metrics.observe_cache_hit(table)
+    ledger = current_run_ledger()
+    if ledger is not None:
+        ledger.record_cache_hit()
+
+
+# 📤 EXPORTAÇÃO PARA ARQUIVO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def write_metrics_file(path: str | Path) -> None:
+    """
+    <docstrings> Grava as métricas em arquivo de forma atômica (arquivo temporário + rename).
+
+    Args:
+        path (str | Path): Caminho do arquivo de exportação.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(db_metrics.render_prometheus(), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _export_loop(path: str) -> None:
+    """
+    <docstrings> Laço da thread de exportação: regrava o arquivo a cada METRICS_INTERVAL segundos.
+    """
+    while True:
+        try:
+            write_metrics_file(path)
+        except Exception:
+            logger.exception(f"METRICS → Falha ao gravar métricas em {path}")
+        time.sleep(METRICS_INTERVAL)
+
+
+# Inicia a exportação periódica quando um arquivo for configurado.
+if METRICS_FILE:
+    threading.Thread(target=_export_loop, args=(METRICS_FILE,), name="abaete-metrics", daemon=True).start()
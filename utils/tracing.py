@@ -0,0 +1,138 @@
+
+# 📦 IMPORTAÇÕES NECESSÁRIAS ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+import os
+import random
+
+
+# ⚙️ CONFIGURAÇÕES DO RASTREAMENTO ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+# Tamanho máximo (caracteres) de cada argumento ou resultado exibido no log.
+TRACE_MAX_CHARS = int(os.getenv("ABAETE_TRACE_MAX_CHARS", "2048"))
+
+# Campos cujo valor nunca é exibido no log.
+REDACTED_FIELDS = frozenset({"email", "disabilities", "password", "access_token", "refresh_token", "answers"})
+
+
+def _parse_sample_rates(raw: str) -> dict[str, float]:
+    """
+    <docstrings> Converte "*=0.1,goal_progress=1" em {"*": 0.1, "goal_progress": 1.0}.
+    """
+    rates = {}
+    for part in raw.split(","):
+        if "=" in part:
+            table, rate = part.split("=", 1)
+            try:
+                rates[table.strip()] = min(max(float(rate), 0.0), 1.0)
+            except ValueError:
+                continue
+    return rates
+
+
+# Taxa de amostragem por tabela ("*" = padrão para as demais).
+TRACE_SAMPLE_RATES = _parse_sample_rates(os.getenv("ABAETE_TRACE_SAMPLING", "*=1"))
+
+
+# 🎲 AMOSTRAGEM ─────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+def should_trace(table: str) -> bool:
+    """
+    <docstrings> Decide, pela taxa de amostragem da tabela, se a chamada será rastreada.
+    """
+    rate = TRACE_SAMPLE_RATES.get(table, TRACE_SAMPLE_RATES.get("*", 1.0))
+    return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+
+# ✂️ PRÉ-VISUALIZAÇÃO REDIGIDA E LIMITADA ──────────────────────────────────────────────────────────────────────────────────────────────────────────────────
+
+class _Budget:
+    """
+    <docstrings> Contador de caracteres restantes durante a montagem de uma pré-visualização.
+    """
+    __slots__ = ("left",)
+
+    def __init__(self, left: int):
+        self.left = left
+
+
+def _render(value, budget: _Budget, parts: list[str]) -> None:
+    """
+    <docstrings> Escreve a representação de value em parts, redigindo campos sensíveis e parando no limite.
+    """
+    if budget.left <= 0:
+        return
+
+    # Modelos de services.models são exibidos como dicts, para que a redação de campos se aplique.
+    if hasattr(value, "to_dict") and not isinstance(value, dict):
+        value = value.to_dict()
+
+    if isinstance(value, dict):
+        parts.append("{")
+        for i, (key, item) in enumerate(value.items()):
+            if budget.left <= 0:
+                parts.append(f"… +{len(value) - i} chaves")
+                break
+            parts.append(f"{', ' if i else ''}{key!r}: ")
+            budget.left -= len(str(key)) + 4
+            if key in REDACTED_FIELDS:
+                parts.append("'***'")
+                budget.left -= 5
+            else:
+                _render(item, budget, parts)
+        parts.append("}")
+        return
+
+    if isinstance(value, (list, tuple)):
+        open_, close = ("[", "]") if isinstance(value, list) else ("(", ")")
+        parts.append(open_)
+        for i, item in enumerate(value):
+            if budget.left <= 0:
+                parts.append(f"… +{len(value) - i} itens")
+                break
+            if i:
+                parts.append(", ")
+            _render(item, budget, parts)
+        if len(value) == 1 and isinstance(value, tuple):
+            parts.append(",")
+        parts.append(close)
+        return
+
+    text = repr(value)
+    if len(text) > budget.left:
+        text = text[:max(budget.left, 0)] + "…"
+    budget.left -= len(text)
+    parts.append(text)
+
+
+def preview(value, max_chars: int = TRACE_MAX_CHARS) -> str:
+    """
+    <docstrings> Representação textual de value com campos sensíveis redigidos e tamanho limitado.
+
+    Args:
+        value (any): Valor a representar (dicts e listas aninhados são percorridos só até o limite).
+        max_chars (int): Limite aproximado de caracteres.
+
+    Returns:
+        str: Representação redigida e truncada.
+    """
+    parts: list[str] = []
+    _render(value, _Budget(max_chars), parts)
+    return "".join(parts)
+
+
+class LazyPreview:
+    """
+    <docstrings> Adia a montagem da pré-visualização até o logging realmente formatar a mensagem.
+
+    Passado como argumento de `logger.debug("%s", LazyPreview(x))`, nada é formatado se o nível
+    DEBUG estiver desligado.
+
+    """
+    __slots__ = ("value", "max_chars")
+
+    def __init__(self, value, max_chars: int = TRACE_MAX_CHARS):
+        self.value = value
+        self.max_chars = max_chars
+
+    def __str__(self) -> str:
+        return preview(self.value, self.max_chars)
@@ -9,6 +9,8 @@ class LoadStates(Enum):
     LOAD = True
     LOADING = "loading"
     LOADED = False
+    ERROR = "error"
+    TIMEOUT = "timeout"
 
 
 class VerifyStates(Enum):